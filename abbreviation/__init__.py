@@ -5,16 +5,45 @@
 @contact: e.tekinalp@icloud.com
 """
 
-import string
-import logging
-
-logging.basicConfig(format='', level=logging.DEBUG)
+import sys
+from collections import OrderedDict
+from itertools import combinations, islice
+
+from abbreviation.cache import LRUCache
+from abbreviation.context import CallContext
+from abbreviation.resolver import Resolver
+from abbreviation.session import AbbreviationSession
+from abbreviation.stats import AbbreviationStats, default_timer
+from abbreviation.utility import (LOWERCASE_VOWELS, PUNCTUATION, Word,
+                                  lowest_bits, popcount)
 
 # Abbreviation constants
 UPPERCASE = 0
 LOWERCASE = 1
 CAPITALIZE = 2
 
+# Compiled special character patterns shared by all instances, keyed by
+# the included special characters
+_special_char_patterns = dict()
+
+# Engine behind the module level functions, created on first use
+_default_engine = None
+
+# Dict keeping the insertion order, plain dicts only do from Python 3.7 on
+_ordered_dict = dict if sys.version_info >= (3, 7) else OrderedDict
+
+# Smallest number of words whose chars are selected with NumPy at once
+_VECTOR_BATCH = 128
+
+# Public names of the submodules, imported on first access. Module level
+# __getattr__ needs Python 3.7, older versions import them explicitly,
+# for example from abbreviation.shard import abbreviate_sharded
+_lazy_names = {'abbreviate_batches': 'abbreviation.batch',
+               'AbbreviationRegistry': 'abbreviation.registry',
+               'AbbreviationSet': 'abbreviation.liveset',
+               'AsyncAbbreviator': 'abbreviation.aio',
+               'abbreviate_sharded': 'abbreviation.shard'}
+
 
 class Abbreviation(object):
 
@@ -35,7 +64,9 @@ class Abbreviation(object):
           Constants are supposed to be all uppercase according to pep8"""
 
     def __init__(self, include_special_char=None, exclude_abbreviation=None,
-                 output='dict'):
+                 output='dict', cache_size=0, max_candidates=16,
+                 stats=False, dedup='greedy', time_budget=None,
+                 candidate_budget=None, packed_keys=False, vectorize=False):
         """Initialize Abbreviation class.
 
         @param include_char <list> Include given items in computation
@@ -43,30 +74,153 @@ class Abbreviation(object):
                                            name: [abbreviations in diff length]
                                            {'Friday': ['FR', 'FRI', 'FRID']}
         @param output <str> Output a 'dict' or a 'list'
+        @param cache_size <int> Number of words whose abbreviation before
+                                deduplication is cached, 0 disables the
+                                cache. Every lookup of a cache holds its
+                                lock, so the cache is opt-in for workloads
+                                repeating words
+        @param max_candidates <int> Number of combinations examined for the
+                                    alternatives of a duplicated word, the
+                                    skipped ones included, None examines
+                                    all of them
+        @param stats <bool> Collect counters and stage timers of the calls
+        @param dedup <str> 'greedy' gives each duplicated word its first free
+                           candidate, 'matching' also moves earlier words
+                           to another candidate when that frees one for an
+                           unresolved word, see MatchingResolver
+        @param time_budget <float> Seconds the matching of one call may take
+                                   after the greedy pass, None is unlimited
+        @param candidate_budget <int> Number of candidates the matching of
+                                      one call may create, None is unlimited
+        @param packed_keys <bool> Index claimed abbreviations as packed ints
+                                  instead of strings, see PackedIndex.
+                                  Abbreviations differing in case only
+                                  are duplicates then. It only lowers
+                                  the peak memory of long streams and
+                                  sessions and slows every call down
+        @param vectorize <bool> Select the chars of the first choices of
+                                large calls at once with NumPy, see
+                                abbreviation.vectorized. Those calls do not
+                                use the cache
         """
         # args
         self._include_special_char = include_special_char
         self._exclude_abbreviation = exclude_abbreviation
+        self._exclusion, self._reserved = self._compile_exclusion()
         self._output = output
+        self._special_char = self._compile_special_char()
+        self._cache = LRUCache(cache_size) if cache_size else None
+        self._max_candidates = max_candidates
+        if dedup not in ('greedy', 'matching'):
+            raise ValueError("dedup: Use 'greedy' or 'matching'!")
+        # end if unknown dedup mode
+        self._dedup = dedup
+        self._time_budget = time_budget
+        self._candidate_budget = candidate_budget
+        self._packed_keys = packed_keys
+        self._vectorize = vectorize
+        if vectorize:
+            # Fail early if NumPy is missing
+            import abbreviation.vectorized
+        # end if select with NumPy
+        self._stats = None
+        self._stats_lock = None
+        if stats:
+            import threading
+            self._stats = AbbreviationStats()
+            self._stats_lock = threading.Lock()
+        # end if collect stats
     # end def __init__
 
-    def abbreviate(self, word, casemode=UPPERCASE, length=3):
-        """Call abbreviation algorithm and return data.
+    @property
+    def cache(self):
+        """Return the LRUCache of abbreviations before deduplication."""
+        return self._cache
+    # end def cache
+
+    @property
+    def stats(self):
+        """Return the AbbreviationStats of all calls, None if disabled.
+
+        The stats of the last call alone are in stats.last.
+        """
+        return self._stats
+    # end def stats
+
+    @property
+    def exclude_abbreviation(self):
+        """Return the dictionary of excluded abbreviations."""
+        return self._exclude_abbreviation
+    # end def exclude_abbreviation
+
+    @exclude_abbreviation.setter
+    def exclude_abbreviation(self, exclude_abbreviation):
+        """Set the dictionary of excluded abbreviations.
+
+        @param exclude_abbreviation <dict> Exclude given items in computation
+        """
+        self._exclude_abbreviation = exclude_abbreviation
+        self._exclusion, self._reserved = self._compile_exclusion()
+        self.invalidate_cache()
+    # end def exclude_abbreviation
+
+    def invalidate_cache(self):
+        """Drop all cached abbreviations.
+
+        Call this after changing anything the abbreviations depend on, the
+        exclude_abbreviation setter does it automatically.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        # end if cache enabled
+    # end def invalidate_cache
+
+    def abbreviate(self, word, casemode=UPPERCASE, length=3, resolver=None,
+                   all=False):
+        """Call abbreviation algorithm and return the abbreviation.
+
+        With all set, return the list of every possible abbreviation of the
+        word in priority order instead, see iter_abbreviations.
 
         @param word <str> string element
         @param casemode <const> casemode UPPERCASE: return uppercase letters
                                 casemode LOWERCASE: return lowercase letters
                                 casemode CAPITALIZE: return capitalized letters
         @param length <int> Length of the abbreviated letters, minimum is 2
+        @param resolver <Resolver> Collision index shared between calls
+        @param all <bool> Return all possible abbreviations as a list
         """
-        self._casemode = casemode
-        self._length = length
-        result = self._iterate_data(word)
-        if self._output == 'list':
-            result = [[key, value] for key, value in result.items()]
-        return result
+        call = self._context(casemode, length)
+        if call is None:
+            return None
+        # end if invalid length
+        if all:
+            return list(self.iter_abbreviations(word, casemode, length))
+        # end if list all abbreviations
+        result = self._iterate_data([word], call, resolver)
+        return list(result.values())[0]
+    # end def abbreviate
+
+    def iter_abbreviations(self, word, casemode=UPPERCASE, length=3):
+        """Yield every possible abbreviation of the word in priority order.
+
+        The first abbreviation is the one abbreviate returns without
+        duplicates. The following ones are created lazily, so a caller can
+        stop at the first abbreviation it accepts without building all of
+        them. Each abbreviation is yielded once.
+
+        @param word <str> string element
+        @param casemode <const> casemode UPPERCASE: return uppercase letters
+                                casemode LOWERCASE: return lowercase letters
+                                casemode CAPITALIZE: return capitalized letters
+        @param length <int> Length of the abbreviated letters
+        """
+        return self._ranked_abbreviations(self._check_word(word), length,
+                                          casemode)
+    # end def iter_abbreviations
 
-    def abbreviate_multiple(self, words, casemode=UPPERCASE, length=3):
+    def abbreviate_multiple(self, words, casemode=UPPERCASE, length=3,
+                            resolver=None):
         """Call abbreviation algorithm and return data.
 
         @param words <list> List of string elements
@@ -74,205 +228,614 @@ class Abbreviation(object):
                                 casemode LOWERCASE: return lowercase letters
                                 casemode CAPITALIZE: return capitalized letters
         @param length <int> Length of the abbreviated letters, minimum is 2
+        @param resolver <Resolver> Collision index shared between calls
         """
-        self._casemode = casemode
-        self._length = length
-        result = self._iterate_data(words)
+        call = self._context(casemode, length)
+        if call is None:
+            return None
+        # end if invalid length
+        result = self._iterate_data(words, call, resolver)
         if self._output == 'list':
             result = [[key, value] for key, value in result.items()]
         return result
+    # end def abbreviate_multiple
 
-    def _iterate_data(self, data, result=dict()):
-        """Iterate the data list.
+    def abbreviate_lengths(self, words, casemode=UPPERCASE,
+                           lengths=range(2, 9)):
+        """Call abbreviation algorithm for several lengths at once and
+        return a table of the abbreviations of each word.
 
-        @param data <list> List data of string elements
-        @param result <dict> Final resulting dictionary
+        Every word is normalized and its chars are classified once for all
+        lengths. Each length is deduplicated on its own in the order of the
+        words, so the table matches one abbreviate_multiple call per length.
+        Like there, a word with an excluded abbreviation keeps its original
+        spelling as key, if it has one for any of the lengths.
+
+        @param words <list> List of string elements
+        @param casemode <const> casemode UPPERCASE: return uppercase letters
+                                casemode LOWERCASE: return lowercase letters
+                                casemode CAPITALIZE: return capitalized letters
+        @param lengths <iterable> Lengths of the abbreviated letters
+        @return <dict> Words in input order as keys and a tuple of their
+                       abbreviations in the order of the lengths as values,
+                       an OrderedDict before Python 3.7
         """
-        for word in data:
-            if self._check_exclusion(word, self._exclude_abbreviation, result):
+        calls = [self._context(casemode, length) for length in lengths]
+        if None in calls:
+            return None
+        # end if invalid length
+        lengths = [call.length for call in calls]
+        stats = self._begin_stats()
+        start = default_timer()
+        keys = [(word, self._check_word(word)) for word in words]
+        middle = default_timer()
+        firsts = dict()
+        for _, key in keys:
+            if key not in firsts:
+                firsts[key] = self._abbreviate_lengths(key, lengths,
+                                                       casemode)
+            # end if classify new word
+        # end for select chars
+        if stats is not None:
+            stats.timers['normalization'] += middle - start
+            stats.timers['selection'] += default_timer() - middle
+        # end if collect stats
+        exclusion_hits = 0
+        columns = list()
+        for index, call in enumerate(calls):
+            call.stats = stats
+            result = _ordered_dict()
+            reserved = list()
+            for word, key in keys:
+                if self._check_exclusion(word, result, call):
+                    reserved.append(word)
+                else:
+                    result[key] = firsts[key][index]
+                # end if skip exclusion
+            # end for collect first choices
+            self._remove_duplicates(result, reserved, call)
+            exclusion_hits += len(reserved)
+            columns.append(result)
+        # end for deduplicate each length
+        table = _ordered_dict()
+        for word, key in keys:
+            excluded = [(word, length) in self._exclusion
+                        for length in lengths]
+            table[word if any(excluded) else key] = tuple(
+                column[word if skip else key]
+                for column, skip in zip(columns, excluded))
+        # end for build rows
+        if stats is not None:
+            self._end_stats(stats, len(keys), exclusion_hits)
+        # end if collect stats
+        if self._output == 'list':
+            table = [[key, value] for key, value in table.items()]
+        # end if output list
+        return table
+    # end def abbreviate_lengths
+
+    def abbreviate_stream(self, words, casemode=UPPERCASE, length=3,
+                          resolver=None):
+        """Yield a (word, abbreviation) pair as soon as each one is final.
+
+        The words are consumed lazily and deduplicated in arrival order
+        against every abbreviation yielded before, so memory is bounded by
+        the collision index instead of the output. Words without a free
+        candidate are yielded with their first choice. Yielded words never
+        move, so streams always deduplicate greedily.
+
+        @param words <iterable> Any iterable of string elements
+        @param casemode <const> casemode UPPERCASE: return uppercase letters
+                                casemode LOWERCASE: return lowercase letters
+                                casemode CAPITALIZE: return capitalized letters
+        @param length <int> Length of the abbreviated letters, minimum is 2
+        @param resolver <Resolver> Collision index shared between calls
+        """
+        call = self._context(casemode, length)
+        if call is None:
+            return
+        # end if invalid length
+        if resolver is None:
+            resolver = Resolver(call.candidates, index=self._packed_index())
+        # end if create resolver for this stream
+        resolver.candidates = call.candidates
+        resolver.reserved = self._reserved.get(length, dict())
+        excluded = dict()
+        for word in words:
+            if self._check_exclusion(word, excluded, call):
+                abbreviation = excluded.pop(word)
+                resolver.reserve(word, abbreviation)
+                yield word, abbreviation
                 continue
             # end if skip exclusion
-            word = self._check_word(word)
-            w = dict()
-            ln = self._length
-            if ln > len(word):
-                ln = len(word)
-            # end if length length
-            for i, c in enumerate(word):
-                w[i] = c
-            # end for dict key value
-            abb = self._iterate_word(w)
-            if len(abb) == ln:
-                result[word] = self._sort_word(abb)
-                result[word] = self._list_to_string(result[word])
-            elif len(abb) < ln:
-                result[word] = self._sort_word(self._increase_word(w, abb, ln))
-                result[word] = self._list_to_string(result[word])
-            else:
-                result[word] = self._sort_word(self._decrease_word(w, abb, ln))
-                result[word] = self._list_to_string(result[word])
-            # end if result key value
-        # end for iterate data
+            word, abbreviation = self._first_choice(word, call)
+            yield word, resolver.assign(word, abbreviation) or abbreviation
+        # end for iterate words
+    # end def abbreviate_stream
+
+    def _context(self, casemode, length):
+        """Return the context of a new call, print a warning and return
+        None if the length is lower than one.
+
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        """
+        if length < 1:
+            sys.stdout.write('Given length must be higher than 0.')
+            return None
+        # end if invalid length
+        return CallContext(self, casemode, length)
+    # end def _context
+
+    def _iterate_data(self, data, call, resolver=None):
+        """Iterate the data list.
 
-        self._remove_duplicates(result)
+        @param data <list> List data of string elements
+        @param call <CallContext> Context of the current call
+        @param resolver <Resolver> Collision index, a new one if None
+        """
+        stats = self._begin_stats(call)
+        result = _ordered_dict()
+        reserved = list()
+        if self._vectorize and len(data) >= _VECTOR_BATCH:
+            self._iterate_batch(data, result, reserved, call)
+        else:
+            for word in data:
+                if self._check_exclusion(word, result, call):
+                    reserved.append(word)
+                    continue
+                # end if skip exclusion
+                word, abbreviation = self._first_choice(word, call)
+                result[word] = abbreviation
+            # end for iterate data
+        # end if select chars of all words at once
+
+        self._remove_duplicates(result, reserved, call, resolver)
+        if stats is not None:
+            self._end_stats(stats, len(data), len(reserved))
+        # end if collect stats
         return result
     # end def _iterate_data
 
-    def _check_exclusion(self, word, exclusion, result, check=False):
-        """Check the word for special characters, remove and return result.
+    def _iterate_batch(self, data, result, reserved, call):
+        """Add the first choices of the data to the result like
+        _iterate_data, selecting the chars of all words at once.
 
-        @param word <str> word to check
-        @param result <dict> Final resulting dictionary
-        @param check <bool> Check length of given word, return true or false
+        @param data <list> List data of string elements
+        @param result <dict> Words and their first choices
+        @param reserved <list> Words with an excluded abbreviation
+        @param call <CallContext> Context of the current call
         """
-        if not exclusion:
+        from abbreviation.vectorized import first_choices
+        start = default_timer()
+        keys = list()
+        excluded = dict()
+        for word in data:
+            if self._check_exclusion(word, excluded, call):
+                reserved.append(word)
+                keys.append(word)
+            else:
+                keys.append(self._check_word(word))
+            # end if skip exclusion
+        # end for normalize words
+        middle = default_timer()
+        words = [key for key, word in zip(keys, data)
+                 if word not in excluded]
+        abbreviations = iter(first_choices(words, call.length,
+                                           call.casemode))
+        for key, word in zip(keys, data):
+            if word in excluded:
+                result[key] = excluded[word]
+                continue
+            # end if excluded abbreviation
+            abbreviation = next(abbreviations)
+            if abbreviation is None:
+                abbreviation = self._abbreviate_word(key, call)
+            # end if not vectorized
+            result[key] = abbreviation
+        # end for add first choices in order
+        if call.stats is not None:
+            call.stats.timers['normalization'] += middle - start
+            call.stats.timers['selection'] += default_timer() - middle
+        # end if time the stages
+    # end def _iterate_batch
+
+    def _begin_stats(self, call=None):
+        """Return new stats collecting the call, None if disabled.
+
+        @param call <CallContext> Context of the call to set the stats on
+        """
+        if self._stats is None:
             return None
-        # end if no exclusion given
-        if word in exclusion.keys():
-            for val in exclusion[word]:
-                if len(val) == self._length:
-                    result[word] = val
-                    check = True
-                    break
-                # end if add new abbreviation
+        # end if stats disabled
+        stats = AbbreviationStats()
+        stats.start()
+        if call is not None:
+            call.stats = stats
+        # end if collect stats of the call
+        return stats
+    # end def _begin_stats
+
+    def _end_stats(self, stats, words, exclusion_hits):
+        """Finish the stats of the current call and add them to the engine.
+
+        Concurrent calls collect their own stats, only adding them to the
+        engine is locked.
+
+        @param stats <AbbreviationStats> Stats of the current call
+        @param words <int> Number of words of the call
+        @param exclusion_hits <int> Number of words with an excluded
+                                    abbreviation
+        """
+        stats.counters['words'] += words
+        stats.counters['exclusion_hits'] += exclusion_hits
+        stats.stop()
+        with self._stats_lock:
+            self._stats.add(stats)
+            self._stats.last = stats
+        # end with add stats to the engine
+    # end def _end_stats
+
+    def _compile_exclusion(self):
+        """Index the excluded abbreviations and return the tables.
+
+        The first table maps (word, length) to the excluded abbreviation,
+        the second maps each length to the reserved abbreviations and their
+        words, which are avoided by all other words.
+        """
+        exclusion = dict()
+        reserved = dict()
+        for word, values in (self._exclude_abbreviation or dict()).items():
+            for val in values:
+                if (word, len(val)) in exclusion:
+                    continue
+                # end if keep first abbreviation of a length
+                exclusion[(word, len(val))] = val
+                reserved.setdefault(len(val), dict())[val] = word
             # end for iterate value in exclusion
-            if check:
-                return True
-            # end if skip item
-        # end if word in exclusion
-    # end def _check_exclusion
+        # end for iterate exclusion
+        return exclusion, reserved
+    # end def _compile_exclusion
 
-    def _check_word(self, word):
-        """Check the word for special characters, remove and return result.
+    def _check_exclusion(self, word, result, call):
+        """Add the excluded abbreviation of the word to the result and
+        return True, return False if there is none for the length.
 
         @param word <str> word to check
+        @param result <dict> Final resulting dictionary
+        @param call <CallContext> Context of the current call
+        """
+        abbreviation = self._exclusion.get((word, call.length))
+        if abbreviation is None:
+            return False
+        # end if no excluded abbreviation
+        result[word] = abbreviation
+        return True
+    # end def _check_exclusion
+
+    def _compile_special_char(self):
+        """Compile the special characters to split words at into a regex.
+
+        All punctuation except the included characters splits a word, so
+        _check_word only needs a single pass over each word. The pattern
+        of each set of included characters is compiled once and shared.
         """
-        chars = string.punctuation
+        key = tuple(sorted(self._include_special_char or ()))
+        if key in _special_char_patterns:
+            return _special_char_patterns[key]
+        # end if pattern compiled before
+        chars = PUNCTUATION
         if self._include_special_char:
             for ch in self._include_special_char:
                 if ch in chars:
-                    chars = '%s%s' % (chars.split(ch)[0], chars.split(ch)[1])
+                    chars = chars.replace(ch, '')
                 else:
                     msg = 'include_special_char: character not valid %s' % ch
                     raise ValueError(msg)
                 # end if remove character from specials
             # end for iterate include special characters
         # end if include special char initialized
-        for ch in chars:
-            if ch in word:
-                word = ''.join(w.capitalize() for w in word.split(ch))
-            # end if check special character
-        # end for iterate special characters
-        return word
+        pattern = None
+        if chars:
+            import re
+            pattern = re.compile('[%s]+' % re.escape(chars))
+        # end if any special character splits
+        _special_char_patterns[key] = pattern
+        return pattern
+    # end def _compile_special_char
+
+    def _check_word(self, word):
+        """Check the word for special characters, remove and return result.
+
+        @param word <str> word to check
+        """
+        if self._special_char is None:
+            return word
+        # end if nothing to split at
+        parts = self._special_char.split(word)
+        if len(parts) == 1:
+            return word
+        # end if no special character in word
+        return ''.join(w.capitalize() for w in parts)
     # end def _check_word
 
-    def _iterate_word(self, word):
-        """Iterate the given word and return it.
+    def _result_key(self, word, length):
+        """Return the key of the word in a result of the given length.
+
+        @param word <str> Word as given by the caller
+        @param length <int> Length of the abbreviated letters
+        """
+        if (word, length) in self._exclusion:
+            return word
+        # end if excluded words are kept as given
+        return self._check_word(word)
+    # end def _result_key
+
+    def _first_choice(self, word, call):
+        """Return the word without special characters and its abbreviation
+        before deduplication, cached by word, casemode and length.
 
-        @param word <dict> word to iterate
+        The special characters are fixed for each instance, so they are not
+        part of the cache key.
+
+        @param word <str> word to abbreviate
+        @param call <CallContext> Context of the current call
+        """
+        key = (word, call.casemode, call.length)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if call.stats is not None:
+                hit = 'cache_misses' if cached is None else 'cache_hits'
+                call.stats.counters[hit] += 1
+            # end if count cache lookup
+            if cached is not None:
+                return cached
+            # end if cache hit
+        # end if cache enabled
+        if call.stats is None:
+            normalized = self._check_word(word)
+            cached = (normalized, self._abbreviate_word(normalized, call))
+        else:
+            cached = self._timed_first_choice(word, call)
+        # end if time the stages
+        if self._cache is not None:
+            self._cache.put(key, cached)
+        # end if cache enabled
+        return cached
+    # end def _first_choice
+
+    def _timed_first_choice(self, word, call):
+        """Return the result of _first_choice without the cache and add the
+        time of its stages to the stats of the call.
+
+        @param word <str> word to abbreviate
+        @param call <CallContext> Context of the current call
+        """
+        start = default_timer()
+        normalized = self._check_word(word)
+        middle = default_timer()
+        abbreviation = self._abbreviate_word(normalized, call)
+        stats = call.stats
+        stats.timers['normalization'] += middle - start
+        stats.timers['selection'] += default_timer() - middle
+        return normalized, abbreviation
+    # end def _timed_first_choice
+
+    def _abbreviate_word(self, word, call):
+        """Select the chars of the given word and return the abbreviation.
+
+        @param word <str> word to abbreviate, special characters removed
+        @param call <CallContext> Context of the current call
         """
-        result = dict()
-        for w in word.items():
-            if not w[0]:
-                result[w[0]] = w[1]
-            # end if 0 index
-            if w[1].isupper():
-                result[w[0]] = w[1]
-            # end if isupper
-        # end for iterate word dict
+        w = Word(word)
+        ln = call.length
+        if ln > len(word):
+            ln = len(word)
+        # end if length length
+        w.mask = self._select_chars(self._rank_word(w, ln), ln)
+        return self._setup_case(w.convert_numerical_dict_to_string(),
+                                call.casemode)
+    # end def _abbreviate_word
+
+    def _classify_chars(self, word):
+        """Return the masks of the leading, the remaining and the vowel chars
+        of the given word, they do not depend on the length.
+
+        @param word <Word> word to classify
+        """
+        first = word.upper_mask()
+        if word.string:
+            first |= 1
+        # end if 0 index
+        rest = word.mask & ~first
+        vowels = word.char_mask(LOWERCASE_VOWELS) & rest
+        return first, rest, vowels
+    # end def _classify_chars
+
+    def _abbreviate_lengths(self, word, lengths, casemode):
+        """Return the abbreviations of the given word for all lengths.
+
+        @param word <str> word to abbreviate, special characters removed
+        @param lengths <list> Lengths of the abbreviations
+        @param casemode <const> Casemode of the abbreviations
+        """
+        w = Word(word)
+        classes = self._classify_chars(w)
+        result = list()
+        for length in lengths:
+            ln = min(length, len(word))
+            w.mask = self._select_chars(self._rank_word(w, ln, classes), ln)
+            abbreviation = w.convert_numerical_dict_to_string()
+            result.append(self._setup_case(abbreviation, casemode))
+        # end for iterate lengths
         return result
-    # end def _iterate_word
-
-    def _sort_word(self, word):
-        """Reorder the dictionary and return a list.
-
-        @param word <dict> dict to convert to list and sort
-        """
-        indices = word.keys()
-        indices.sort()
-        return [word[i] for i in indices]
-    # end def _sort_word
-
-    def _increase_word(self, word, abbreviation, length):
-        """Abbreviation is smaller than 3 characters, increase and return.
-
-        @param abbreviation <dict> abbreviated characters
-        @param word <dict> Word to apply the filter on
-        @param length <int> Length of the word
-        """
-        if len(abbreviation) == length:
-            return abbreviation
-        # end if recursion
-        for key in abbreviation.keys():
-            if key in word:
-                del(word[key])
-            # end if delete item
-        # end for iteration
-        res = self._add_char(self._filter_vowels(word, length), abbreviation)
-        return self._increase_word(word, res, length)
-    # end def _increase_word
-
-    def _filter_vowels(self, elements, length):
-        """Helper function to filter out all vowels characters of the
-        given word and return the result.
-
-        @param elements <dict> Word to apply the filter on
-        @param length <int> Length of the word
-        """
-        vowels = ('a', 'e', 'i', 'o', 'u')
-        for key in elements.keys():
-            if elements[key] in vowels:
-                if not len(elements) < length:
-                    del(elements[key])
-                # end if delete item
-            # end if check vowels
-        # end for iterate word keys
-        return elements
-    # end def _filter_vowels
-
-    def _add_char(self, elements, abbreviation):
-        """Based on the given abbreviation and word find the next char.
-
-        @param abbreviation <dict> abbreviated characters
-        @param elements <dict> Word to apply the filter on
-        """
-        for w in elements:
-            if len(abbreviation.keys()) > 1:
-                if abbreviation.keys()[1] > w > abbreviation.keys()[0]:
-                    abbreviation[w] = elements[w]
-                    break
-                else:
-                    abbreviation[w] = elements[w]
-                    break
-                # end if add to abbreviation
-            else:
-                if w > abbreviation.keys()[0]:
-                    abbreviation[w] = elements[w]
-                    break
-                # end if add to abbreviation
-            # end if length check
-        # end for iteration
-        return abbreviation
-    # end def _add_char
+    # end def _abbreviate_lengths
 
-    def _list_to_string(self, items):
-        """Convert a given list into a string, set casemode for each character.
+    def _rank_word(self, word, length, classes=None):
+        """Rank the chars of the given word and return them as masks.
 
-        @param items <list> List to convert to string
+        The first char and all uppercase chars rank highest, followed by
+        the remaining chars. Leading vowels of the remaining chars rank
+        lowest, as many as can be dropped while the abbreviation can
+        still be filled.
+
+        @param word <Word> word to rank
+        @param length <int> Length of the abbreviation
+        @param classes <tuple> Result of _classify_chars, computed if None
         """
-        return self._setup_case(''.join(item for item in items))
-    # end def _list_to_string
+        first, rest, vowels = classes or self._classify_chars(word)
+        drop = popcount(rest) - length + 1
+        vowels = lowest_bits(vowels, drop) if drop > 0 else 0
+        return (first, rest & ~vowels, vowels)
+    # end def _rank_word
+
+    def _select_chars(self, ranks, length):
+        """Select the first chars of the ranks in order and return the mask.
 
-    def _setup_case(self, word):
+        @param ranks <tuple> Masks of chars from highest to lowest rank
+        @param length <int> Length of the abbreviation
+        """
+        mask = 0
+        for rank in ranks:
+            missing = length - popcount(mask)
+            if not missing:
+                break
+            # end if abbreviation complete
+            mask |= lowest_bits(rank, missing)
+        # end for iterate ranks
+        return mask
+    # end def _select_chars
+
+    def _ranked_abbreviations(self, word, length, casemode, start=0,
+                              limit=None):
+        """Yield the abbreviations of the word in priority order.
+
+        The chars are ordered by rank and the combinations of that order
+        are walked lexicographically, so the first combination is the one
+        _select_chars picks and every following one gives up as few high
+        ranked chars as possible. If the word repeats a char, an
+        abbreviation is only yielded for its leftmost chars, so each one
+        is yielded once without remembering the previous ones.
+
+        @param word <str> word to abbreviate, special characters removed
+        @param length <int> Length of the abbreviation
+        @param casemode <const> Casemode of the abbreviations
+        @param start <int> Only yield abbreviations using a char at or after
+                           this index
+        @param limit <int> Number of combinations examined, the skipped
+                           ones included. None examines all of them
+        """
+        w = Word(word)
+        length = min(length, len(word))
+        order = list()
+        for rank in self._rank_word(w, length):
+            order.extend(w.copy(rank))
+        # end for order chars by rank
+        folded = word.lower()
+        repeated = len(set(folded)) < len(folded)
+        # ASCII case maps char by char, so the word is cased only once
+        cased = None
+        if casemode != CAPITALIZE and word and ord(max(word)) < 0x80:
+            cased = self._setup_case(word, casemode)
+        # end if case the whole word
+        first = None
+        for indices in islice(self._combinations(order, length, start),
+                              limit):
+            indices = sorted(indices)
+            if (repeated and first is not None and
+                    not self._is_leftmost(folded, indices)):
+                continue
+            # end if skip repeated chars
+            if cased is None:
+                abbreviation = self._setup_case(
+                    ''.join([word[i] for i in indices]), casemode)
+            else:
+                abbreviation = ''.join([cased[i] for i in indices])
+            # end if case each abbreviation
+            if repeated:
+                if first is None:
+                    first = abbreviation
+                elif abbreviation == first:
+                    continue
+                # end if skip first choice
+            # end if word repeats a char
+            yield abbreviation
+        # end for iterate combinations
+    # end def _ranked_abbreviations
+
+    def _combinations(self, order, length, start=0):
+        """Return the combinations of the ordered indices lexicographically.
+
+        With a start index only the combinations holding an index at or
+        after start are returned. Every combination of the shorter ones
+        completed with the last index holds it, so at most len(order)
+        combinations are filtered out for each returned one.
+
+        @param order <list> Indices of the chars in ranked order
+        @param length <int> Number of indices of each combination
+        @param start <int> Index of the differing chars, 0 uses all
+        """
+        if not start or not length:
+            return combinations(order, length)
+        # end if no differing chars
+        return (indices for indices in combinations(order, length)
+                if max(indices) >= start)
+    # end def _combinations
+
+    def _is_leftmost(self, word, indices):
+        """Return True if every index is the first occurrence of its char
+        after the previous index.
+
+        @param word <str> Case folded word
+        @param indices <list> Sorted indices of the abbreviation
+        """
+        previous = -1
+        for index in indices:
+            if word.find(word[index], previous + 1) != index:
+                return False
+            # end if earlier occurrence
+            previous = index
+        # end for iterate indices
+        return True
+    # end def _is_leftmost
+
+    def _candidates(self, word, abbreviation, start=0, call=None):
+        """Return the alternative abbreviations of a duplicated word.
+
+        @param word <str> word to abbreviate, special characters removed
+        @param abbreviation <str> First choice abbreviation of the word
+        @param start <int> Only use abbreviations with a char at or after
+                           this index, 0 uses all of them
+        @param call <CallContext> Context of the current call, the default
+                                  casemode and length if None
+        """
+        casemode, length = UPPERCASE, 3
+        if call is not None:
+            casemode, length = call.casemode, call.length
+        # end if use casemode and length of the call
+        limit = self._max_candidates
+        if limit is not None and not start:
+            limit += 1
+        # end if the first combination is the first choice
+        ranked = self._ranked_abbreviations(word, length, casemode, start,
+                                            limit)
+        if start:
+            return (c for c in ranked if c != abbreviation)
+        # end if first choice is not necessarily first
+        return islice(ranked, 1, None)
+    # end def _candidates
+
+    def _setup_case(self, word, casemode):
         """Setup the word to upper, lower or capitalized case.
 
         @param word <str> String to setup the upper, lower or capitalcase
+        @param casemode <const> Casemode to apply
         """
-        if self._casemode == UPPERCASE:
+        if casemode == UPPERCASE:
             return word.upper()
-        elif self._casemode == LOWERCASE:
+        elif casemode == LOWERCASE:
             return word.lower()
-        elif self._casemode == CAPITALIZE:
+        elif casemode == CAPITALIZE:
             return word.capitalize()
         else:
             msg = 'casemode: Use constant UPPERCASE, LOWERCASE or CAPITALIZE!'
@@ -280,156 +843,119 @@ class Abbreviation(object):
         # end if setup case
     # end def _setup_case
 
-    def _decrease_word(self, word, abbreviation, length):
-        """Abbreviation is bigger than 3 characters, decrease and return.
-
-        @param word <dict> dict to delete elements
-        @param abbreviation <dict> abbreviated characters
-        @param length <int> Length of the word
-        """
-        if len(abbreviation) == length:
-            return abbreviation
-        # end if recursion
-        for key in abbreviation.keys():
-            if key in word:
-                del(word[key])
-            # end if delete item
-        # end for iteration
-        result = self._subtract_char(abbreviation)
-        return self._decrease_word(result, word, length)
-    # end def _decrease_word
-
-    def _subtract_char(self, abbreviation):
-        """Based on the given abbreviation and word find the next char.
+    def _create_resolver(self, candidates, max_size=None):
+        """Return a new resolver of the dedup mode of the engine.
 
-        @param abbreviation <dict> abbreviated characters
+        @param candidates <function> Candidates of a duplicated word
+        @param max_size <int> Maximum number of claims, None keeps all
         """
-        del(abbreviation[max(abbreviation.keys())])
-        return abbreviation
-    # end def _subtract_char
+        index = self._packed_index() if max_size is None else None
+        if self._dedup == 'greedy':
+            return Resolver(candidates, max_size, index)
+        # end if greedy dedup
+        from abbreviation.matching import MatchingResolver
+        return MatchingResolver(candidates, max_size, index,
+                                time_budget=self._time_budget,
+                                candidate_budget=self._candidate_budget)
+    # end def _create_resolver
+
+    def _packed_index(self):
+        """Return a new PackedIndex if the engine packs keys, else None."""
+        if not self._packed_keys:
+            return None
+        # end if index strings
+        from abbreviation.packed import PackedIndex
+        return PackedIndex()
+    # end def _packed_index
 
-    def _remove_duplicates(self, result, rest=dict()):
+    def _remove_duplicates(self, result, reserved, call, resolver=None):
         """Remove duplicates from the given dictionary.
 
         @param result <dict> Storing all values mutating given dictionary
+        @param reserved <list> Words with an excluded abbreviation
+        @param call <CallContext> Context of the current call
+        @param resolver <Resolver> Collision index, a new one if None
         """
-        excess = set(result.values())
-        converted = self._convert_dict(result)
-        difference = self._allocate_dict_duplicates(converted, excess)
-        length = [s for s in range(self._length)][1:]
-        for value in difference.values():
-            letters = value.values()[0][1:]
-            for i in length:
-                if self._compare_to_dict(value, letters, result, i, rest):
-                    break
-                # end if added new element
-            # end for iterate length
-        # end for iterate dict values
-        for k, v in rest.items():
-            if v not in result.values():
-                result[k] = v
-                del(rest[k])
-            # end if update result and rest
-            if result[k] != v:
-                if result.values().count(result[k]) == 1:
-                    del(rest[k])
-                # end if delete from rest
-            # end if result not in value
-        # end for iterate rest items
-        if rest:
-            logging.debug('For %s names I could not create individual '
-                          'abbreviations: %s' % (len(rest), rest))
+        if resolver is None:
+            resolver = self._create_resolver(call.candidates)
+        # end if create resolver for this call
+        resolver.candidates = call.candidates
+        resolver.reserved = self._reserved.get(call.length, dict())
+        resolver.unresolved.clear()
+        stats = call.stats
+        if stats is None:
+            resolver.resolve(result, reserved)
+        else:
+            collisions, retries = resolver.collisions, resolver.retries
+            start = default_timer()
+            resolver.resolve(result, reserved)
+            stats.timers['dedup'] += default_timer() - start
+            stats.counters['collisions'] += resolver.collisions - collisions
+            stats.counters['retries'] += resolver.retries - retries
+            stats.counters['unresolved'] += len(resolver.unresolved)
+        # end if collect stats
+        if resolver.unresolved:
+            import logging
+            logging.getLogger(__name__).debug(
+                '%d names have no unique abbreviation',
+                len(resolver.unresolved))
         # end if logging report
     # end def _remove_duplicates
+# end class Abbreviation
 
-    def _convert_dict(self, elements, result=dict(), index=0):
-        """Convert key and values of given dictionary into value and create
-        an index number as a key. Mutate the given dictionary.
 
-        @param elements <dict> Storing all the abbreviations and nodenames
-        @param result <dict> Storing all values in a new dictionary
-        @param index <int> Unsigned integer to iterate the depth level
-        """
-        for key, value in elements.items():
-            result[index] = {value: key}
-            index += 1
-        # end for
-        return result
-    # end def _convert_dict
+def default_engine():
+    """Return the Abbreviation instance behind the module level functions,
+    created on the first call."""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = Abbreviation()
+    # end if create engine
+    return _default_engine
+# end def default_engine
 
-    def _allocate_dict_duplicates(self, elements, excess, diff=dict()):
-        """Return duplicates in given dictionary as a new dictionary.
 
-        @param elements <dict> Storing all the abbreviations and nodenames
-        @param excess <dict> Storing only the duplicates
-        @param diff <dict> Storing the differences of intersecting values
-        """
-        temp = dict()
-        for e in excess:
-            for key, value in elements.items():
-                if e not in value:
-                    continue
-                # end if check existence of item
-                if e not in temp:
-                    temp[e] = value
-                else:
-                    diff[key] = value
-                # end if get difference
-            # end for iterate dict values
-        # end for iterate excess values
-        return diff
-    # end def _allocate_dict_duplicates
-
-    def _compare_to_dict(self, item, letters, elements, index, rest):
-        """Compare redundant item with whole dictionary and individualize.
-
-        @param item <dict> Nodename as key and abbreviation as value
-        @param letters <string> NodeName string to iterate through each char
-        @param elements <dict> The whole dictionary of abbreviations
-        @param index <int> Index number of the abbreviation to replace the char
-        @param rest <dict> Output of non abbreviatable nodeNames
-        """
-        if not letters:
-            for k, v in elements.items():
-                if item.keys()[0] == v:
-                    if item.values()[0] == k:
-                        rest[k] = v
-                    # end if add to undefinable rest
-                    if self._iterate_abbreviation({v: k}, k, elements, index):
-                        break
-                    # end if item added to elements
-                # end if item exist in elements
-            # end for iterate elements
-            return
-        # end if no letters left
-        key, value = item.items()[0]
-        abb = self._setup_case(key.replace(key[index], letters[0]))
-        if abb not in elements.values():
-            elements[value] = abb
-            return True
-        # end if key not in elements values
-        return self._compare_to_dict(item, letters[1:], elements, index, rest)
-    # end def _compare_to_dict
-
-    def _iterate_abbreviation(self, item, letters, elements, index):
-        """Iterate, compare and return given abbreviation to whole dictionary.
-
-        @param item <dict> Nodename as key and abbreviation as value
-        @param letters <string> NodeName string to iterate through each char
-        @param elements <dict> The whole dictionary of abbreviations
-        @param index <int> Index number of abbreviation to replace the char
-        """
-        for letter in letters:
-            key, value = item.items()[0]
-            abb = self._setup_case(key.replace(key[index], letter))
-            if abb not in elements.values():
-                elements[value] = abb
-                return True
-            # end if key not in elements values
-        # end if iterate letters
-    # end def _iterate_abbreviation
-# end class Abbreviation
+def abbreviate(*args, **kwargs):
+    """Abbreviate a word with the default engine.
+
+    @see Abbreviation.abbreviate for the arguments
+    """
+    return default_engine().abbreviate(*args, **kwargs)
+# end def abbreviate
+
+
+def abbreviate_multiple(*args, **kwargs):
+    """Abbreviate a list of words with the default engine.
+
+    @see Abbreviation.abbreviate_multiple for the arguments
+    """
+    return default_engine().abbreviate_multiple(*args, **kwargs)
+# end def abbreviate_multiple
+
+
+def abbreviate_lengths(*args, **kwargs):
+    """Abbreviate a list of words in several lengths with the default
+    engine.
+
+    @see Abbreviation.abbreviate_lengths for the arguments
+    """
+    return default_engine().abbreviate_lengths(*args, **kwargs)
+# end def abbreviate_lengths
+
+
+def __getattr__(name):
+    """Import the submodule defining the given public name on first access.
 
+    @param name <str> Name of the attribute
+    """
+    module = _lazy_names.get(name)
+    if module is None:
+        raise AttributeError('module %r has no attribute %r' % (__name__,
+                                                                 name))
+    # end if unknown name
+    __import__(module)
+    value = getattr(sys.modules[module], name)
+    globals()[name] = value
+    return value
+# end def __getattr__
 
-abbreviate = Abbreviation().abbreviate
-abbreviate_multiple = Abbreviation().abbreviate_multiple
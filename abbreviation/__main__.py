@@ -0,0 +1,14 @@
+"""
+@package: abbreviation.__main__
+@brief: Run the command line interface with python -m abbreviation
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+import sys
+
+from abbreviation.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
+# end if run as script
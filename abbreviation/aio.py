@@ -0,0 +1,282 @@
+"""
+@package: abbreviation.aio
+@brief: Asyncio front-end coalescing concurrent requests into batches
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+import asyncio
+from collections import OrderedDict
+
+from abbreviation import UPPERCASE, Abbreviation
+
+
+def _running_loop():
+    """Return the event loop running the current coroutine."""
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:
+        return asyncio.get_event_loop()
+    # end try get running loop
+# end def _running_loop
+
+
+class _Batch(object):
+
+    """Requests of one scope, casemode and length waiting for their run."""
+
+    __slots__ = ('scope', 'casemode', 'length', 'requests', 'words',
+                 'handle', 'due')
+
+    def __init__(self, scope, casemode, length):
+        """Initialize _Batch class.
+
+        @param scope <AbbreviationSession> Scope of the requests or None
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        """
+        self.scope = scope
+        self.casemode = casemode
+        self.length = length
+        self.requests = list()
+        self.words = 0
+        self.handle = None
+        self.due = False
+    # end def __init__
+# end class _Batch
+
+
+class AsyncAbbreviator(object):
+
+    """Asyncio front-end of an Abbreviation engine.
+
+    Requests made while the event loop runs are collected for a short
+    window and run together, so many small requests share the cost of
+    one run. Requests with the same scope, casemode and length form one
+    batch. Without a scope every request is still deduplicated on its
+    own. The requests of one AbbreviationSession are deduplicated
+    together in arrival order, like one abbreviate_multiple call of the
+    session.
+
+    Batches of at least offload words run in an executor, so the event
+    loop is never blocked by them. A scope only has one batch running at
+    a time, the requests arriving meanwhile wait for the next batch.
+
+    Both methods return an asyncio future:
+
+        abbreviation = await abbreviator.abbreviate('Monday')
+    """
+
+    def __init__(self, abbreviation=None, window=0.0, max_batch=1024,
+                 offload=1024, executor=None):
+        """Initialize AsyncAbbreviator class.
+
+        @param abbreviation <Abbreviation> Engine of the requests without a
+                                           scope, a default if None
+        @param window <float> Seconds a request waits for others to join
+                              its batch, 0 batches the requests made in
+                              the same iteration of the event loop
+        @param max_batch <int> Number of words running a batch at once
+        @param offload <int> Number of words of a batch running in the
+                             executor instead of the event loop
+        @param executor <Executor> Executor of the large batches, the
+                                   default executor of the loop if None
+        """
+        if abbreviation is None:
+            abbreviation = Abbreviation()
+        # end if create default engine
+        self._abbreviation = abbreviation
+        self._window = window
+        self._max_batch = max_batch
+        self._offload = offload
+        self._executor = executor
+        self._pending = OrderedDict()
+        # Scopes with a batch running in the executor
+        self._running = set()
+        # Number of requests and of the batches running them
+        self.requests = 0
+        self.batches = 0
+    # end def __init__
+
+    def abbreviate(self, word, casemode=UPPERCASE, length=3, scope=None):
+        """Return a future of the abbreviation of the word.
+
+        @param word <str> string element
+        @param casemode <const> Casemode of the abbreviation
+        @param length <int> Length of the abbreviated letters
+        @param scope <AbbreviationSession> Deduplicate against the requests
+                                           of the same session, None
+                                           deduplicates nothing
+        """
+        return self._request([word], casemode, length, scope, True)
+    # end def abbreviate
+
+    def abbreviate_multiple(self, words, casemode=UPPERCASE, length=3,
+                            scope=None):
+        """Return a future of the abbreviations of the words.
+
+        @param words <list> List of string elements
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        @param scope <AbbreviationSession> Deduplicate against the requests
+                                           of the same session, None only
+                                           deduplicates the given words
+        """
+        return self._request(list(words), casemode, length, scope, False)
+    # end def abbreviate_multiple
+
+    def _request(self, words, casemode, length, scope, single):
+        """Add a request to the batch of its scope and return its future.
+
+        @param words <list> Words of the request
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        @param scope <AbbreviationSession> Scope of the request or None
+        @param single <bool> Resolve the future with the abbreviation of
+                             the only word instead of a dict
+        """
+        loop = _running_loop()
+        future = loop.create_future()
+        key = (scope, casemode, length)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(scope, casemode, length)
+            batch.handle = loop.call_later(self._window, self._flush, key)
+        # end if open new batch
+        batch.requests.append((words, future, single))
+        batch.words += len(words)
+        self.requests += 1
+        if batch.words >= self._max_batch:
+            self._flush(key)
+        # end if batch full
+        return future
+    # end def _request
+
+    def _flush(self, key):
+        """Run the pending batch of the key, inline or in the executor.
+
+        @param key <tuple> Scope, casemode and length of the batch
+        """
+        batch = self._pending.get(key)
+        if batch is None:
+            return
+        # end if nothing pending
+        if batch.scope is not None and batch.scope in self._running:
+            batch.due = True
+            return
+        # end if wait for the running batch of the scope
+        del self._pending[key]
+        batch.handle.cancel()
+        self.batches += 1
+        if batch.words < self._offload:
+            try:
+                results = self._run(batch)
+            except Exception as error:
+                self._fail(batch, error)
+            else:
+                self._finish(batch, results)
+            # end try run in the event loop
+            return
+        # end if small batch
+        if batch.scope is not None:
+            self._running.add(batch.scope)
+        # end if block the scope until the run finished
+        future = _running_loop().run_in_executor(self._executor, self._run,
+                                                 batch)
+        future.add_done_callback(
+            lambda future: self._done(batch, future))
+    # end def _flush
+
+    def _done(self, batch, future):
+        """Hand the results of a batch run in the executor to its requests
+        and run the batches of the scope that are due.
+
+        @param batch <_Batch> Batch that was run
+        @param future <Future> Future of the run
+        """
+        self._running.discard(batch.scope)
+        if future.cancelled():
+            self._fail(batch, asyncio.CancelledError())
+        elif future.exception() is not None:
+            self._fail(batch, future.exception())
+        else:
+            self._finish(batch, future.result())
+        # end if run failed
+        if batch.scope is None:
+            return
+        # end if nothing waits for unscoped batches
+        due = [waiting for waiting, pending in self._pending.items()
+               if pending.scope is batch.scope and pending.due]
+        for waiting in due:
+            self._flush(waiting)
+        # end for run waiting batches in arrival order
+    # end def _done
+
+    def _run(self, batch):
+        """Abbreviate the requests of the batch and return one result dict
+        per request, None for each request if the length is invalid.
+
+        @param batch <_Batch> Batch to run
+        """
+        engine = self._abbreviation
+        if batch.scope is not None:
+            engine = batch.scope._abbreviation
+        # end if run on the engine of the session
+        call = engine._context(batch.casemode, batch.length)
+        if call is None:
+            return [None] * len(batch.requests)
+        # end if invalid length
+        if batch.scope is None:
+            resolver = engine._create_resolver(call.candidates)
+            results = list()
+            for words, _, _ in batch.requests:
+                resolver.clear()
+                results.append(engine._iterate_data(words, call, resolver))
+            # end for deduplicate each request on its own
+            return results
+        # end if no shared scope
+        words = [word for request in batch.requests for word in request[0]]
+        result = engine._iterate_data(words, call, batch.scope._resolver)
+        results = list()
+        for words, _, _ in batch.requests:
+            keys = [engine._result_key(word, batch.length) for word in words]
+            results.append(dict((key, result[key]) for key in keys))
+        # end for split the result by request
+        return results
+    # end def _run
+
+    def _finish(self, batch, results):
+        """Resolve the futures of the requests with their results.
+
+        @param batch <_Batch> Batch that was run
+        @param results <list> Result dict of each request
+        """
+        output = self._abbreviation._output
+        for (_, future, single), result in zip(batch.requests, results):
+            if future.done():
+                continue
+            # end if cancelled by the caller
+            if result is not None:
+                if single:
+                    result = list(result.values())[0]
+                elif output == 'list':
+                    result = [[key, value] for key, value in result.items()]
+                # end if convert result
+            # end if valid result
+            future.set_result(result)
+        # end for iterate requests
+    # end def _finish
+
+    def _fail(self, batch, error):
+        """Raise the error in every request of the batch.
+
+        @param batch <_Batch> Batch that failed
+        @param error <Exception> Error of the run
+        """
+        for _, future, _ in batch.requests:
+            if not future.done():
+                future.set_exception(error)
+            # end if not cancelled by the caller
+        # end for iterate requests
+    # end def _fail
+# end class AsyncAbbreviator
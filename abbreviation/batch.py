@@ -0,0 +1,93 @@
+"""
+@package: abbreviation.batch
+@brief: Abbreviate independent groups of words in a process pool
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+from abbreviation import UPPERCASE, Abbreviation
+
+# Engine of the current worker process, set by _initialize_worker
+_engine = None
+
+
+def _initialize_worker(options):
+    """Create the pre-configured engine of a worker process.
+
+    @param options <dict> Keyword arguments of the Abbreviation class
+    """
+    global _engine
+    _engine = Abbreviation(**options)
+# end def _initialize_worker
+
+
+def _process_pool(workers, options):
+    """Return a process pool, every worker holds an engine of the options.
+
+    multiprocessing.Pool takes an initializer on every supported Python,
+    concurrent.futures needs 3.7 for it and is missing before 3.2.
+
+    @param workers <int> Number of processes
+    @param options <dict> Keyword arguments of the Abbreviation class
+    """
+    from multiprocessing import Pool
+    return Pool(workers, _initialize_worker, (options,))
+# end def _process_pool
+
+
+def _cpu_count():
+    """Return the number of cpus, 1 if it cannot be determined."""
+    import multiprocessing
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+    # end try count cpus
+# end def _cpu_count
+
+
+def _abbreviate_group(task):
+    """Abbreviate a single group on the engine of the worker process.
+
+    @param task <tuple> Group of words, casemode and length
+    """
+    words, casemode, length = task
+    return _engine.abbreviate_multiple(words, casemode, length)
+# end def _abbreviate_group
+
+
+def abbreviate_batches(groups, workers=None, casemode=UPPERCASE, length=3,
+                       chunksize=None, **options):
+    """Abbreviate every group independently and return the results in order.
+
+    Each group is its own deduplication scope, words are only deduplicated
+    against the words of the same group. The groups are fanned out over a
+    process pool, every worker holds one engine created from the options.
+
+    @param groups <iterable> Groups of words, each a list of string elements
+    @param workers <int> Number of processes, the number of cpus if None.
+                         1 runs in the current process
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    @param chunksize <int> Number of groups sent to a worker at once
+    @param options <dict> Keyword arguments of the Abbreviation class
+    """
+    tasks = [(words, casemode, length) for words in groups]
+    if workers is None:
+        workers = _cpu_count()
+    # end if use all cpus
+    if workers < 2 or len(tasks) < 2:
+        engine = Abbreviation(**options)
+        return [engine.abbreviate_multiple(*task) for task in tasks]
+    # end if run in the current process
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 4))
+    # end if spread four chunks per worker
+    pool = _process_pool(workers, options)
+    try:
+        return pool.map(_abbreviate_group, tasks, chunksize)
+    finally:
+        pool.terminate()
+        pool.join()
+    # end try process pool
+# end def abbreviate_batches
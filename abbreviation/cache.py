@@ -0,0 +1,105 @@
+"""
+@package: abbreviation.cache
+@brief: Bounded least recently used cache with hit and miss counters
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+
+    """Mapping holding at most maxsize items, dropping the least recently
+    used item first. Hits, misses and evictions are counted.
+
+    A lookup reorders the items, so every operation holds a lock and an
+    engine can share its cache between threads. The OrderedDict of
+    Python 2 is written in Python and breaks without it.
+    """
+
+    def __init__(self, maxsize=1024):
+        """Initialize LRUCache class.
+
+        @param maxsize <int> Maximum number of cached items
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        # Imported here, so importing the package does not load threading
+        import threading
+        self._lock = threading.Lock()
+    # end def __init__
+
+    def __len__(self):
+        """Return the number of cached items."""
+        return len(self._items)
+    # end def __len__
+
+    def __contains__(self, key):
+        """Return True if the key is cached, does not count as a hit.
+
+        @param key <hashable> Key to look up
+        """
+        return key in self._items
+    # end def __contains__
+
+    def get(self, key, default=None):
+        """Return the cached value of the key and mark it as recently used.
+
+        @param key <hashable> Key to look up
+        @param default <object> Returned if the key is not cached
+        """
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            # end try get item
+            self._items[key] = value
+            self.hits += 1
+        # end with lock
+        return value
+    # end def get
+
+    def put(self, key, value):
+        """Cache the value of the key, dropping the least recently used.
+
+        @param key <hashable> Key to store
+        @param value <object> Value to store
+        """
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+            # end while drop least recently used
+        # end with lock
+    # end def put
+
+    def clear(self):
+        """Drop all cached items, the counters are kept."""
+        with self._lock:
+            self._items.clear()
+        # end with lock
+    # end def clear
+
+    def info(self):
+        """Return the size and counters of the cache as a dict."""
+        with self._lock:
+            size, hits, misses = len(self._items), self.hits, self.misses
+            evictions = self.evictions
+        # end with lock
+        lookups = hits + misses
+        return {'maxsize': self.maxsize,
+                'size': size,
+                'hits': hits,
+                'misses': misses,
+                'evictions': evictions,
+                'hit_rate': float(hits) / lookups if lookups else 0.0}
+    # end def info
+# end class LRUCache
@@ -0,0 +1,321 @@
+"""
+@package: abbreviation.cli
+@brief: Command line interface streaming names to their abbreviations
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Usage: abbreviation [options] [FILE ...]
+
+Names are read line by line from the files, or stdin if none or - is
+given, and written with their abbreviation as TSV, JSON Lines or CSV.
+"""
+
+import argparse
+import errno
+import json
+import os
+import sys
+from collections import deque
+
+from abbreviation import CAPITALIZE, LOWERCASE, UPPERCASE, Abbreviation
+from abbreviation.resolver import Resolver
+
+CASEMODES = {'upper': UPPERCASE, 'lower': LOWERCASE, 'capitalize': CAPITALIZE}
+FORMATS = ('tsv', 'jsonl', 'csv')
+# Bytes of lines read and written at once
+CHUNK_SIZE = 1 << 16
+
+
+def read_names(paths, chunk_size=CHUNK_SIZE):
+    """Yield the names of the files in chunks, blank lines are skipped.
+
+    @param paths <list> Files to read, - reads stdin
+    @param chunk_size <int> Approximate bytes of lines read at once
+    """
+    for path in paths or ['-']:
+        handle = sys.stdin if path == '-' else open(path)
+        try:
+            while True:
+                lines = handle.readlines(chunk_size)
+                if not lines:
+                    break
+                # end if end of file
+                yield [line.rstrip('\r\n') for line in lines if line.strip()]
+            # end while read chunks
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+            # end if close file
+        # end try read file
+    # end for iterate files
+# end def read_names
+
+
+def read_exclusion(path):
+    """Return the excluded abbreviations of the file.
+
+    The file is either a JSON object like the exclude_abbreviation
+    argument of Abbreviation, or lines of a name followed by its excluded
+    abbreviations, separated by tabs.
+
+    @param path <str> File to read
+    """
+    with open(path) as handle:
+        content = handle.read()
+    # end with read file
+    if content.lstrip().startswith('{'):
+        return json.loads(content)
+    # end if JSON object
+    exclusion = dict()
+    for line in content.splitlines():
+        fields = [field for field in line.split('\t') if field]
+        if len(fields) > 1:
+            exclusion.setdefault(fields[0], list()).extend(fields[1:])
+        # end if name with abbreviations
+    # end for iterate lines
+    return exclusion
+# end def read_exclusion
+
+
+class Writer(object):
+
+    """Write (name, abbreviation) pairs as TSV, JSON Lines or CSV, one
+    chunk of pairs at a time."""
+
+    def __init__(self, stream, output_format):
+        """Initialize Writer class.
+
+        @param stream <file> Text stream to write to
+        @param output_format <str> One of FORMATS
+        """
+        self._stream = stream
+        self._csv = None
+        self._format = None
+        if output_format == 'csv':
+            import csv
+            self._csv = csv.writer(stream, lineterminator='\n')
+        else:
+            self._format = getattr(self, '_format_%s' % output_format)
+        # end if quote fields
+    # end def __init__
+
+    def write(self, pairs):
+        """Write the pairs.
+
+        @param pairs <list> Name and abbreviation pairs
+        """
+        if self._csv is not None:
+            self._csv.writerows(pairs)
+        else:
+            self._stream.write(''.join([self._format(pair)
+                                        for pair in pairs]))
+        # end if write csv
+    # end def write
+
+    def _format_tsv(self, pair):
+        """Return the pair as a TSV line.
+
+        @param pair <tuple> Name and abbreviation
+        """
+        return '%s\t%s\n' % pair
+    # end def _format_tsv
+
+    def _format_jsonl(self, pair):
+        """Return the pair as a JSON line.
+
+        @param pair <tuple> Name and abbreviation
+        """
+        return '{"name": %s, "abbreviation": %s}\n' % (json.dumps(pair[0]),
+                                                       json.dumps(pair[1]))
+    # end def _format_jsonl
+# end class Writer
+
+
+def abbreviate_stream(engine, chunks, casemode, length):
+    """Yield the pairs of each chunk, deduplicated against all names
+    before.
+
+    @param engine <Abbreviation> Engine to run
+    @param chunks <iterable> Lists of names
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    """
+    resolver = Resolver(None, index=engine._packed_index())
+    for names in chunks:
+        stream = engine.abbreviate_stream(names, casemode, length, resolver)
+        yield [(name, abbreviation)
+               for name, (_, abbreviation) in zip(names, stream)]
+    # end for iterate chunks
+# end def abbreviate_stream
+
+
+def abbreviate_groups(engine, groups, casemode, length, workers, options):
+    """Yield the pairs of each group, every group deduplicated on its own.
+
+    With several workers the groups are abbreviated in a process pool, at
+    most a few groups per worker are in flight, so the input is still
+    read lazily and written in order.
+
+    @param engine <Abbreviation> Engine to run in the current process
+    @param groups <iterable> Lists of names
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    @param workers <int> Number of processes, 1 runs in this process
+    @param options <dict> Keyword arguments of the Abbreviation class
+    """
+    def pairs(names, result):
+        return [(name, result[engine._result_key(name, length)])
+                for name in names]
+    # end def pairs
+
+    if workers < 2:
+        for names in groups:
+            yield pairs(names, engine.abbreviate_multiple(names, casemode,
+                                                          length))
+        # end for iterate groups
+        return
+    # end if run in the current process
+    from abbreviation.batch import _abbreviate_group, _process_pool
+    pool = _process_pool(workers, options)
+    try:
+        running = deque()
+        for names in groups:
+            running.append((names, pool.apply_async(
+                _abbreviate_group, ((names, casemode, length),))))
+            if len(running) >= workers * 2:
+                names, result = running.popleft()
+                yield pairs(names, result.get())
+            # end if wait for the oldest group
+        # end for submit groups
+        while running:
+            names, result = running.popleft()
+            yield pairs(names, result.get())
+        # end while write remaining groups
+    finally:
+        pool.terminate()
+        pool.join()
+    # end try process pool
+# end def abbreviate_groups
+
+
+def regroup(chunks, size):
+    """Yield the names of the chunks in groups of the given size.
+
+    @param chunks <iterable> Lists of names
+    @param size <int> Number of names of each group
+    """
+    group = list()
+    for names in chunks:
+        group.extend(names)
+        while len(group) >= size:
+            yield group[:size]
+            group = group[size:]
+        # end while group complete
+    # end for iterate chunks
+    if group:
+        yield group
+    # end if last group
+# end def regroup
+
+
+def parse_args(argv):
+    """Return the parsed command line arguments.
+
+    @param argv <list> Command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog='abbreviation',
+        description='Abbreviate the names of the files or stdin, one per '
+                    'line. All names are deduplicated against each other '
+                    'unless --group-size splits them into independent '
+                    'groups.')
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help='files to read, - or none reads stdin')
+    parser.add_argument('-l', '--length', type=int, default=3,
+                        help='length of the abbreviations (default 3)')
+    parser.add_argument('-c', '--casemode', choices=sorted(CASEMODES),
+                        default='upper',
+                        help='case of the abbreviations (default upper)')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='tsv',
+                        help='output format (default tsv)')
+    parser.add_argument('--include-special-char', default='',
+                        metavar='CHARS',
+                        help='special characters kept in the names')
+    parser.add_argument('-e', '--exclude', metavar='FILE',
+                        help='excluded abbreviations as a JSON object or '
+                             'lines of a name and its abbreviations '
+                             'separated by tabs')
+    parser.add_argument('-g', '--group-size', type=int, default=0,
+                        help='deduplicate groups of this many names on '
+                             'their own')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='processes abbreviating the groups, needs '
+                             '--group-size')
+    parser.add_argument('--packed-keys', action='store_true',
+                        help='index the abbreviations as packed integers '
+                             'to save memory, abbreviations differing in '
+                             'case only are duplicates')
+    args = parser.parse_args(argv)
+    if args.length < 1:
+        parser.error('--length must be higher than 0')
+    # end if invalid length
+    if args.workers > 1 and args.group_size < 1:
+        parser.error('--workers needs --group-size')
+    # end if no independent groups
+    args.exclusion = None
+    if args.exclude:
+        try:
+            args.exclusion = read_exclusion(args.exclude)
+        except (IOError, OSError) as error:
+            parser.error('--exclude: cannot read %s: %s' % (
+                args.exclude, error.strerror or error))
+        except ValueError as error:
+            parser.error('--exclude: invalid JSON in %s: %s' % (
+                args.exclude, error))
+        # end try read exclusion
+    # end if read exclusion
+    return args
+# end def parse_args
+
+
+def main(argv=None):
+    """Run the command line interface and return the exit code.
+
+    @param argv <list> Command line arguments, sys.argv if None
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    options = {'include_special_char': list(args.include_special_char),
+               'packed_keys': args.packed_keys}
+    if args.exclusion is not None:
+        options['exclude_abbreviation'] = args.exclusion
+    # end if exclude abbreviations
+    try:
+        engine = Abbreviation(**options)
+    except ValueError as error:
+        sys.stderr.write('abbreviation: error: %s\n' % error)
+        return 2
+    # end try create engine
+    casemode = CASEMODES[args.casemode]
+    chunks = read_names(args.files)
+    if args.group_size:
+        chunks = abbreviate_groups(engine, regroup(chunks, args.group_size),
+                                   casemode, args.length, args.workers,
+                                   options)
+    else:
+        chunks = abbreviate_stream(engine, chunks, casemode, args.length)
+    # end if independent groups
+    writer = Writer(sys.stdout, args.format)
+    try:
+        for pairs in chunks:
+            writer.write(pairs)
+        # end for write chunks
+        sys.stdout.flush()
+    except IOError as error:
+        if error.errno != errno.EPIPE:
+            raise
+        # end if not a closed pipe
+        # Nothing reads the output anymore, silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    # end try write output
+    return 0
+# end def main
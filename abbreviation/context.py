@@ -0,0 +1,52 @@
+"""
+@package: abbreviation.context
+@brief: Parameters and stats of a single call of an abbreviation engine
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+
+class CallContext(object):
+
+    """Parameters and stats of a single call of an Abbreviation engine.
+
+    Every call creates its own context and hands it down to the methods
+    doing the work, the engine itself only holds its configuration and
+    the cache. So one engine serves calls from several threads at once
+    without locks and without the calls seeing each other's parameters.
+    """
+
+    __slots__ = ('engine', 'casemode', 'length', 'stats')
+
+    def __init__(self, engine, casemode, length, stats=None):
+        """Initialize CallContext class.
+
+        @param engine <Abbreviation> Engine running the call
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        @param stats <AbbreviationStats> Stats of the call, None if disabled
+        """
+        self.engine = engine
+        self.casemode = casemode
+        self.length = length
+        self.stats = stats
+    # end def __init__
+
+    def __repr__(self):
+        """Return the representation of the CallContext."""
+        return 'CallContext(casemode=%r, length=%r)' % (self.casemode,
+                                                        self.length)
+    # end def __repr__
+
+    def candidates(self, word, abbreviation, start=0):
+        """Return the alternative abbreviations of a duplicated word for
+        the casemode and length of the call, a Resolver calls this.
+
+        @param word <str> word to abbreviate, special characters removed
+        @param abbreviation <str> First choice abbreviation of the word
+        @param start <int> Only use abbreviations with a char at or after
+                           this index, 0 uses all of them
+        """
+        return self.engine._candidates(word, abbreviation, start, self)
+    # end def candidates
+# end class CallContext
@@ -0,0 +1,226 @@
+"""
+@package: abbreviation.liveset
+@brief: Deduplicated abbreviations of a set of words edited one at a time
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+from collections import OrderedDict
+
+from abbreviation import UPPERCASE, Abbreviation
+from abbreviation.context import CallContext
+from abbreviation.resolver import Resolver
+
+
+class AbbreviationSet(object):
+
+    """Live set of words and their deduplicated abbreviations.
+
+    Words are added and removed one at a time. An edit only touches the
+    collision group of the word: add claims the first free candidate of
+    the new word, remove releases its abbreviation and hands it to the
+    oldest unresolved word waiting for it. Assignments of all other words
+    never change, so an edit costs the candidates of one word instead of
+    deduplicating the whole set again.
+
+    Words are keyed without special characters, like the result of
+    Abbreviation.abbreviate_multiple.
+    """
+
+    def __init__(self, words=(), abbreviation=None, casemode=UPPERCASE,
+                 length=3):
+        """Initialize AbbreviationSet class.
+
+        @param words <iterable> Words added in order
+        @param abbreviation <Abbreviation> Engine to run, a default if None
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        """
+        if abbreviation is None:
+            abbreviation = Abbreviation()
+        # end if create default engine
+        self._abbreviation = abbreviation
+        self._call = CallContext(abbreviation, casemode, length)
+        self._resolver = Resolver(self._call.candidates)
+        # Plain dicts only keep the insertion order from Python 3.7 on
+        self._words = OrderedDict()
+        self._unresolved = dict()
+        self._waiting = dict()
+        for word in words:
+            self.add(word)
+        # end for add initial words
+    # end def __init__
+
+    def __len__(self):
+        """Return the number of words."""
+        return len(self._words)
+    # end def __len__
+
+    def __contains__(self, word):
+        """Return True if the word is in the set.
+
+        @param word <str> Word to look up
+        """
+        return self._key(word) in self._words
+    # end def __contains__
+
+    def __iter__(self):
+        """Yield the words in insertion order."""
+        return iter(self._words)
+    # end def __iter__
+
+    @property
+    def unresolved(self):
+        """Return the words that still share their first choice."""
+        return dict((word, self._words[word]) for word in self._unresolved)
+    # end def unresolved
+
+    def items(self):
+        """Return the (word, abbreviation) pairs in insertion order."""
+        return list(self._words.items())
+    # end def items
+
+    def owner(self, abbreviation):
+        """Return the word owning the given abbreviation or None.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        owner = self._resolver.owner(abbreviation)
+        if owner not in self._words:
+            return None
+        # end if reserved by an excluded word that is not in the set
+        return owner
+    # end def owner
+
+    def get(self, word, default=None):
+        """Return the abbreviation of the word or the default.
+
+        @param word <str> Word to look up
+        @param default <object> Returned if the word is not in the set
+        """
+        return self._words.get(self._key(word), default)
+    # end def get
+
+    def add(self, word):
+        """Add the word and return its abbreviation.
+
+        Adding a word that is already in the set returns its current
+        abbreviation.
+
+        @param word <str> Word to add
+        """
+        self._setup()
+        excluded = dict()
+        if self._abbreviation._check_exclusion(word, excluded, self._call):
+            abbreviation = excluded[word]
+            if word not in self._words:
+                self._resolver.reserve(word, abbreviation)
+                self._words[word] = abbreviation
+            # end if add excluded word
+            return self._words[word]
+        # end if skip exclusion
+        word, abbreviation = self._abbreviation._first_choice(word,
+                                                              self._call)
+        if word in self._words:
+            return self._words[word]
+        # end if word exists
+        result = self._resolver.assign(word, abbreviation)
+        if result is None:
+            self._wait(word, abbreviation)
+            result = abbreviation
+        # end if no free candidate
+        self._words[word] = result
+        return result
+    # end def add
+
+    def remove(self, word):
+        """Remove the word and release its abbreviation.
+
+        The oldest unresolved word waiting for the released abbreviation
+        takes it over. Raise KeyError if the word is not in the set.
+
+        @param word <str> Word to remove
+        """
+        self._setup()
+        word = self._key(word)
+        abbreviation = self._words.pop(word)
+        if word in self._unresolved:
+            self._unwait(word)
+            return
+        # end if word owns no abbreviation
+        self._resolver.release(abbreviation)
+        if abbreviation in self._resolver:
+            return
+        # end if reserved by an excluded word
+        for waiting in self._waiting.get(abbreviation, ()):
+            result = self._resolver.assign(waiting, self._unresolved[waiting])
+            if result is not None:
+                self._unwait(waiting)
+                self._words[waiting] = result
+                break
+            # end if promote waiting word
+        # end for iterate waiting words
+    # end def remove
+
+    def discard(self, word):
+        """Remove the word if it is in the set.
+
+        @param word <str> Word to remove
+        """
+        if word in self:
+            self.remove(word)
+        # end if word exists
+    # end def discard
+
+    def _setup(self):
+        """Set the reserved abbreviations of the length on the resolver."""
+        self._resolver.reserved = self._abbreviation._reserved.get(
+            self._call.length, dict())
+    # end def _setup
+
+    def _key(self, word):
+        """Return the word as it is stored in the set.
+
+        @param word <str> Word as given by the caller
+        """
+        return self._abbreviation._result_key(word, self._call.length)
+    # end def _key
+
+    def _accepted(self, word, abbreviation):
+        """Return the first choice and all candidates of the word.
+
+        @param word <str> Word the abbreviation was created from
+        @param abbreviation <str> First choice abbreviation of the word
+        """
+        accepted = set(self._call.candidates(word, abbreviation))
+        accepted.add(abbreviation)
+        return accepted
+    # end def _accepted
+
+    def _wait(self, word, abbreviation):
+        """Register the unresolved word for every abbreviation it accepts.
+
+        @param word <str> Word without a free candidate
+        @param abbreviation <str> First choice abbreviation of the word
+        """
+        self._unresolved[word] = abbreviation
+        for candidate in self._accepted(word, abbreviation):
+            self._waiting.setdefault(candidate, list()).append(word)
+        # end for iterate accepted abbreviations
+    # end def _wait
+
+    def _unwait(self, word):
+        """Unregister a word that is no longer unresolved.
+
+        @param word <str> Previously unresolved word
+        """
+        abbreviation = self._unresolved.pop(word)
+        for candidate in self._accepted(word, abbreviation):
+            waiting = self._waiting[candidate]
+            waiting.remove(word)
+            if not waiting:
+                del self._waiting[candidate]
+            # end if no word waiting
+        # end for iterate accepted abbreviations
+    # end def _unwait
+# end class AbbreviationSet
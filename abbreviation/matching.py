@@ -0,0 +1,201 @@
+"""
+@package: abbreviation.matching
+@brief: Collision engine completing the greedy pass with augmenting paths
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+from collections import deque
+from itertools import islice
+
+from abbreviation.resolver import Resolver
+from abbreviation.stats import default_timer
+
+
+class MatchingResolver(Resolver):
+
+    """Resolve abbreviation collisions as a bipartite matching.
+
+    Words and their accepted abbreviations, the first choice and the
+    candidates, form a bipartite graph. The greedy pass of Resolver
+    matches most words. Every word it leaves unresolved then searches an
+    augmenting path: a chain of words of the same call that each move to
+    another accepted abbreviation, ending at a free one. The breadth
+    first search finds the chain moving the fewest words, so a word only
+    loses its abbreviation when that resolves one more collision.
+
+    Candidates are generated lazily, only for the words the search
+    reaches. The search stops once the time or candidate budget is used
+    up, the remaining words stay unresolved. Words pinned by reserved,
+    reserved abbreviations and claims of previous calls never move.
+    """
+
+    def __init__(self, candidates, max_size=None, index=None,
+                 time_budget=None, candidate_budget=None):
+        """Initialize MatchingResolver class.
+
+        @param candidates <function> Called with a word, its first choice and
+                                     the index of its differing chars,
+                                     returns the alternative abbreviations
+                                     in priority order
+        @param max_size <int> Maximum number of claims, the oldest claims are
+                              released first. None keeps all claims
+        @param index <dict> Mapping of claimed abbreviations to their owners,
+                            a new dict if None
+        @param time_budget <float> Seconds the augmenting paths of one
+                                   resolve may take, None is unlimited
+        @param candidate_budget <int> Number of candidates the augmenting
+                                      paths of one resolve may create,
+                                      None is unlimited
+        """
+        super(MatchingResolver, self).__init__(candidates, max_size, index)
+        self.time_budget = time_budget
+        self.candidate_budget = candidate_budget
+        # Number of words resolved and moved by augmenting paths
+        self.augmented = 0
+        self.moved = 0
+    # end def __init__
+
+    def _resolve(self, result, reserved):
+        """Deduplicate the given dictionary in place.
+
+        @param result <dict> Words as keys and first choices as values
+        @param reserved <list> Words whose abbreviation must not change
+        """
+        fixed = set(reserved)
+        fixed.update(word for word, abbreviation in result.items()
+                     if self.owner(abbreviation) == word)
+        firsts = dict(result)
+        super(MatchingResolver, self)._resolve(result, reserved)
+        pending = [word for word in result if word in self.unresolved]
+        if pending:
+            self._augment(result, firsts, fixed, pending)
+        # end if greedy pass left collisions
+    # end def _resolve
+
+    def _augment(self, result, firsts, fixed, pending):
+        """Resolve the pending words with augmenting paths.
+
+        @param result <dict> Words and their current abbreviations
+        @param firsts <dict> Words and their first choices
+        @param fixed <set> Words that must keep their abbreviation
+        @param pending <list> Unresolved words in order
+        """
+        deadline = None
+        if self.time_budget is not None:
+            deadline = default_timer() + self.time_budget
+        # end if limit the time
+        budget = [self.candidate_budget]
+        accepted = dict()
+        dead = set()
+        for word in pending:
+            path = self._search(word, result, firsts, fixed, accepted,
+                                budget, deadline, dead)
+            if path is None:
+                if budget[0] == 0 or (deadline is not None and
+                                      default_timer() > deadline):
+                    break
+                # end if budget used up
+                continue
+            # end if no augmenting path
+            dead.clear()
+            for mover, abbreviation in path:
+                self._owners[abbreviation] = mover
+                result[mover] = abbreviation
+            # end for move words along the path
+            self.unresolved.pop(word, None)
+            self.augmented += 1
+            self.moved += len(path) - 1
+        # end for iterate pending words
+    # end def _augment
+
+    def _search(self, word, result, firsts, fixed, accepted, budget,
+                deadline, dead):
+        """Return the shortest augmenting path of the word as (word,
+        abbreviation) moves ending at a free abbreviation, None if there
+        is none within the budget.
+
+        Abbreviations reached by a failed search cannot lead to a free one
+        until the next path moves words, they are added to dead and
+        skipped meanwhile.
+
+        @param word <str> Unresolved word
+        @param result <dict> Words and their current abbreviations
+        @param firsts <dict> Words and their first choices
+        @param fixed <set> Words that must keep their abbreviation
+        @param accepted <dict> Accepted abbreviations of the words searched
+        @param budget <list> Remaining number of candidates, None inside
+                             is unlimited
+        @param deadline <float> Timer value ending the search or None
+        @param dead <set> Abbreviations without a path to a free one
+        """
+        parents = {word: None}
+        seen = set()
+        queue = deque([word])
+        while queue:
+            if deadline is not None and default_timer() > deadline:
+                return None
+            # end if out of time
+            current = queue.popleft()
+            for abbreviation in self._accepted(current, firsts, accepted,
+                                               budget):
+                if abbreviation in seen or abbreviation in dead:
+                    continue
+                # end if visited
+                seen.add(abbreviation)
+                owner = self.owner(abbreviation)
+                if owner is None:
+                    return self._path(parents, current, abbreviation)
+                # end if free abbreviation
+                if owner in parents or owner in fixed or owner not in result:
+                    continue
+                # end if held already or owner cannot move
+                parents[owner] = (current, abbreviation)
+                queue.append(owner)
+            # end for iterate accepted abbreviations
+        # end while search breadth first
+        dead.update(seen)
+        return None
+    # end def _search
+
+    def _path(self, parents, word, abbreviation):
+        """Return the moves of the path ending with the word taking the
+        free abbreviation.
+
+        @param parents <dict> Word and the abbreviation it takes from each
+                              reached word
+        @param word <str> Last word of the path
+        @param abbreviation <str> Free abbreviation
+        """
+        path = [(word, abbreviation)]
+        while parents[word] is not None:
+            word, abbreviation = parents[word]
+            path.append((word, abbreviation))
+        # end while walk back to the unresolved word
+        return path
+    # end def _path
+
+    def _accepted(self, word, firsts, accepted, budget):
+        """Return the first choice and the candidates of the word, created
+        once within the candidate budget.
+
+        @param word <str> Word to look up
+        @param firsts <dict> Words and their first choices
+        @param accepted <dict> Accepted abbreviations of the words searched
+        @param budget <list> Remaining number of candidates, None inside
+                             is unlimited
+        """
+        if word in accepted:
+            return accepted[word]
+        # end if created before
+        first = firsts[word]
+        candidates = self.candidates(word, first, 0)
+        if budget[0] is not None:
+            candidates = list(islice(candidates, budget[0]))
+            budget[0] -= len(candidates)
+        # end if limit the candidates
+        accepted[word] = [first] + list(candidates)
+        self.retries += len(accepted[word]) - 1
+        return accepted[word]
+    # end def _accepted
+# end class MatchingResolver
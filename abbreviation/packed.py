@@ -0,0 +1,284 @@
+"""
+@package: abbreviation.packed
+@brief: Integer packed abbreviation keys and a compact collision index
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+from array import array
+
+# Longest abbreviation packed into one key, a leading 1 marks the length,
+# so 36 ** (MAX_LENGTH + 1) stays below 2 ** 63
+MAX_LENGTH = 11
+# Markers of the key array, packed keys are at least 36
+EMPTY = 0
+DELETED = 1
+# Multiplier spreading the keys over the slots, 2 ** 64 / golden ratio
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+try:
+    _TYPECODE = 'q'
+    array(_TYPECODE)
+except ValueError:
+    # Python 2 has no long long arrays, its long is 64 bit on 64 bit Linux
+    _TYPECODE = 'l'
+# end try signed 64 bit array
+
+
+def pack(abbreviation):
+    """Return the case folded abbreviation packed into an int.
+
+    The chars are read as base 36 digits behind a leading 1, so keys of
+    abbreviations of different lengths never clash. Return None if the
+    abbreviation holds other chars than ASCII letters and digits or is
+    longer than MAX_LENGTH.
+
+    @param abbreviation <str> Abbreviation to pack
+    """
+    if len(abbreviation) > MAX_LENGTH or not abbreviation.isalnum():
+        return None
+    # end if not packable
+    try:
+        plain = abbreviation.isascii()
+    except AttributeError:
+        # Python before 3.7
+        plain = ord(max(abbreviation)) < 0x80
+    # end try check ASCII
+    if not plain:
+        return None
+    # end if non ASCII letters
+    return int('1' + abbreviation, 36)
+# end def pack
+
+
+def unpack(key):
+    """Return the lowercase abbreviation of the packed key.
+
+    @param key <int> Key created by pack
+    """
+    chars = list()
+    while key >= 36:
+        key, digit = divmod(key, 36)
+        chars.append('0123456789abcdefghijklmnopqrstuvwxyz'[digit])
+    # end while read digits
+    return ''.join(reversed(chars))
+# end def unpack
+
+
+class PackedIndex(object):
+
+    """Collision index of a Resolver storing its keys packed.
+
+    Claimed abbreviations are packed into ints and kept in an open
+    addressing table: an array of the keys and a list of the owners, so
+    the index holds no string per abbreviation. Abbreviations that cannot
+    be packed are kept in a plain dict. Keys are case folded, so
+    abbreviations differing in case only are duplicates. Claims are not
+    ordered, so the index does not support a max_size of the Resolver.
+
+    The index is meant for abbreviate_stream and long sessions, where it
+    is the only thing staying alive and takes less memory than a dict of
+    strings. Packing makes every claim slower, and abbreviate_multiple
+    keeps its whole result anyway, so there it is slower without saving
+    memory.
+    """
+
+    def __init__(self, capacity=8):
+        """Initialize PackedIndex class.
+
+        @param capacity <int> Number of slots to start with, rounded up to
+                              a power of two
+        """
+        size = 8
+        while size < capacity:
+            size <<= 1
+        # end while round up capacity
+        self._allocate(size)
+        self._others = dict()
+        # Last packed abbreviation, a claim looks it up more than once
+        self._text = None
+        self._key = None
+    # end def __init__
+
+    def __len__(self):
+        """Return the number of claimed abbreviations."""
+        return self._used + len(self._others)
+    # end def __len__
+
+    def __contains__(self, abbreviation):
+        """Return True if the abbreviation is claimed.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        return self.get(abbreviation) is not None
+    # end def __contains__
+
+    def __getitem__(self, abbreviation):
+        """Return the owner of the abbreviation, raise KeyError if it is not
+        claimed.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        owner = self.get(abbreviation)
+        if owner is None:
+            raise KeyError(abbreviation)
+        # end if not claimed
+        return owner
+    # end def __getitem__
+
+    def __setitem__(self, abbreviation, owner):
+        """Claim the abbreviation for the owner.
+
+        @param abbreviation <str> Abbreviation to claim
+        @param owner <str> Word owning the abbreviation
+        """
+        key = self._pack(abbreviation)
+        if key is None:
+            self._others[abbreviation] = owner
+            return
+        # end if not packable
+        slot = self._find(key)
+        current = self._keys[slot]
+        if current != key:
+            if current == EMPTY:
+                self._filled += 1
+            # end if slot was never used
+            self._keys[slot] = key
+            self._used += 1
+        # end if new key
+        self._owners[slot] = owner
+        if self._filled * 3 > len(self._keys) * 2:
+            self._resize()
+        # end if table too full
+    # end def __setitem__
+
+    def get(self, abbreviation, default=None):
+        """Return the owner of the abbreviation or the default.
+
+        @param abbreviation <str> Abbreviation to look up
+        @param default <object> Returned if the abbreviation is not claimed
+        """
+        if abbreviation is self._text:
+            key = self._key
+        else:
+            key = self._pack(abbreviation)
+        # end if packed before
+        if key is None:
+            return self._others.get(abbreviation, default)
+        # end if not packable
+        # Probe inline, lookups are the most frequent operation
+        keys = self._keys
+        mask = len(keys) - 1
+        slot = ((key * _MULTIPLIER) & _MASK64) >> self._shift
+        current = keys[slot]
+        while current != key:
+            if current == EMPTY:
+                return default
+            # end if probe ends
+            slot = (slot + 1) & mask
+            current = keys[slot]
+        # end while probe linearly
+        return self._owners[slot]
+    # end def get
+
+    def pop(self, abbreviation, default=None):
+        """Release the abbreviation and return its owner or the default.
+
+        @param abbreviation <str> Abbreviation to release
+        @param default <object> Returned if the abbreviation is not claimed
+        """
+        key = self._pack(abbreviation)
+        if key is None:
+            return self._others.pop(abbreviation, default)
+        # end if not packable
+        slot = self._find(key)
+        if self._keys[slot] != key:
+            return default
+        # end if not claimed
+        owner = self._owners[slot]
+        self._keys[slot] = DELETED
+        self._owners[slot] = None
+        self._used -= 1
+        return owner
+    # end def pop
+
+    def clear(self):
+        """Release all claims."""
+        self._allocate(8)
+        self._others.clear()
+    # end def clear
+
+    def _pack(self, abbreviation):
+        """Return the packed abbreviation and remember it for the next
+        lookup.
+
+        @param abbreviation <str> Abbreviation to pack
+        """
+        if abbreviation is not self._text:
+            self._text = abbreviation
+            self._key = pack(abbreviation)
+        # end if not packed before
+        return self._key
+    # end def _pack
+
+    def _allocate(self, size):
+        """Replace the table by an empty one of the given number of slots.
+
+        @param size <int> Number of slots, a power of two
+        """
+        self._keys = array(_TYPECODE, [EMPTY]) * size
+        self._owners = [None] * size
+        self._shift = 64 - size.bit_length() + 1
+        self._used = 0
+        # Slots holding a key or a deleted marker
+        self._filled = 0
+    # end def _allocate
+
+    def _find(self, key):
+        """Return the slot holding the key or the slot to insert it, the
+        first deleted slot passed or the empty slot ending the probe.
+
+        @param key <int> Packed abbreviation
+        """
+        keys = self._keys
+        mask = len(keys) - 1
+        slot = ((key * _MULTIPLIER) & _MASK64) >> self._shift
+        free = None
+        while True:
+            current = keys[slot]
+            if current == key:
+                return slot
+            elif current == EMPTY:
+                return slot if free is None else free
+            elif current == DELETED and free is None:
+                free = slot
+            # end if probe ends
+            slot = (slot + 1) & mask
+        # end while probe linearly
+    # end def _find
+
+    def _resize(self):
+        """Rehash the claimed keys into a table twice their number."""
+        keys, owners, used = self._keys, self._owners, self._used
+        size = 8
+        while size < used * 2:
+            size <<= 1
+        # end while keep the keys below half of the slots
+        self._allocate(size)
+        table, targets = self._keys, self._owners
+        mask, shift = size - 1, self._shift
+        for position, key in enumerate(keys):
+            if key <= DELETED:
+                continue
+            # end if no claim
+            slot = ((key * _MULTIPLIER) & _MASK64) >> shift
+            while table[slot] != EMPTY:
+                slot = (slot + 1) & mask
+            # end while probe linearly
+            table[slot] = key
+            targets[slot] = owners[position]
+        # end for move claims
+        self._used = self._filled = used
+    # end def _resize
+# end class PackedIndex
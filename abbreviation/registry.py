@@ -0,0 +1,452 @@
+"""
+@package: abbreviation.registry
+@brief: Persistent word and abbreviation registry opened via mmap
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+File layout, all integers little endian:
+
+    header   magic, capacity, count and end of data, padded to 64 bytes
+    words    capacity slots with the offset of a record, 0 is empty
+    abbrs    capacity slots with the offset of a record, 0 is empty
+    data     records appended one after another: word length, abbreviation
+             length, utf-8 word, utf-8 abbreviation
+
+Both slot tables are open addressing hash tables with linear probing, the
+first keyed by word, the second by abbreviation. Records are only ever
+appended, the tables grow by rewriting the file once they are half full.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+
+from abbreviation import UPPERCASE, Abbreviation
+from abbreviation.resolver import Resolver
+
+MAGIC = b'ABBRREG1'
+HEADER = struct.Struct('<8sQQQ')
+HEADER_SIZE = 64
+SLOT = struct.Struct('<Q')
+RECORD = struct.Struct('<HH')
+GROWTH = 1 << 20
+
+
+class _RegistryIndex(object):
+
+    """Collision index of a Resolver backed by the registry.
+
+    Persisted abbreviations are looked up in the registry, new claims are
+    kept in memory until the registry stores them.
+    """
+
+    def __init__(self, registry):
+        """Initialize _RegistryIndex class.
+
+        @param registry <AbbreviationRegistry> Registry to look up
+        """
+        self._registry = registry
+        self._pending = dict()
+    # end def __init__
+
+    def __contains__(self, abbreviation):
+        """Return True if the abbreviation is persisted or claimed.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        return self.get(abbreviation) is not None
+    # end def __contains__
+
+    def __len__(self):
+        """Return the number of persisted and claimed abbreviations."""
+        return len(self._registry) + len(self._pending)
+    # end def __len__
+
+    def __setitem__(self, abbreviation, word):
+        """Claim the abbreviation for the word.
+
+        @param abbreviation <str> Abbreviation to claim
+        @param word <str> Owner of the abbreviation
+        """
+        self._pending[abbreviation] = word
+    # end def __setitem__
+
+    def get(self, abbreviation, default=None):
+        """Return the owner of the abbreviation or the default.
+
+        @param abbreviation <str> Abbreviation to look up
+        @param default <object> Returned if the abbreviation is free
+        """
+        owner = self._pending.get(abbreviation)
+        if owner is None:
+            owner = self._registry.owner(abbreviation)
+        # end if not claimed in memory
+        return default if owner is None else owner
+    # end def get
+
+    def pop(self, abbreviation, default=None):
+        """Release a claim that is not persisted yet.
+
+        @param abbreviation <str> Abbreviation to release
+        @param default <object> Returned if there is no such claim
+        """
+        return self._pending.pop(abbreviation, default)
+    # end def pop
+
+    def clear(self):
+        """Release all claims that are not persisted yet."""
+        self._pending.clear()
+    # end def clear
+# end class _RegistryIndex
+
+
+class AbbreviationRegistry(object):
+
+    """Persistent mapping of words to abbreviations and back.
+
+    Opening a registry only maps the file, nothing is loaded. Once stored, a
+    word keeps its abbreviation in every later run, and new words are
+    deduplicated against all persisted abbreviations. Words are stored
+    normalized by the engine, like the keys of its results, so L_arm and
+    L-arm are the same word.
+    """
+
+    def __init__(self, path, abbreviation=None, capacity=1024,
+                 readonly=False):
+        """Initialize AbbreviationRegistry class, create the file if needed.
+
+        @param path <str> Path of the registry file
+        @param abbreviation <Abbreviation> Engine abbreviating new words
+        @param capacity <int> Initial number of slots of a new registry
+        @param readonly <bool> Open for lookups only
+        """
+        if abbreviation is None:
+            abbreviation = Abbreviation()
+        # end if create default engine
+        self._path = path
+        self._abbreviation = abbreviation
+        self._readonly = readonly
+        self._file = None
+        self._map = None
+        if not os.path.exists(path):
+            if readonly:
+                raise IOError('registry: file does not exist %s' % path)
+            # end if nothing to read
+            self._create(path, max(capacity, 8))
+        # end if create registry
+        self._open()
+    # end def __init__
+
+    def __enter__(self):
+        """Return the registry for a with statement."""
+        return self
+    # end def __enter__
+
+    def __exit__(self, *args):
+        """Close the registry at the end of a with statement."""
+        self.close()
+    # end def __exit__
+
+    def __len__(self):
+        """Return the number of stored words."""
+        return self._count
+    # end def __len__
+
+    def __contains__(self, word):
+        """Return True if the word is stored.
+
+        @param word <str> Word to look up
+        """
+        return self.get(word) is not None
+    # end def __contains__
+
+    def __iter__(self):
+        """Yield the stored words in insertion order."""
+        for word, _ in self.items():
+            yield word
+        # end for iterate records
+    # end def __iter__
+
+    def items(self):
+        """Yield the stored (word, abbreviation) pairs in insertion order."""
+        offset = self._data_start
+        while offset < self._data_end:
+            word, abbreviation, offset = self._read(offset)
+            yield word, abbreviation
+        # end while iterate records
+    # end def items
+
+    def get(self, word, default=None):
+        """Return the abbreviation of the word or the default.
+
+        @param word <str> Word to look up, normalized by the engine
+        @param default <object> Returned if the word is not stored
+        """
+        word = self._abbreviation._check_word(word)
+        offset = self._find(0, word.encode('utf-8'))
+        if offset is None:
+            return default
+        # end if word not stored
+        return self._read(offset)[1]
+    # end def get
+
+    def owner(self, abbreviation):
+        """Return the word owning the abbreviation or None.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        offset = self._find(1, abbreviation.encode('utf-8'))
+        if offset is None:
+            return None
+        # end if abbreviation not stored
+        return self._read(offset)[0]
+    # end def owner
+
+    def add(self, word, abbreviation):
+        """Append the word and its abbreviation to the registry.
+
+        @param word <str> Word to store, normalized by the engine
+        @param abbreviation <str> Abbreviation of the word
+        """
+        if self._readonly:
+            raise IOError('registry: opened readonly %s' % self._path)
+        # end if readonly
+        word = self._abbreviation._check_word(word)
+        stored = self.get(word)
+        if stored is not None:
+            if stored != abbreviation:
+                msg = 'registry: %s is stored as %s' % (word, stored)
+                raise ValueError(msg)
+            # end if conflicting abbreviation
+            return
+        # end if already stored
+        owner = self.owner(abbreviation)
+        if owner is not None:
+            msg = 'registry: %s is owned by %s' % (abbreviation, owner)
+            raise ValueError(msg)
+        # end if abbreviation taken
+        if (self._count + 1) * 2 > self._capacity:
+            self._grow()
+        # end if tables half full
+        word_bytes = word.encode('utf-8')
+        abbreviation_bytes = abbreviation.encode('utf-8')
+        size = RECORD.size + len(word_bytes) + len(abbreviation_bytes)
+        offset = self._data_end
+        self._reserve(offset + size)
+        RECORD.pack_into(self._map, offset, len(word_bytes),
+                         len(abbreviation_bytes))
+        start = offset + RECORD.size
+        self._map[start:offset + size] = word_bytes + abbreviation_bytes
+        self._insert(0, word_bytes, offset)
+        self._insert(1, abbreviation_bytes, offset)
+        self._count += 1
+        self._data_end = offset + size
+        self._write_header()
+    # end def add
+
+    def assign(self, words, casemode=UPPERCASE, length=3):
+        """Return the abbreviations of the words, storing the new ones.
+
+        Stored words keep their abbreviation. New words are abbreviated in
+        order and deduplicated against every stored abbreviation. Words
+        without a free candidate are returned but not stored.
+
+        @param words <list> List of string elements
+        @param casemode <const> Casemode of new abbreviations
+        @param length <int> Length of new abbreviations
+        """
+        words = list(words)
+        new = [word for word in words if word not in self]
+        resolver = Resolver(self._abbreviation._candidates,
+                            index=_RegistryIndex(self))
+        stream = self._abbreviation.abbreviate_stream(new, casemode, length,
+                                                      resolver)
+        result = dict()
+        for word, (_, abbreviation) in zip(new, stream):
+            result[word] = abbreviation
+            if self.owner(abbreviation) is None:
+                self.add(word, abbreviation)
+            # end if store resolved word
+        # end for store new words
+        return dict((word, result.get(word) or self.get(word))
+                    for word in words)
+    # end def assign
+
+    def flush(self):
+        """Write all changes to disk."""
+        if self._map is not None and not self._readonly:
+            self._map.flush()
+        # end if writable
+    # end def flush
+
+    def close(self):
+        """Flush and close the registry file."""
+        if self._map is None:
+            return
+        # end if already closed
+        self.flush()
+        self._map.close()
+        self._file.close()
+        self._map = None
+        self._file = None
+    # end def close
+
+    def _create(self, path, capacity):
+        """Write an empty registry file.
+
+        @param path <str> Path of the registry file
+        @param capacity <int> Number of slots, rounded up to a power of two
+        """
+        size = 8
+        while size < capacity:
+            size <<= 1
+        # end while round up capacity
+        data_start = HEADER_SIZE + 2 * SLOT.size * size
+        with open(path, 'wb') as registry:
+            registry.write(HEADER.pack(MAGIC, size, 0, data_start))
+            registry.truncate(data_start + GROWTH)
+        # end with write empty registry
+    # end def _create
+
+    def _open(self):
+        """Map the registry file and read its header."""
+        self._file = open(self._path, 'rb' if self._readonly else 'r+b')
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+        magic, capacity, count, data_end = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError('registry: not a registry file %s' % self._path)
+        # end if check magic
+        self._capacity = capacity
+        self._count = count
+        self._data_end = data_end
+        self._data_start = HEADER_SIZE + 2 * SLOT.size * capacity
+    # end def _open
+
+    def _write_header(self):
+        """Write the current counters into the header."""
+        HEADER.pack_into(self._map, 0, MAGIC, self._capacity, self._count,
+                         self._data_end)
+    # end def _write_header
+
+    def _read(self, offset):
+        """Return word, abbreviation and the offset of the next record.
+
+        @param offset <int> Offset of the record
+        """
+        word_length, abbreviation_length = RECORD.unpack_from(self._map,
+                                                              offset)
+        start = offset + RECORD.size
+        middle = start + word_length
+        end = middle + abbreviation_length
+        return (self._map[start:middle].decode('utf-8'),
+                self._map[middle:end].decode('utf-8'), end)
+    # end def _read
+
+    def _key(self, table, offset):
+        """Return the key bytes of the record in the given table.
+
+        @param table <int> 0 for the word table, 1 for the abbreviation table
+        @param offset <int> Offset of the record
+        """
+        word_length, abbreviation_length = RECORD.unpack_from(self._map,
+                                                              offset)
+        start = offset + RECORD.size
+        if table:
+            start += word_length
+            return self._map[start:start + abbreviation_length]
+        # end if abbreviation key
+        return self._map[start:start + word_length]
+    # end def _key
+
+    def _slots(self, table, key):
+        """Yield the slot positions to probe for the key.
+
+        @param table <int> 0 for the word table, 1 for the abbreviation table
+        @param key <bytes> Key to look up
+        """
+        mask = self._capacity - 1
+        base = HEADER_SIZE + table * SLOT.size * self._capacity
+        index = zlib.crc32(key) & mask
+        while True:
+            yield base + index * SLOT.size
+            index = (index + 1) & mask
+        # end while linear probing
+    # end def _slots
+
+    def _find(self, table, key):
+        """Return the offset of the record with the key or None.
+
+        @param table <int> 0 for the word table, 1 for the abbreviation table
+        @param key <bytes> Key to look up
+        """
+        for position in self._slots(table, key):
+            offset = SLOT.unpack_from(self._map, position)[0]
+            if not offset:
+                return None
+            # end if empty slot
+            if self._key(table, offset) == key:
+                return offset
+            # end if key found
+        # end for probe slots
+    # end def _find
+
+    def _insert(self, table, key, offset):
+        """Store the record offset in the first free slot of the key.
+
+        @param table <int> 0 for the word table, 1 for the abbreviation table
+        @param key <bytes> Key of the record
+        @param offset <int> Offset of the record
+        """
+        for position in self._slots(table, key):
+            if not SLOT.unpack_from(self._map, position)[0]:
+                SLOT.pack_into(self._map, position, offset)
+                return
+            # end if empty slot
+        # end for probe slots
+    # end def _insert
+
+    def _reserve(self, size):
+        """Grow the file so that it holds at least the given size.
+
+        @param size <int> Required size of the file
+        """
+        if size <= len(self._map):
+            return
+        # end if large enough
+        size = max(size, 2 * len(self._map))
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0,
+                              access=mmap.ACCESS_WRITE)
+    # end def _reserve
+
+    def _grow(self):
+        """Rewrite the registry with twice the number of slots."""
+        records = self._map[self._data_start:self._data_end]
+        path = '%s.tmp' % self._path
+        self._create(path, self._capacity * 2)
+        self.close()
+        getattr(os, 'replace', os.rename)(path, self._path)
+        self._open()
+        self._reserve(self._data_start + len(records))
+        self._map[self._data_start:self._data_start + len(records)] = records
+        offset = self._data_start
+        end = self._data_start + len(records)
+        while offset < end:
+            word_length, abbreviation_length = RECORD.unpack_from(self._map,
+                                                                  offset)
+            start = offset + RECORD.size
+            middle = start + word_length
+            self._insert(0, self._map[start:middle], offset)
+            self._insert(1, self._map[middle:middle + abbreviation_length],
+                         offset)
+            self._count += 1
+            offset = middle + abbreviation_length
+        # end while index records
+        self._data_end = end
+        self._write_header()
+    # end def _grow
+# end class AbbreviationRegistry
@@ -0,0 +1,249 @@
+"""
+@package: abbreviation.resolver
+@brief: Indexed collision engine used to deduplicate abbreviations
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+from collections import OrderedDict
+
+from abbreviation.trie import PrefixTrie
+
+
+class Resolver(object):
+
+    """Resolve abbreviation collisions with a reverse index.
+
+    The index maps every claimed abbreviation to its owner word, so each
+    candidate is checked in constant time instead of scanning all values.
+    The reserved mapping holds abbreviations owned in advance, for example
+    the excluded abbreviations. It is shared and never modified. An engine
+    sets the candidates and the reserved mapping of its call before each
+    resolve, so a resolver can be shared by calls of different lengths.
+    A resolver is not thread safe, each thread needs its own.
+    """
+
+    # members of a used up family without a free differing candidate in a
+    # row, after which the family is saturated and its remaining members
+    # are unresolved without examining their candidates
+    saturation = 32
+
+    def __init__(self, candidates, max_size=None, index=None):
+        """Initialize Resolver class.
+
+        @param candidates <function> Called with a word, its first choice and
+                                     the index of its differing chars,
+                                     returns the alternative abbreviations
+                                     in priority order
+        @param max_size <int> Maximum number of claims, the oldest claims are
+                              released first. None keeps all claims
+        @param index <dict> Mapping of claimed abbreviations to their owners,
+                            a new dict if None
+        """
+        self.candidates = candidates
+        self._max_size = max_size
+        if index is None:
+            index = dict() if max_size is None else OrderedDict()
+        # end if create index
+        self._owners = index
+        # Set while resolving, claims of the running call are never released
+        self._deferred = False
+        self.reserved = dict()
+        self.unresolved = dict()
+        # Number of words losing their first choice and candidates tried
+        self.collisions = 0
+        self.retries = 0
+    # end def __init__
+
+    def __contains__(self, abbreviation):
+        """Return True if the given abbreviation is already claimed.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        return abbreviation in self._owners or abbreviation in self.reserved
+    # end def __contains__
+
+    def __len__(self):
+        """Return the number of claimed abbreviations."""
+        return len(self._owners)
+    # end def __len__
+
+    def owner(self, abbreviation):
+        """Return the word owning the given abbreviation or None.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        owner = self._owners.get(abbreviation)
+        if owner is None:
+            return self.reserved.get(abbreviation)
+        # end if not claimed
+        return owner
+    # end def owner
+
+    def reserve(self, word, abbreviation):
+        """Pin the abbreviation to the word regardless of previous claims.
+
+        @param word <str> Owner of the abbreviation
+        @param abbreviation <str> Reserved abbreviation
+        """
+        self._owners.pop(abbreviation, None)
+        self._owners[abbreviation] = word
+        self._limit()
+    # end def reserve
+
+    def claim(self, word, abbreviation):
+        """Claim the abbreviation for the word, return False if another word
+        owns it already.
+
+        @param word <str> Owner of the abbreviation
+        @param abbreviation <str> Abbreviation to claim
+        """
+        owner = self.owner(abbreviation)
+        if owner is not None and owner != word:
+            return False
+        # end if claimed by another word
+        if abbreviation not in self._owners:
+            self._owners[abbreviation] = word
+            self._limit()
+        # end if add new claim
+        return True
+    # end def claim
+
+    def assign(self, word, abbreviation, start=0):
+        """Claim the first choice or the first free candidate of the word.
+
+        Return the claimed abbreviation or None if every candidate is taken.
+
+        @param word <str> Word the abbreviation was created from
+        @param abbreviation <str> First choice abbreviation of the word
+        @param start <int> Index of the chars telling the word apart from
+                           its family, candidates use one of them
+        """
+        if self.claim(word, abbreviation):
+            return abbreviation
+        # end if first choice is free
+        tried = 0
+        candidates = self.candidates(word, abbreviation, start)
+        for tried, candidate in enumerate(candidates, 1):
+            if self.claim(word, candidate):
+                self.retries += tried
+                return candidate
+            # end if candidate is free
+        # end for iterate candidates
+        self.retries += tried
+        return None
+    # end def assign
+
+    def release(self, abbreviation):
+        """Release the given abbreviation so other words can claim it.
+
+        @param abbreviation <str> Abbreviation to release
+        """
+        self._owners.pop(abbreviation, None)
+    # end def release
+
+    def clear(self):
+        """Release all claims."""
+        self._owners.clear()
+        self.unresolved.clear()
+    # end def clear
+
+    def _limit(self):
+        """Release the oldest claims exceeding the maximum size."""
+        if self._max_size is None or self._deferred:
+            return
+        # end if unbounded or resolving
+        while len(self._owners) > self._max_size:
+            self._owners.popitem(last=False)
+        # end while release oldest claims
+    # end def _limit
+
+    def resolve(self, result, reserved=()):
+        """Deduplicate the given dictionary in place and return it.
+
+        Claims beyond the maximum size are only released once the whole
+        dictionary is resolved, so a call never hands out an abbreviation
+        it released itself.
+
+        @param result <dict> Words as keys and first choices as values
+        @param reserved <list> Words whose abbreviation must not change
+        """
+        self._deferred = True
+        try:
+            self._resolve(result, reserved)
+        finally:
+            self._deferred = False
+            self._limit()
+        # end try release after resolving
+        return result
+    # end def resolve
+
+    def _resolve(self, result, reserved):
+        """Deduplicate the given dictionary in place.
+
+        First choices are claimed in order, so the first word keeps its
+        abbreviation. Remaining words sharing a first choice are a family,
+        a prefix trie of the family tells where each word differs from the
+        others and the word takes its first free candidate using those
+        chars, so the family does not fight over the chars it shares.
+        Without such a candidate any free candidate is taken, words
+        without one are stored in unresolved. Once a member found no free
+        candidate at all, the shared chars of its family are used up and
+        the following members only try their differing chars, and once
+        saturation of them in a row found none, the family is saturated
+        and its remaining members are unresolved right away.
+
+        @param result <dict> Words as keys and first choices as values
+        @param reserved <list> Words whose abbreviation must not change
+        """
+        reserved = set(reserved)
+        for word in reserved:
+            self.reserve(word, result[word])
+        # end for reserve pinned words
+        pending = list()
+        families = dict()
+        for word, abbreviation in result.items():
+            if word in reserved or self.claim(word, abbreviation):
+                continue
+            # end if first choice is free
+            pending.append(word)
+            families.setdefault(abbreviation, list()).append(word)
+        # end for claim first choices
+        self.collisions += len(pending)
+        tries = dict()
+        for abbreviation, family in families.items():
+            tries[abbreviation] = PrefixTrie(family)
+            tries[abbreviation].add(self.owner(abbreviation))
+        # end for index families
+        exhausted = set()
+        misses = dict()
+        for word in pending:
+            first = result[word]
+            start = tries[first].branch(word)
+            branch = (first, word[start:start + 1])
+            if misses.get(branch, 0) >= self.saturation:
+                self.unresolved[word] = first
+                continue
+            # end if branch is saturated
+            abbreviation = None
+            if start < len(word):
+                abbreviation = self.assign(word, first, start)
+            # end if word has differing chars
+            if abbreviation is None and first not in exhausted:
+                abbreviation = self.assign(word, first)
+                if abbreviation is None:
+                    exhausted.add(first)
+                # end if shared chars are used up
+            # end if fall back to all candidates
+            if first in exhausted:
+                misses[branch] = 0 if abbreviation else misses.get(
+                    branch, 0) + 1
+            # end if count the misses of a used up family
+            if abbreviation is None:
+                self.unresolved[word] = result[word]
+            else:
+                result[word] = abbreviation
+            # end if no free candidate
+        # end for resolve collisions
+    # end def _resolve
+# end class Resolver
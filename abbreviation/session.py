@@ -0,0 +1,91 @@
+"""
+@package: abbreviation.session
+@brief: Explicit scope of abbreviations shared by successive calls
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+
+class AbbreviationSession(object):
+
+    """Session running successive abbreviation calls on one engine.
+
+    Every call of an Abbreviation instance is independent. A session opts
+    into a shared scope instead: with reserve set, abbreviations handed out
+    by earlier calls are reserved and later calls avoid them. The scope
+    holds at most max_size abbreviations and reset() empties it.
+    """
+
+    def __init__(self, abbreviation=None, reserve=False, max_size=None):
+        """Initialize AbbreviationSession class.
+
+        @param abbreviation <Abbreviation> Engine to run, a default if None
+        @param reserve <bool> Deduplicate against the previous calls
+        @param max_size <int> Maximum number of reserved abbreviations, the
+                              oldest are released first. None is unbounded
+        """
+        if abbreviation is None:
+            from abbreviation import Abbreviation
+            abbreviation = Abbreviation()
+        # end if create default engine
+        self._abbreviation = abbreviation
+        self._reserve = reserve
+        self._resolver = None
+        if reserve:
+            self._resolver = abbreviation._create_resolver(
+                abbreviation._candidates, max_size)
+        # end if opt into reserved scope
+    # end def __init__
+
+    def __len__(self):
+        """Return the number of reserved abbreviations."""
+        if self._resolver is None:
+            return 0
+        # end if no reserved scope
+        return len(self._resolver)
+    # end def __len__
+
+    def __contains__(self, abbreviation):
+        """Return True if the abbreviation is reserved in this session.
+
+        @param abbreviation <str> Abbreviation to look up
+        """
+        return self._resolver is not None and abbreviation in self._resolver
+    # end def __contains__
+
+    @property
+    def unresolved(self):
+        """Return the words of the last call that are still duplicated."""
+        if self._resolver is None:
+            return dict()
+        # end if no reserved scope
+        return dict(self._resolver.unresolved)
+    # end def unresolved
+
+    def abbreviate(self, word, *args, **kwargs):
+        """Abbreviate the word within the session scope.
+
+        @param word <str> string element
+        @see Abbreviation.abbreviate for the remaining arguments
+        """
+        kwargs['resolver'] = self._resolver
+        return self._abbreviation.abbreviate(word, *args, **kwargs)
+    # end def abbreviate
+
+    def abbreviate_multiple(self, words, *args, **kwargs):
+        """Abbreviate the words within the session scope.
+
+        @param words <list> List of string elements
+        @see Abbreviation.abbreviate_multiple for the remaining arguments
+        """
+        kwargs['resolver'] = self._resolver
+        return self._abbreviation.abbreviate_multiple(words, *args, **kwargs)
+    # end def abbreviate_multiple
+
+    def reset(self):
+        """Release all reserved abbreviations of the session."""
+        if self._resolver is not None:
+            self._resolver.clear()
+        # end if clear reserved scope
+    # end def reset
+# end class AbbreviationSession
@@ -0,0 +1,316 @@
+"""
+@package: abbreviation.shard
+@brief: Deduplicate a vocabulary in shards and merge the partial states
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+A sharded run has three steps, each step only needs the output of the
+previous one, so they can run in different processes or on different
+machines:
+
+    partition      Create the first choices of any slice of the words and
+                   split them into shards by first choice
+    resolve_shard  Resolve the collisions of one shard on its own and
+                   return its ShardState, serializable with to_dict
+    merge_shards   Combine the states of all shards into one result
+
+Words sharing a first choice always end up in the same shard, and words
+only move to candidates of their own shard, so the abbreviations of the
+shards never collide. The merge only resolves the words a shard left
+unresolved, in input order against all claims. The result only depends
+on the words, their order and the number of shards.
+"""
+
+import zlib
+
+from abbreviation import UPPERCASE, Abbreviation, _ordered_dict, batch
+from abbreviation.resolver import Resolver
+
+
+def shard_of(abbreviation, shards):
+    """Return the shard owning an abbreviation, stable across processes.
+
+    @param abbreviation <str> First choice or candidate
+    @param shards <int> Number of shards
+    """
+    # Python 2 returns a signed checksum
+    return (zlib.crc32(abbreviation.encode('utf-8')) & 0xffffffff) % shards
+# end def shard_of
+
+
+class ShardState(object):
+
+    """Partial deduplication state of one shard.
+
+    The entries are (position, word, first choice, abbreviation) tuples in
+    input order, the position is the index of the word in the whole
+    vocabulary.
+    """
+
+    def __init__(self, shard, shards, casemode, length, entries):
+        """Initialize ShardState class.
+
+        @param shard <int> Index of the shard
+        @param shards <int> Number of shards
+        @param casemode <const> Casemode of the abbreviations
+        @param length <int> Length of the abbreviated letters
+        @param entries <list> Resolved words of the shard
+        """
+        self.shard = shard
+        self.shards = shards
+        self.casemode = casemode
+        self.length = length
+        self.entries = entries
+    # end def __init__
+
+    def to_dict(self):
+        """Return the state as a dict of plain values, e.g. to dump it as
+        JSON."""
+        return {'shard': self.shard, 'shards': self.shards,
+                'casemode': self.casemode, 'length': self.length,
+                'entries': [list(entry) for entry in self.entries]}
+    # end def to_dict
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return the state of a dict created by to_dict.
+
+        @param data <dict> Plain values of the state
+        """
+        return cls(data['shard'], data['shards'], data['casemode'],
+                   data['length'], [tuple(entry) for entry in data['entries']])
+    # end def from_dict
+# end class ShardState
+
+
+def partition(abbreviation, words, shards, casemode=UPPERCASE, length=3,
+              start=0):
+    """Return the first choices of the words split into shards.
+
+    Each shard is a list of (position, word, first choice, excluded)
+    entries, excluded is True if the first choice is the excluded
+    abbreviation of the word.
+
+    @param abbreviation <Abbreviation> Engine creating the first choices
+    @param words <list> List of string elements
+    @param shards <int> Number of shards
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    @param start <int> Position of the first word in the whole vocabulary
+    """
+    call = abbreviation._context(casemode, length)
+    if call is None:
+        return None
+    # end if invalid length
+    parts = [list() for _ in range(shards)]
+    excluded = dict()
+    for position, word in enumerate(words, start):
+        if abbreviation._check_exclusion(word, excluded, call):
+            first = excluded.pop(word)
+            parts[shard_of(first, shards)].append((position, word, first,
+                                                   True))
+            continue
+        # end if skip exclusion
+        word, first = abbreviation._first_choice(word, call)
+        parts[shard_of(first, shards)].append((position, word, first, False))
+    # end for iterate words
+    return parts
+# end def partition
+
+
+def resolve_shard(abbreviation, entries, shard, shards, casemode=UPPERCASE,
+                  length=3):
+    """Resolve the collisions of one shard and return its ShardState.
+
+    The shard is deduplicated like abbreviate_multiple, repeated words
+    keep their first position. Words only move to candidates of their own
+    shard, so the shards never claim the same abbreviation. Words without
+    such a candidate keep their first choice, the merge resolves them.
+
+    @param abbreviation <Abbreviation> Engine resolving the collisions
+    @param entries <list> Entries of the shard created by partition, in
+                          any order
+    @param shard <int> Index of the shard
+    @param shards <int> Number of shards
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    """
+    call = abbreviation._context(casemode, length)
+    if call is None:
+        return None
+    # end if invalid length
+    result = _ordered_dict()
+    positions = dict()
+    reserved = list()
+    for position, word, first, excluded in sorted(entries):
+        if word in result:
+            continue
+        # end if repeated word
+        result[word] = first
+        positions[word] = position
+        if excluded:
+            reserved.append(word)
+        # end if pinned word
+    # end for collect words in input order
+
+    def candidates(word, first, start=0):
+        """Return the candidates of the word owned by the shard."""
+        return (candidate
+                for candidate in call.candidates(word, first, start)
+                if shard_of(candidate, shards) == shard)
+    # end def candidates
+
+    firsts = dict(result)
+    resolver = abbreviation._create_resolver(candidates)
+    resolver.reserved = abbreviation._reserved.get(length, dict())
+    resolver.resolve(result, reserved)
+    return ShardState(shard, shards, casemode, length,
+                      [(positions[word], word, firsts[word], value)
+                       for word, value in result.items()])
+# end def resolve_shard
+
+
+def merge_shards(states, abbreviation=None):
+    """Combine the states of all shards and return the deduplicated words.
+
+    The abbreviations of the shards are claimed in input order. Words
+    that lost theirs, the words a shard left unresolved, then take their
+    first free candidate of any shard, or keep their first choice if
+    there is none. Like in Resolver.resolve, once a word found no free
+    candidate the following words of its first choice keep theirs.
+
+    @param states <list> One ShardState of each shard of the same call,
+                         in any order
+    @param abbreviation <Abbreviation> Engine of the shards, a default one
+                                       if None
+    """
+    if abbreviation is None:
+        abbreviation = Abbreviation()
+    # end if create default engine
+    if not states:
+        return [] if abbreviation._output == 'list' else dict()
+    # end if nothing to merge
+    first = states[0]
+    key = (first.shards, first.casemode, first.length)
+    if (sorted(state.shard for state in states) != list(range(first.shards))
+            or any((state.shards, state.casemode, state.length) != key
+                   for state in states)):
+        raise ValueError('states: Give one state of each shard of the same '
+                         'call!')
+    # end if incomplete states
+    call = abbreviation._context(first.casemode, first.length)
+    resolver = Resolver(call.candidates)
+    resolver.reserved = abbreviation._reserved.get(first.length, dict())
+    entries = sorted(entry for state in states for entry in state.entries)
+    result = _ordered_dict()
+    pending = list()
+    for position, word, first_choice, value in entries:
+        result[word] = value
+        if not resolver.claim(word, value):
+            pending.append((word, first_choice))
+        # end if claimed by an earlier word
+    # end for claim abbreviations of the shards
+    exhausted = set()
+    for word, first_choice in pending:
+        value = None
+        if first_choice not in exhausted:
+            value = resolver.assign(word, first_choice)
+        # end if family may have free candidates
+        if value is None:
+            exhausted.add(first_choice)
+            value = first_choice
+        # end if no free candidate
+        result[word] = value
+    # end for resolve remaining collisions
+    if abbreviation._output == 'list':
+        result = [[key, value] for key, value in result.items()]
+    # end if output list
+    return result
+# end def merge_shards
+
+
+def _partition_task(task):
+    """Partition a slice of the words on the engine of the worker process.
+
+    @param task <tuple> Words, number of shards, casemode, length and the
+                        position of the first word
+    """
+    return partition(batch._engine, *task)
+# end def _partition_task
+
+
+def _resolve_task(task):
+    """Resolve one shard on the engine of the worker process.
+
+    @param task <tuple> Entries, shard, number of shards, casemode and
+                        length
+    """
+    return resolve_shard(batch._engine, *task)
+# end def _resolve_task
+
+
+def abbreviate_sharded(words, shards=None, workers=None, casemode=UPPERCASE,
+                       length=3, chunksize=None, **options):
+    """Deduplicate the words in shards on a process pool and merge them.
+
+    The words are partitioned in slices, every shard is resolved by one
+    task and the current process merges the states. The result is the
+    same for any number of workers, but may differ from
+    abbreviate_multiple and between numbers of shards where words moved
+    to a candidate.
+
+    @param words <list> List of string elements
+    @param shards <int> Number of shards, the number of workers if None
+    @param workers <int> Number of processes, the number of cpus if None.
+                         1 runs in the current process
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    @param chunksize <int> Number of words partitioned by one task
+    @param options <dict> Keyword arguments of the Abbreviation class
+    """
+    engine = Abbreviation(**options)
+    if workers is None:
+        workers = batch._cpu_count()
+    # end if use all cpus
+    if shards is None:
+        shards = workers
+    # end if one shard per worker
+    if engine._context(casemode, length) is None:
+        return None
+    # end if invalid length
+    words = list(words)
+    if chunksize is None:
+        chunksize = max(1, len(words) // (workers * 4))
+    # end if spread four slices per worker
+    tasks = [(words[start:start + chunksize], shards, casemode, length,
+              start) for start in range(0, len(words), chunksize)]
+    if workers < 2:
+        parts = [partition(engine, *task) for task in tasks]
+        states = [resolve_shard(engine, *task)
+                  for task in _shard_tasks(parts, shards, casemode, length)]
+        return merge_shards(states, engine)
+    # end if run in the current process
+    pool = batch._process_pool(workers, options)
+    try:
+        parts = pool.map(_partition_task, tasks)
+        states = pool.map(_resolve_task, _shard_tasks(parts, shards,
+                                                      casemode, length))
+    finally:
+        pool.terminate()
+        pool.join()
+    # end try process pool
+    return merge_shards(states, engine)
+# end def abbreviate_sharded
+
+
+def _shard_tasks(parts, shards, casemode, length):
+    """Return the resolve tasks of the shards of the partitioned slices.
+
+    @param parts <list> Shards of each slice created by partition
+    @param shards <int> Number of shards
+    @param casemode <const> Casemode of the abbreviations
+    @param length <int> Length of the abbreviated letters
+    """
+    return [([entry for part in parts for entry in part[shard]], shard,
+             shards, casemode, length) for shard in range(shards)]
+# end def _shard_tasks
@@ -0,0 +1,102 @@
+"""
+@package: abbreviation.stats
+@brief: Opt-in counters and stage timers of an abbreviation engine
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+try:
+    from time import perf_counter as default_timer
+except ImportError:
+    from time import time as default_timer
+# end try use the monotonic clock
+
+TIMERS = ('normalization', 'selection', 'dedup', 'total')
+COUNTERS = ('calls', 'words', 'exclusion_hits', 'collisions', 'retries',
+            'unresolved', 'cache_hits', 'cache_misses')
+
+
+class AbbreviationStats(object):
+
+    """Counters and stage timers of abbreviation calls.
+
+    An engine created with stats=True adds every call to its stats, the
+    call on its own is kept in last. Timers are in seconds:
+    normalization splits the special characters, selection picks the
+    chars, dedup resolves the collisions and total covers the whole call.
+    Counters hold the words, the words taking an excluded abbreviation,
+    the collisions of first choices, the candidates tried for them, the
+    words left without a unique abbreviation and the cache lookups.
+    """
+
+    def __init__(self):
+        """Initialize AbbreviationStats class."""
+        self.timers = dict.fromkeys(TIMERS, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.last = None
+        self._started = None
+    # end def __init__
+
+    def __repr__(self):
+        """Return the representation of the AbbreviationStats."""
+        return 'AbbreviationStats(%r)' % self.as_dict()
+    # end def __repr__
+
+    @property
+    def cache_hit_rate(self):
+        """Return the ratio of cache lookups that were hits."""
+        lookups = self.counters['cache_hits'] + self.counters['cache_misses']
+        return self.counters['cache_hits'] / float(lookups) if lookups else 0.0
+    # end def cache_hit_rate
+
+    @property
+    def retries_per_collision(self):
+        """Return the average number of candidates tried per collision."""
+        collisions = self.counters['collisions']
+        if not collisions:
+            return 0.0
+        # end if no collision
+        return self.counters['retries'] / float(collisions)
+    # end def retries_per_collision
+
+    def as_dict(self):
+        """Return the counters, the timers and the derived ratios as one
+        flat dict, timers are suffixed with _time."""
+        result = dict(self.counters)
+        for name, seconds in self.timers.items():
+            result['%s_time' % name] = seconds
+        # end for add timers
+        result['cache_hit_rate'] = self.cache_hit_rate
+        result['retries_per_collision'] = self.retries_per_collision
+        return result
+    # end def as_dict
+
+    def add(self, other):
+        """Add the counters and timers of other stats.
+
+        @param other <AbbreviationStats> Stats to add
+        """
+        for name, seconds in other.timers.items():
+            self.timers[name] += seconds
+        # end for add timers
+        for name, count in other.counters.items():
+            self.counters[name] += count
+        # end for add counters
+    # end def add
+
+    def reset(self):
+        """Set all counters and timers back to zero."""
+        self.__init__()
+    # end def reset
+
+    def start(self):
+        """Start the total timer of a call."""
+        self.counters['calls'] += 1
+        self._started = default_timer()
+    # end def start
+
+    def stop(self):
+        """Stop the total timer of a call."""
+        self.timers['total'] += default_timer() - self._started
+    # end def stop
+# end class AbbreviationStats
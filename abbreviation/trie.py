@@ -0,0 +1,70 @@
+"""
+@package: abbreviation.trie
+@brief: Prefix trie finding the differing chars of families of words
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+
+class PrefixTrie(object):
+
+    """Prefix trie counting the words passing through each node.
+
+    Families of similar names like Monday, Mondays and Mondayly share a
+    prefix and collide on the same abbreviation. The trie tells for each
+    word at which index it branches off from the rest of its family, the
+    chars from there on are the ones telling the words apart.
+    """
+
+    def __init__(self, words=()):
+        """Initialize PrefixTrie class.
+
+        @param words <iterable> Words to insert
+        """
+        # Each node is a list of the number of words passing and the children
+        self._root = [0, dict()]
+        for word in words:
+            self.add(word)
+        # end for insert words
+    # end def __init__
+
+    def __len__(self):
+        """Return the number of inserted words."""
+        return self._root[0]
+    # end def __len__
+
+    def add(self, word):
+        """Insert the word.
+
+        @param word <str> Word to insert
+        """
+        node = self._root
+        node[0] += 1
+        for char in word:
+            children = node[1]
+            node = children.get(char)
+            if node is None:
+                node = children[char] = [0, dict()]
+            # end if create node
+            node[0] += 1
+        # end for walk chars
+    # end def add
+
+    def branch(self, word):
+        """Return the index of the first char no other word shares.
+
+        The length of the word is returned if it is a prefix of another
+        word or inserted more than once.
+
+        @param word <str> Inserted word
+        """
+        node = self._root
+        for index, char in enumerate(word):
+            node = node[1][char]
+            if node[0] < 2:
+                return index
+            # end if only this word passes
+        # end for walk chars
+        return len(word)
+    # end def branch
+# end class PrefixTrie
@@ -1,63 +1,256 @@
 """
-@package: abbreviation
-@brief: 
-@author: 
-@contact: 
+@package: abbreviation.utility
+@brief: Word selection type the abbreviation algorithm works on
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
 """
 
 __version__ = 0000-00-00
 
+# Same chars as string.punctuation, the string module imports re
+PUNCTUATION = '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~'
+VOWELS = frozenset('aeiouAEIOU')
+LOWERCASE_VOWELS = ('a', 'e', 'i', 'o', 'u')
+SPECIAL_CHARACTERS = frozenset(PUNCTUATION)
 
-class Word(str):
-    """Custom string manipulation with extended string modification features."""
+try:
+    popcount = int.bit_count
+except AttributeError:
+    def popcount(mask):
+        """Return the number of set bits of the given mask.
 
-    def __init__(self, string):
-        """Initialize Word class"""
-        super(Word, self).__init__(string)
+        @param mask <int> Mask to count the bits of
+        """
+        return bin(mask).count('1')
+    # end def popcount
+# end try count bits in C
+
+
+def lowest_bits(mask, count):
+    """Return the given number of lowest set bits of the mask.
+
+    @param mask <int> Mask to take the bits from
+    @param count <int> Number of bits to take
+    """
+    result = 0
+    while mask and count > 0:
+        low = mask & -mask
+        result |= low
+        mask ^= low
+        count -= 1
+    # end while take lowest bit
+    return result
+# end def lowest_bits
+
+
+class Word(object):
+
+    """Selection of characters over an original string.
+
+    The selection is stored in mask as bits over the indices of string,
+    bit i set means the char at index i is selected. The numerical dict of
+    the selection, {0: 'h', 1: 'e', 2: 'l', 3: 'l', 4: 'o'}, is only built
+    on request, the algorithm itself works on the mask.
+    """
+
+    __slots__ = ('string', 'mask')
+
+    def __init__(self, string, mask=None):
+        """Initialize Word class.
+
+        @param string <str> Original string
+        @param mask <int> Selected indices as bits, all chars if None
+        """
+        self.string = string
+        if mask is None:
+            mask = (1 << len(string)) - 1
+        # end if select all chars
+        self.mask = mask
+    # end def __init__
+
+    def __repr__(self):
+        """Return the representation of the Word."""
+        return 'Word(%r, %s)' % (self.string, bin(self.mask))
+    # end def __repr__
+
+    def __str__(self):
+        """Return the selected chars in positional order."""
+        return self.convert_numerical_dict_to_string()
+    # end def __str__
+
+    def __len__(self):
+        """Return the number of selected chars."""
+        return popcount(self.mask)
+    # end def __len__
+
+    def __iter__(self):
+        """Yield the selected indices in positional order."""
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+        # end while iterate set bits
+    # end def __iter__
+
+    def __contains__(self, index):
+        """Return True if the char at the given index is selected.
+
+        @param index <int> Index in the original string
+        """
+        return bool(self.mask >> index & 1)
+    # end def __contains__
+
+    def copy(self, mask=None):
+        """Return a new Word over the same string.
+
+        @param mask <int> Selected indices of the copy, the current if None
+        """
+        return Word(self.string, self.mask if mask is None else mask)
+    # end def copy
+
+    def char_mask(self, chars):
+        """Return the selected indices holding one of the given chars.
+
+        @param chars <iterable> Chars to look for
+        """
+        mask = 0
+        for char in chars:
+            index = self.string.find(char)
+            while index != -1:
+                mask |= 1 << index
+                index = self.string.find(char, index + 1)
+            # end while find char
+        # end for iterate chars
+        return mask & self.mask
+    # end def char_mask
+
+    def upper_mask(self):
+        """Return the selected indices holding an uppercase char."""
+        mask = 0
+        for i, c in enumerate(self.string):
+            if c.isupper():
+                mask |= 1 << i
+            # end if add index
+        # end for iterate string
+        return mask & self.mask
+    # end def upper_mask
 
     def get_vowels(self):
         """Return only the vowels of a string"""
+        string = self.convert_numerical_dict_to_string()
+        return ''.join(c for c in string if c in VOWELS)
+    # end def get_vowels
 
     def get_consonants(self):
         """Return only the consonants of a string"""
+        string = self.convert_numerical_dict_to_string()
+        return ''.join(c for c in string
+                       if c.isalpha() and c not in VOWELS)
+    # end def get_consonants
 
     def remove_vowels(self):
         """Return string with removed vowels"""
+        string = self.convert_numerical_dict_to_string()
+        return ''.join(c for c in string if c not in VOWELS)
+    # end def remove_vowels
 
     def remove_consonants(self):
         """Return string with removed consonants"""
+        string = self.convert_numerical_dict_to_string()
+        return ''.join(c for c in string
+                       if not c.isalpha() or c in VOWELS)
+    # end def remove_consonants
 
     def filter_out_special_characters(self):
         """Remove and modify the string to get rid of special characters"""
+        string = self.convert_numerical_dict_to_string()
+        return ''.join(c for c in string if c not in SPECIAL_CHARACTERS)
+    # end def filter_out_special_characters
 
     def convert_string_to_numerical_dict(self):
         """Return a dict with numbers as key and each char as value"""
-        # example output
-        # {0: 'h', 1: 'e', 2: 'l', 3: 'l', 4: 'o'}
+        return dict((i, self.string[i]) for i in self)
+    # end def convert_string_to_numerical_dict
 
     def convert_numerical_dict_to_string(self):
         """Return a string from a numerical dict"""
+        if self.mask == (1 << len(self.string)) - 1:
+            return self.string
+        # end if everything selected
+        return ''.join(self.string[i] for i in self)
+    # end def convert_numerical_dict_to_string
 
     def get_numerical_dict(self):
         """Return the numerical dict"""
+        return self.convert_string_to_numerical_dict()
+    # end def get_numerical_dict
 
     def get_char_in_numerical_dict(self, key_number):
-        """Return the value of given number from numerical dict"""
+        """Return the value of given number from numerical dict
 
-    def add_char_to_string(self):
-        """Add a char to a string"""
+        @param key_number <int> Index in the original string
+        """
+        if key_number not in self:
+            return None
+        # end if index not selected
+        return self.string[key_number]
+    # end def get_char_in_numerical_dict
 
-    def remove_char_from_string(self):
-        """Remove a char from a string"""
+    def add_char_to_string(self, char):
+        """Add a char to a string
 
-    def add_char_to_numerical_dict(self):
-        """Add a char to a numerical dict"""
+        @param char <str> Char appended to the string and selected
+        """
+        self.mask |= 1 << len(self.string)
+        self.string = '%s%s' % (self.string, char)
+    # end def add_char_to_string
 
-    def remove_char_from_numerical_dict(self):
-        """Remove a char from a numerical dict"""
+    def remove_char_from_string(self, index=-1):
+        """Remove a char from a string
+
+        @param index <int> Index of the char to remove, the last if -1
+        """
+        if index < 0:
+            index += len(self.string)
+        # end if index from the end
+        low = self.mask & ((1 << index) - 1)
+        self.mask = low | (self.mask >> (index + 1) << index)
+        self.string = '%s%s' % (self.string[:index],
+                                 self.string[index + 1:])
+    # end def remove_char_from_string
+
+    def add_char_to_numerical_dict(self, key_number):
+        """Add a char to a numerical dict
+
+        @param key_number <int> Index in the original string to select
+        """
+        self.mask |= 1 << key_number
+    # end def add_char_to_numerical_dict
+
+    def remove_char_from_numerical_dict(self, key_number):
+        """Remove a char from a numerical dict
+
+        @param key_number <int> Index in the original string to deselect
+        """
+        self.mask &= ~(1 << key_number)
+    # end def remove_char_from_numerical_dict
 
     def compare_string(self, other):
-        """Compare the current string to another Word object's string"""
+        """Compare the current string to another Word object's string
+
+        @param other <Word> Word to compare with
+        """
+        return (self.convert_numerical_dict_to_string() ==
+                other.convert_numerical_dict_to_string())
+    # end def compare_string
 
     def compare_dict(self, other):
-        """Compare the current numerical dict to another Word object's dict"""
+        """Compare the current numerical dict to another Word object's dict
+
+        @param other <Word> Word to compare with
+        """
+        return (self.mask == other.mask and
+                all(self.string[i] == other.string[i] for i in self))
+    # end def compare_dict
+# end class Word
@@ -0,0 +1,153 @@
+"""
+@package: abbreviation.vectorized
+@brief: First choice abbreviations of a whole batch of words with NumPy
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+The words are encoded into a padded matrix of char codes, one row per
+word. Classifying the chars, ranking them and picking the positions
+of each abbreviation are whole matrix operations, the same ranking as
+Abbreviation._rank_word and _select_chars:
+
+    rank 0   first char and uppercase chars
+    rank 1   remaining chars
+    rank 2   the lowest remaining lowercase vowels, as many as can be
+             dropped while the abbreviation can still be filled
+
+Each row selects its chars of the lowest ranks, positions breaking ties.
+Only ASCII words are handled, so one byte holds each char. The Unicode
+case rules of str.isupper and str.upper stay with the scalar path, like
+words longer than MAX_WIDTH.
+"""
+
+import numpy
+
+from abbreviation import CAPITALIZE, LOWERCASE, UPPERCASE
+
+# Longest word encoded, longer ones go to the scalar path instead of
+# widening the matrix of their whole chunk
+MAX_WIDTH = 64
+# Number of words encoded at once, bounds the size of the matrices
+CHUNK_SIZE = 65536
+# Char classes by code, the separator ends each abbreviation of a batch
+_UPPER = numpy.zeros(256, dtype=bool)
+_UPPER[ord('A'):ord('Z') + 1] = True
+_VOWELS = numpy.zeros(256, dtype=bool)
+_VOWELS[[ord(vowel) for vowel in 'aeiou']] = True
+_SEPARATOR = '\0'
+
+
+def first_choices(words, length, casemode=UPPERCASE):
+    """Return the first choice abbreviation of each word, None for the words
+    the scalar path has to abbreviate.
+
+    @param words <list> Words without special characters
+    @param length <int> Length of the abbreviated letters
+    @param casemode <const> Casemode of the abbreviations
+    """
+    result = [None] * len(words)
+    for start in range(0, len(words), CHUNK_SIZE):
+        chunk = words[start:start + CHUNK_SIZE]
+        rows = [i for i, word in enumerate(chunk)
+                if len(word) <= MAX_WIDTH and _is_ascii(word)]
+        if not rows:
+            continue
+        # end if nothing to vectorize
+        abbreviations = _select([chunk[i] for i in rows], length, casemode)
+        for i, abbreviation in zip(rows, abbreviations):
+            result[start + i] = abbreviation
+        # end for store abbreviations
+    # end for iterate chunks
+    return result
+# end def first_choices
+
+
+def _is_ascii(word):
+    """Return True if the word holds ASCII chars only.
+
+    @param word <str> Word to check
+    """
+    try:
+        return word.isascii()
+    except AttributeError:
+        # Python before 3.7
+        return not word or ord(max(word)) < 0x80
+    # end try check in C
+# end def _is_ascii
+
+
+def _encode(words, text):
+    """Return the char codes of the ASCII words as a matrix with a column
+    per word and the lengths of the words.
+
+    The matrix is transposed, so the cumulative sums over the chars of
+    each word run over contiguous rows. Columns are padded with the
+    separator, an extra row of it follows the last char of every word.
+
+    @param words <list> ASCII words
+    @param text <str> Words joined without a separator
+    """
+    lengths = numpy.fromiter(map(len, words), dtype=numpy.intp,
+                             count=len(words))
+    width = int(lengths.max()) + 1
+    codes = numpy.full((width, len(words)), ord(_SEPARATOR),
+                       dtype=numpy.uint8)
+    starts = numpy.cumsum(lengths) - lengths
+    positions = numpy.arange(len(text)) - numpy.repeat(starts, lengths)
+    columns = numpy.repeat(numpy.arange(len(words)), lengths)
+    codes[positions, columns] = numpy.frombuffer(text.encode('ascii'),
+                                                 dtype=numpy.uint8)
+    return codes, lengths
+# end def _encode
+
+
+def _select(words, length, casemode):
+    """Return the first choice abbreviations of the ASCII words.
+
+    @param words <list> ASCII words
+    @param length <int> Length of the abbreviated letters
+    @param casemode <const> Casemode of the abbreviations
+    """
+    text = ''.join(words)
+    if _SEPARATOR in text:
+        return [None] * len(words)
+    # end if words hold the separator
+    codes, lengths = _encode(words, text)
+    rows = numpy.arange(codes.shape[0])[:, None]
+    valid = rows < lengths
+    first = valid & (_UPPER[codes] | (rows == 0))
+    rest = valid & ~first
+    vowels = rest & _VOWELS[codes]
+    size = numpy.minimum(lengths, length)
+    # Drop the lowest vowels while the remaining chars fill the rest
+    drop = rest.sum(axis=0) - size + 1
+    dropped = vowels & (numpy.cumsum(vowels, axis=0, dtype=numpy.int16) <=
+                        drop)
+    # Take the lowest chars of each rank until the abbreviation is full
+    selected = numpy.zeros(codes.shape, dtype=bool)
+    missing = size
+    for rank in (first, rest & ~dropped, dropped):
+        taken = rank & (numpy.cumsum(rank, axis=0, dtype=numpy.int16) <=
+                        missing)
+        selected |= taken
+        missing = missing - taken.sum(axis=0)
+    # end for iterate ranks
+    # End each abbreviation with the separator padding its word
+    selected[lengths, numpy.arange(len(words))] = True
+    # Indexing the transposed matrix keeps the chars of each word in order
+    text = codes.T[selected.T].tobytes().decode('ascii')
+    if casemode == UPPERCASE:
+        text = text.upper()
+    elif casemode == LOWERCASE:
+        text = text.lower()
+    elif casemode != CAPITALIZE:
+        msg = 'casemode: Use constant UPPERCASE, LOWERCASE or CAPITALIZE!'
+        raise ValueError(msg)
+    # end if setup case of all abbreviations at once
+    abbreviations = text.split(_SEPARATOR)[:-1]
+    if casemode == CAPITALIZE:
+        abbreviations = [abbreviation.capitalize()
+                         for abbreviation in abbreviations]
+    # end if capitalize each abbreviation
+    return abbreviations
+# end def _select
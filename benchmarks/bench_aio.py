@@ -0,0 +1,106 @@
+"""
+@package: benchmarks.bench_aio
+@brief: Latency and throughput of simulated async clients
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_aio.py [clients]
+
+Every client sends requests of one to four words one after another and
+waits for each answer. The direct mode calls the engine in the handler,
+the coalesced modes await an AsyncAbbreviator with different windows.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from abbreviation.aio import AsyncAbbreviator
+from benchmarks.corpus import names
+
+CLIENTS = 200
+REQUESTS = 50
+WINDOWS = (0, 0.0005, 0.002)
+
+
+def percentile(values, fraction):
+    """Return the value below which the fraction of the sorted values lie.
+
+    @param values <list> Sorted values
+    @param fraction <float> Fraction between 0 and 1
+    """
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+# end def percentile
+
+
+async def client(handler, requests, latencies):
+    """Send the requests one after another and record their latencies.
+
+    @param handler <function> Coroutine function answering a request
+    @param requests <list> Words of each request
+    @param latencies <list> Seconds of each answered request
+    """
+    for words in requests:
+        start = time.perf_counter()
+        await handler(words)
+        latencies.append(time.perf_counter() - start)
+    # end for send requests
+# end def client
+
+
+async def simulate(handler, requests):
+    """Run all clients and return the latencies and the total seconds.
+
+    @param handler <function> Coroutine function answering a request
+    @param requests <list> Requests of each client
+    """
+    latencies = list()
+    start = time.perf_counter()
+    await asyncio.gather(*[client(handler, own, latencies)
+                           for own in requests])
+    return sorted(latencies), time.perf_counter() - start
+# end def simulate
+
+
+def main(argv):
+    """Print p50/p99 latency and throughput of each mode.
+
+    @param argv <list> Optional number of clients
+    """
+    logging.disable(logging.CRITICAL)
+    clients = int(argv[0]) if argv else CLIENTS
+    corpus = names(5000)
+    rand = random.Random(0)
+    requests = [[rand.sample(corpus, rand.randint(1, 4))
+                 for _ in range(REQUESTS)] for _ in range(clients)]
+    engine = Abbreviation()
+
+    async def direct(words):
+        await asyncio.sleep(0)
+        return engine.abbreviate_multiple(words)
+    # end def direct
+
+    modes = [('direct', lambda: direct)]
+    for window in WINDOWS:
+        modes.append(('coalesced %.1fms' % (window * 1e3),
+                      lambda window=window: AsyncAbbreviator(
+                          engine, window=window).abbreviate_multiple))
+    # end for iterate windows
+    print('%d clients x %d requests' % (clients, REQUESTS))
+    for label, create in modes:
+        latencies, seconds = asyncio.run(simulate(create(), requests))
+        print('%-16s  p50 %7.2f ms  p99 %7.2f ms  %8.0f requests/s' % (
+            label, percentile(latencies, 0.5) * 1e3,
+            percentile(latencies, 0.99) * 1e3, len(latencies) / seconds))
+    # end for iterate modes
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
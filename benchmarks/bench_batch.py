@@ -0,0 +1,46 @@
+"""
+@package: benchmarks.bench_batch
+@brief: Speedup of abbreviate_batches with the number of worker processes
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_batch.py [groups] [words per group]
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation.batch import abbreviate_batches
+from benchmarks.corpus import names
+
+
+def main(argv):
+    """Run the same batch with 1 up to the number of cpus as workers.
+
+    @param argv <list> Optional number of groups and words per group
+    """
+    logging.disable(logging.CRITICAL)
+    count = int(argv[0]) if argv else 2000
+    size = int(argv[1]) if len(argv) > 1 else 50
+    groups = [names(size, seed=seed) for seed in range(count)]
+    cpus = multiprocessing.cpu_count()
+    workers = sorted(set([1, 2, 4, 8, 16, 32, cpus]))
+    baseline = None
+    for worker in [w for w in workers if w <= max(cpus, 2)]:
+        start = time.time()
+        abbreviate_batches(groups, workers=worker)
+        elapsed = time.time() - start
+        baseline = baseline or elapsed
+        print('%2d workers  %7.3f s  speedup x%.2f  (%d cpus)' % (
+            worker, elapsed, baseline / elapsed, cpus))
+    # end for iterate workers
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,60 @@
+"""
+@package: benchmarks.bench_cache
+@brief: Benefit of the abbreviation cache on a Zipf distributed workload
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_cache.py [calls]
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks.corpus import names
+
+CALLS = 200000
+VOCABULARY = 20000
+EXPONENT = 1.1
+
+
+def zipf_words(calls, seed=0):
+    """Return words drawn from the corpus with a Zipf distribution.
+
+    @param calls <int> Number of words to draw
+    @param seed <int> Seed of the random generator
+    """
+    vocabulary = names(VOCABULARY, seed=seed)
+    weights = [1.0 / (rank + 1) ** EXPONENT for rank in range(VOCABULARY)]
+    return random.Random(seed).choices(vocabulary, weights, k=calls)
+# end def zipf_words
+
+
+def main(argv):
+    """Abbreviate the workload word by word with several cache sizes.
+
+    @param argv <list> Optional number of calls
+    """
+    logging.disable(logging.CRITICAL)
+    words = zipf_words(int(argv[0]) if argv else CALLS)
+    for size in (0, 256, 1024, 4096, 16384):
+        engine = Abbreviation(cache_size=size)
+        start = time.time()
+        for word in words:
+            engine.abbreviate(word)
+        # end for iterate words
+        elapsed = time.time() - start
+        rate = engine.cache.info()['hit_rate'] if engine.cache else 0.0
+        print('cache_size %5d  %6.2f us/call  hit rate %5.1f%%' % (
+            size, elapsed / len(words) * 1e6, rate * 100))
+    # end for iterate cache sizes
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,78 @@
+"""
+@package: benchmarks.bench_candidates
+@brief: Memory of enumerating the ranked abbreviations of long words
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_candidates.py [count]
+"""
+
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+
+COUNT = 10000
+SIZES = (10, 20, 40, 80, 160)
+
+
+def measure(function):
+    """Return the result, the seconds and the peak of allocated KB of a call.
+
+    @param function <function> Called without arguments
+    """
+    tracemalloc.start()
+    start = time.time()
+    result = function()
+    seconds = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 1024.0
+# end def measure
+
+
+def consume(iterable, count):
+    """Consume the first count items of the iterable and return how many
+    there were.
+
+    @param iterable <iterable> Items to consume
+    @param count <int> Number of items
+    """
+    consumed = 0
+    for _ in iterable:
+        consumed += 1
+        if consumed >= count:
+            break
+        # end if enough items
+    # end for consume items
+    return consumed
+# end def consume
+
+
+def main(argv):
+    """Enumerate a fixed number of abbreviations of growing words.
+
+    @param argv <list> Optional number of abbreviations per word
+    """
+    count = int(argv[0]) if argv else COUNT
+    engine = Abbreviation()
+    rnd = random.Random(0)
+    for size in SIZES:
+        word = ''.join(rnd.choice(string.ascii_lowercase)
+                       for _ in range(size))
+        consumed, seconds, peak = measure(lambda: consume(
+            engine.iter_abbreviations(word, length=4), count))
+        print('%6d chars  %8d abbreviations  %8.1f KB peak  %6.2f s' % (
+            size, consumed, peak, seconds))
+    # end for iterate word sizes
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
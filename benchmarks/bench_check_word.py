@@ -0,0 +1,63 @@
+"""
+@package: benchmarks.bench_check_word
+@brief: Special character normalization, compiled regex against the old loop
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_check_word.py
+"""
+
+import os
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+
+NAMES = ('L_arm_IK-ctrl.001', 'R_leg_FK_jnt', 'C_spine.mid|ctrl', 'head',
+         'pSphere1:shape', 'L_hand_thumb_01_jnt', 'BODY_geo', 'root-ctrl')
+NUMBER = 20000
+
+
+def legacy_check_word(word, include_special_char=None):
+    """Previous implementation rebuilding the punctuation on every word.
+
+    @param word <str> word to check
+    @param include_special_char <list> Characters not splitting the word
+    """
+    chars = string.punctuation
+    if include_special_char:
+        for ch in include_special_char:
+            chars = '%s%s' % (chars.split(ch)[0], chars.split(ch)[1])
+        # end for iterate include special characters
+    # end if include special char initialized
+    for ch in chars:
+        if ch in word:
+            word = ''.join(w.capitalize() for w in word.split(ch))
+        # end if check special character
+    # end for iterate special characters
+    return word
+# end def legacy_check_word
+
+
+def main():
+    """Time both paths on realistic rig and node names."""
+    for include in (None, ['|', ':']):
+        check_word = Abbreviation(include_special_char=include)._check_word
+        legacy = timeit.timeit(
+            lambda: [legacy_check_word(n, include) for n in NAMES],
+            number=NUMBER)
+        compiled = timeit.timeit(
+            lambda: [check_word(n) for n in NAMES], number=NUMBER)
+        calls = NUMBER * len(NAMES)
+        print('include=%-12s legacy %6.3f us/word  compiled %6.3f us/word  '
+              'x%.1f' % (include, legacy / calls * 1e6,
+                         compiled / calls * 1e6, legacy / compiled))
+    # end for iterate include settings
+# end def main
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+@package: benchmarks.bench_cli
+@brief: Throughput and peak memory of the command line interface
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_cli.py [lines] [workers]
+
+Writes an input file of rig style names, 10M lines by default, and runs
+python -m abbreviation on it with the output going to /dev/null. The
+stream mode deduplicates all lines against each other, the group modes
+deduplicate groups of 10000 lines on their own.
+"""
+
+import multiprocessing
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import names
+
+LINES = 10000000
+GROUP_SIZE = 10000
+
+
+def write_input(path, lines):
+    """Write the given number of names to the file, one per line.
+
+    @param path <str> File to write
+    @param lines <int> Number of lines
+    """
+    corpus = names(100000)
+    with open(path, 'w') as handle:
+        for start in range(0, lines, len(corpus)):
+            count = min(len(corpus), lines - start)
+            suffix = start // len(corpus)
+            handle.write(''.join('%s_%d\n' % (name, suffix)
+                                 for name in corpus[:count]))
+        # end for write chunks
+    # end with write file
+# end def write_input
+
+
+def run(path, args):
+    """Run the CLI on the file and return the seconds and the peak memory
+    of the largest child process so far in MB.
+
+    @param path <str> Input file
+    @param args <list> Extra arguments of the CLI
+    """
+    start = time.time()
+    with open(os.devnull, 'w') as devnull:
+        subprocess.check_call([sys.executable, '-m', 'abbreviation', path] +
+                              args, stdout=devnull, cwd=ROOT)
+    # end with discard output
+    seconds = time.time() - start
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024.0
+    return seconds, peak
+# end def run
+
+
+def main(argv):
+    """Time the stream and group modes on a generated input file.
+
+    @param argv <list> Optional number of lines and of workers
+    """
+    lines = int(argv[0]) if argv else LINES
+    workers = (int(argv[1]) if len(argv) > 1 else
+               multiprocessing.cpu_count())
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'names.txt')
+        write_input(path, lines)
+        print('%d lines, %.1f MB' % (lines, os.path.getsize(path) / 1e6))
+        modes = [('groups', ['-g', str(GROUP_SIZE)]),
+                 ('groups %d workers' % workers,
+                  ['-g', str(GROUP_SIZE), '-w', str(workers)]),
+                 ('stream', []),
+                 ('stream jsonl', ['-f', 'jsonl'])]
+        for label, args in modes:
+            seconds, peak = run(path, args)
+            print('%-20s %8.1f s  %9.0f lines/s  peak so far %7.1f MB' % (
+                label, seconds, lines / seconds, peak))
+            sys.stdout.flush()
+        # end for iterate modes
+    finally:
+        shutil.rmtree(directory)
+    # end try remove input
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,55 @@
+"""
+@package: benchmarks.bench_dedup
+@brief: Scaling benchmark of abbreviate_multiple deduplication
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_dedup.py [size ...]
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks.corpus import names
+
+SIZES = (1000, 10000, 100000)
+
+
+def run(size):
+    """Abbreviate a corpus of the given size and print the timing.
+
+    @param size <int> Number of words
+    """
+    logging.disable(logging.CRITICAL)
+    words = names(size)
+    start = time.time()
+    result = Abbreviation().abbreviate_multiple(words)
+    elapsed = time.time() - start
+    print('%8d words  %8.3f s  %6.2f us/word  %d unique' % (
+        size, elapsed, elapsed / size * 1e6, len(set(result.values()))))
+# end def run
+
+
+def main(argv):
+    """Run every size in a fresh interpreter so no state is shared.
+
+    @param argv <list> Sizes to run, default 1k, 10k and 100k
+    """
+    if len(argv) == 1:
+        run(int(argv[0]))
+        return
+    # end if run a single size
+    for size in [int(a) for a in argv] or SIZES:
+        subprocess.check_call([sys.executable, __file__, str(size)])
+    # end for iterate sizes
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+"""
+@package: benchmarks.bench_exclusion
+@brief: Indexed exclusion table against the previous linear lookup
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_exclusion.py [exclusions]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import UPPERCASE, Abbreviation
+from abbreviation.context import CallContext
+from benchmarks.corpus import names
+
+EXCLUSIONS = 50000
+WORDS = 20000
+
+
+def legacy_check_exclusion(word, exclusion, length, result, keys=list):
+    """Previous lookup, scanning the abbreviations of the word for the length.
+
+    @param word <str> word to check
+    @param exclusion <dict> Excluded abbreviations by word
+    @param length <int> Length of the abbreviation
+    @param result <dict> Final resulting dictionary
+    @param keys <function> Builds the keys, list like on Python 2
+    """
+    if word in keys(exclusion.keys()):
+        for val in exclusion[word]:
+            if len(val) == length:
+                result[word] = val
+                return True
+            # end if add new abbreviation
+        # end for iterate value in exclusion
+    # end if word in exclusion
+# end def legacy_check_exclusion
+
+
+def main(argv):
+    """Time the exclusion lookup of a corpus against a large house style.
+
+    @param argv <list> Optional number of excluded words
+    """
+    logging.disable(logging.CRITICAL)
+    count = int(argv[0]) if argv else EXCLUSIONS
+    excluded = names(count, seed=1)
+    exclusion = dict((word, [word[:n].upper() for n in range(2, 9)])
+                     for word in excluded)
+    words = names(WORDS, seed=2)
+    engine = Abbreviation(exclude_abbreviation=exclusion)
+    call = CallContext(engine, UPPERCASE, 3)
+    variants = (
+        ('legacy list keys', lambda word, result: legacy_check_exclusion(
+            word, exclusion, 3, result, list)),
+        ('legacy view keys', lambda word, result: legacy_check_exclusion(
+            word, exclusion, 3, result, lambda keys: keys)),
+        ('indexed', lambda word, result: engine._check_exclusion(
+            word, result, call)))
+    for corpus, words in (('misses', names(WORDS, seed=2)),
+                          ('hits', excluded[:WORDS])):
+        for label, check_exclusion in variants:
+            result = dict()
+            start = time.time()
+            for word in words:
+                check_exclusion(word, result)
+            # end for iterate words
+            print('%-6s %-18s %10.3f us/word' % (
+                corpus, label, (time.time() - start) / len(words) * 1e6))
+        # end for iterate variants
+    # end for iterate corpora
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
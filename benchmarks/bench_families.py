@@ -0,0 +1,86 @@
+"""
+@package: benchmarks.bench_families
+@brief: Deduplication of sibling families with and without the prefix trie
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_families.py [siblings ...]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from abbreviation.resolver import Resolver
+
+SIBLINGS = (10, 100, 1000, 10000)
+FAMILIES = ('Monday%d', 'L_armUpperTwist_ctrl%d', 'spine_%d_jnt')
+
+
+class FlatResolver(Resolver):
+
+    """Previous resolve without families, kept for reference."""
+
+    def _resolve(self, result, reserved):
+        reserved = set(reserved)
+        for word in reserved:
+            self.reserve(word, result[word])
+        # end for reserve pinned words
+        pending = list()
+        for word, abbreviation in result.items():
+            if word in reserved or self.claim(word, abbreviation):
+                continue
+            # end if first choice is free
+            pending.append(word)
+        # end for claim first choices
+        for word in pending:
+            abbreviation = self.assign(word, result[word])
+            if abbreviation is None:
+                self.unresolved[word] = result[word]
+            else:
+                result[word] = abbreviation
+            # end if no free candidate
+        # end for resolve collisions
+    # end def _resolve
+# end class FlatResolver
+
+
+def run(engine, words, resolver):
+    """Return the seconds and the number of unique abbreviations.
+
+    @param engine <Abbreviation> Engine to run
+    @param words <list> Words to abbreviate
+    @param resolver <class> Resolver class deduplicating the words
+    """
+    start = time.time()
+    result = engine.abbreviate_multiple(words, resolver=resolver(
+        engine._candidates))
+    return time.time() - start, len(set(result.values()))
+# end def run
+
+
+def main(argv):
+    """Deduplicate families of growing size with both resolvers.
+
+    @param argv <list> Optional numbers of siblings
+    """
+    logging.disable(logging.CRITICAL)
+    sizes = [int(arg) for arg in argv] or SIBLINGS
+    for family in FAMILIES:
+        for size in sizes:
+            words = [family % i for i in range(size)]
+            flat = run(Abbreviation(cache_size=0), words, FlatResolver)
+            trie = run(Abbreviation(cache_size=0), words, Resolver)
+            print('%-24s %6d siblings  flat %7.3f s %5d unique  '
+                  'trie %7.3f s %5d unique' % ((family, size) + flat + trie))
+        # end for iterate sizes
+    # end for iterate families
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
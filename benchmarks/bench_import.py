@@ -0,0 +1,71 @@
+"""
+@package: benchmarks.bench_import
+@brief: Startup cost of importing the package, measured with -X importtime
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 20
+
+
+def import_times(environment):
+    """Return the self and cumulative microseconds of each imported module.
+
+    @param environment <dict> Environment of the interpreter
+    """
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c', 'import abbreviation'],
+        cwd=ROOT, env=environment, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    _, output = process.communicate()
+    times = dict()
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # end if skip header
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(own), int(cumulative))
+    # end for parse lines
+    return times
+# end def import_times
+
+
+def main(argv):
+    """Import the package in fresh interpreters and print the best times.
+
+    @param argv <list> Optional number of runs
+    """
+    runs = int(argv[0]) if argv else RUNS
+    cache = tempfile.mkdtemp()
+    environment = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    try:
+        import_times(environment)
+        best = dict()
+        for _ in range(runs):
+            for name, times in import_times(environment).items():
+                best[name] = min(best.get(name, times), times)
+            # end for keep the fastest
+        # end for iterate runs
+    finally:
+        shutil.rmtree(cache)
+    # end try remove byte code
+    for name, (own, cumulative) in sorted(best.items(),
+                                          key=lambda item: item[1][1]):
+        print('%-40s %8d us self  %8d us cumulative' % (name, own,
+                                                        cumulative))
+    # end for print modules
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""
+@package: benchmarks.bench_lengths
+@brief: Multi-length table against one abbreviate_multiple call per length
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_lengths.py [words]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks.corpus import names
+
+WORDS = 10000
+LENGTHS = range(2, 9)
+REPEAT = 3
+
+
+def best(function):
+    """Return the fastest of a few runs of the function in seconds.
+
+    @param function <function> Called without arguments
+    """
+    times = list()
+    for _ in range(REPEAT):
+        start = time.time()
+        function()
+        times.append(time.time() - start)
+    # end for repeat
+    return min(times)
+# end def best
+
+
+def main(argv):
+    """Time a table of all lengths against the single length calls.
+
+    @param argv <list> Optional number of words
+    """
+    logging.disable(logging.CRITICAL)
+    words = names(int(argv[0]) if argv else WORDS)
+
+    def single():
+        engine = Abbreviation()
+        for length in LENGTHS:
+            engine.abbreviate_multiple(words, length=length)
+        # end for call each length
+    # end def single
+
+    def table():
+        Abbreviation().abbreviate_lengths(words, lengths=LENGTHS)
+    # end def table
+
+    single_time = best(single)
+    table_time = best(table)
+    print('%d words x %d lengths' % (len(words), len(LENGTHS)))
+    print('single length calls  %7.3f s' % single_time)
+    print('abbreviate_lengths   %7.3f s  %5.2fx' % (
+        table_time, single_time / table_time))
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,63 @@
+"""
+@package: benchmarks.bench_liveset
+@brief: Cost of sequential edits on an AbbreviationSet
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_liveset.py [edits]
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import abbreviate_multiple
+from abbreviation.liveset import AbbreviationSet
+from benchmarks.corpus import names
+
+EDITS = 100000
+RERUNS = 20
+
+
+def main(argv):
+    """Apply random adds and removes and compare with full reruns.
+
+    @param argv <list> Optional number of edits
+    """
+    logging.disable(logging.CRITICAL)
+    edits = int(argv[0]) if argv else EDITS
+    words = names(edits)
+    rnd = random.Random(0)
+    live = AbbreviationSet()
+    present = list()
+    start = time.time()
+    for i in range(edits):
+        if present and rnd.random() < 0.3:
+            index = rnd.randrange(len(present))
+            present[index], present[-1] = present[-1], present[index]
+            live.remove(present.pop())
+        else:
+            live.add(words[i])
+            present.append(words[i])
+        # end if remove or add
+        if not (i + 1) % (edits // 10 or 1):
+            print('%8d edits  %7d words  %7.2f us/edit' % (
+                i + 1, len(live), (time.time() - start) / (i + 1) * 1e6))
+        # end if report progress
+    # end for apply edits
+
+    start = time.time()
+    for _ in range(RERUNS):
+        abbreviate_multiple(present)
+    # end for rerun on the full list
+    print('rerun of %d words  %10.2f us/edit' % (
+        len(present), (time.time() - start) / RERUNS * 1e6))
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
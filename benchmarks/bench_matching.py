@@ -0,0 +1,57 @@
+"""
+@package: benchmarks.bench_matching
+@brief: Resolved collisions and runtime of the greedy and matching dedup
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_matching.py [words]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks import corpus
+
+WORDS = 10000
+MODES = (('greedy', {}),
+         ('matching', {'dedup': 'matching'}),
+         ('matching 0.5s', {'dedup': 'matching', 'time_budget': 0.5}),
+         ('matching 20k', {'dedup': 'matching', 'candidate_budget': 20000}))
+CORPORA = (('names', corpus.names, 3),
+           ('names', corpus.names, 2),
+           ('families', corpus.families, 3))
+
+
+def main(argv):
+    """Print the resolved collision rate and the runtime of each mode.
+
+    @param argv <list> Optional number of words
+    """
+    logging.disable(logging.CRITICAL)
+    count = int(argv[0]) if argv else WORDS
+    for name, create, length in CORPORA:
+        words = create(count)
+        for label, options in MODES:
+            engine = Abbreviation(stats=True, **options)
+            start = time.time()
+            engine.abbreviate_multiple(words, length=length)
+            seconds = time.time() - start
+            counters = engine.stats.counters
+            resolved = counters['collisions'] - counters['unresolved']
+            print('%-8s length %d  %-14s %6d collisions  %5.1f%% resolved  '
+                  '%7.2f s' % (name, length, label, counters['collisions'],
+                               100.0 * resolved / max(1,
+                                                      counters['collisions']),
+                               seconds))
+        # end for iterate modes
+    # end for iterate corpora
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
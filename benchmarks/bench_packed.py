@@ -0,0 +1,98 @@
+"""
+@package: benchmarks.bench_packed
+@brief: Memory and runtime of string and packed collision indices
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_packed.py [words]
+
+Deduplicates 1M collision free names at length 6, once streamed so only
+the collision index stays alive and once with abbreviate_multiple keeping
+the whole result. The peak is the traced allocation above the input list.
+Packed keys only lower the peak of the stream, both modes run slower.
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks.corpus import distinct
+
+WORDS = 1000000
+LENGTH = 6
+
+
+def stream(engine, words):
+    """Consume the stream of the words and return the number of pairs.
+
+    @param engine <Abbreviation> Engine to run
+    @param words <list> Names to abbreviate
+    """
+    count = 0
+    for _ in engine.abbreviate_stream(words, length=LENGTH):
+        count += 1
+    # end for consume stream
+    return count
+# end def stream
+
+
+def multiple(engine, words):
+    """Return the deduplicated abbreviations of the words.
+
+    @param engine <Abbreviation> Engine to run
+    @param words <list> Names to abbreviate
+    """
+    return engine.abbreviate_multiple(words, length=LENGTH)
+# end def multiple
+
+
+def measure(function, packed, words):
+    """Return the seconds of an untraced run and the traced peak in MB.
+
+    @param function <function> Called with an engine and the words
+    @param packed <bool> Engine option packed_keys
+    @param words <list> Names to abbreviate
+    """
+    gc.collect()
+    start = time.time()
+    function(Abbreviation(packed_keys=packed), words)
+    seconds = time.time() - start
+    gc.collect()
+    tracemalloc.start()
+    result = function(Abbreviation(packed_keys=packed), words)
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    del result
+    return seconds, peak
+# end def measure
+
+
+def main(argv):
+    """Print runtime and peak memory of both indices in both modes.
+
+    @param argv <list> Optional number of words
+    """
+    logging.disable(logging.CRITICAL)
+    count = int(argv[0]) if argv else WORDS
+    words = distinct(count)
+    print('%d words, length %d' % (count, LENGTH))
+    for label, function in (('stream', stream),
+                            ('abbreviate_multiple', multiple)):
+        for packed in (False, True):
+            seconds, peak = measure(function, packed, words)
+            print('%-20s %-8s %7.1f s  %7.1f MB peak' % (
+                label, 'packed' if packed else 'strings', seconds, peak))
+            sys.stdout.flush()
+        # end for iterate indices
+    # end for iterate modes
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
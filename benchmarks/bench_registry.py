@@ -0,0 +1,68 @@
+"""
+@package: benchmarks.bench_registry
+@brief: Cold start and lookup latency of a large AbbreviationRegistry
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_registry.py [entries]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation.registry import AbbreviationRegistry
+
+ENTRIES = 1000000
+LOOKUPS = 100000
+
+
+def main(argv):
+    """Build a registry, then time opening it and looking entries up.
+
+    @param argv <list> Optional number of entries
+    """
+    entries = int(argv[0]) if argv else ENTRIES
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, 'names.abr')
+    try:
+        start = time.time()
+        with AbbreviationRegistry(path, capacity=entries * 2) as registry:
+            for i in range(entries):
+                registry.add('name%d' % i, 'N%X' % i)
+            # end for add entries
+        # end with build registry
+        print('build     %d entries  %8.2f s  %6.1f MB' % (
+            entries, time.time() - start, os.path.getsize(path) / 1e6))
+
+        start = time.time()
+        registry = AbbreviationRegistry(path, readonly=True)
+        print('open      %8.3f ms' % ((time.time() - start) * 1e3))
+
+        rnd = random.Random(0)
+        indices = [rnd.randrange(entries) for _ in range(LOOKUPS)]
+        for label, lookup, keys in (
+                ('get', registry.get, ['name%d' % i for i in indices]),
+                ('owner', registry.owner, ['N%X' % i for i in indices]),
+                ('miss', registry.get, ['other%d' % i for i in indices])):
+            start = time.time()
+            for key in keys:
+                lookup(key)
+            # end for look up keys
+            print('%-9s %8.2f us/lookup' % (
+                label, (time.time() - start) / LOOKUPS * 1e6))
+        # end for iterate lookups
+        registry.close()
+    finally:
+        shutil.rmtree(folder)
+    # end try remove registry
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
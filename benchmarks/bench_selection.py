@@ -0,0 +1,125 @@
+"""
+@package: benchmarks.bench_selection
+@brief: Single pass ranked selection against the recursive increase/decrease
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_selection.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import UPPERCASE, Abbreviation
+from abbreviation.context import CallContext
+from abbreviation.utility import Word
+from benchmarks.corpus import names
+
+REPEAT = 5
+
+
+class RecursiveSelection(object):
+
+    """Previous recursive selection on Word masks, kept for reference."""
+
+    def __init__(self, length):
+        """Initialize RecursiveSelection class.
+
+        @param length <int> Length of the abbreviation
+        """
+        self._length = length
+    # end def __init__
+
+    def abbreviate_word(self, word):
+        """Select the chars of the given word and return the abbreviation.
+
+        @param word <str> word to abbreviate
+        """
+        w = Word(word)
+        ln = min(self._length, len(word))
+        abb = w.copy(w.upper_mask() | (1 if word else 0))
+        if len(abb) < ln:
+            abb = self._increase_word(w, abb, ln)
+        elif len(abb) > ln:
+            abb = self._decrease_word(w, abb, ln)
+        # end if result key value
+        return str(abb).upper()
+    # end def abbreviate_word
+
+    def _increase_word(self, word, abbreviation, length):
+        if len(abbreviation) == length:
+            return abbreviation
+        # end if recursion
+        word.mask &= ~abbreviation.mask
+        elements = self._filter_vowels(word, length)
+        abbreviation.mask |= elements.mask & -elements.mask
+        return self._increase_word(word, abbreviation, length)
+    # end def _increase_word
+
+    def _filter_vowels(self, elements, length):
+        count = len(elements)
+        if count < length:
+            return elements
+        # end if no vowel can be deleted
+        vowels = elements.char_mask(('a', 'e', 'i', 'o', 'u'))
+        while vowels and not count < length:
+            key = vowels & -vowels
+            elements.mask ^= key
+            vowels ^= key
+            count -= 1
+        # end while delete vowels
+        return elements
+    # end def _filter_vowels
+
+    def _decrease_word(self, word, abbreviation, length):
+        if len(abbreviation) == length:
+            return abbreviation
+        # end if recursion
+        last = abbreviation.mask.bit_length() - 1
+        abbreviation.remove_char_from_numerical_dict(last)
+        return self._decrease_word(word, abbreviation, length)
+    # end def _decrease_word
+# end class RecursiveSelection
+
+
+def measure(function, words):
+    """Return the best latency in us per word.
+
+    @param function <function> Called with each word
+    @param words <list> Words to abbreviate
+    """
+    latency = None
+    for _ in range(REPEAT):
+        start = time.time()
+        for word in words:
+            function(word)
+        # end for time words
+        elapsed = (time.time() - start) / len(words) * 1e6
+        latency = elapsed if latency is None else min(latency, elapsed)
+    # end for repeat timing
+    return latency
+# end def measure
+
+
+def main():
+    """Compare both selections on long identifiers for lengths 2 to 16."""
+    corpus = names(20000)
+    words = [('%s%s' % (a, b)).replace('_', '').lower()
+             for a, b in zip(corpus[::2], corpus[1::2])]
+    for length in range(2, 17):
+        engine = Abbreviation()
+        call = CallContext(engine, UPPERCASE, length)
+        recursive = measure(RecursiveSelection(length).abbreviate_word, words)
+        ranked = measure(lambda word: engine._abbreviate_word(word, call),
+                         words)
+        print('length %2d  recursive %6.2f us/word  ranked %6.2f us/word  '
+              'x%.1f' % (length, recursive, ranked, recursive / ranked))
+    # end for iterate lengths
+# end def main
+
+
+if __name__ == '__main__':
+    main()
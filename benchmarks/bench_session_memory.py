@@ -0,0 +1,67 @@
+"""
+@package: benchmarks.bench_session_memory
+@brief: Resident memory over a long run of sequential abbreviate calls
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_session_memory.py [calls]
+"""
+
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation, AbbreviationSession
+from benchmarks.corpus import names
+
+CALLS = 1000000
+SAMPLES = 10
+
+
+def rss():
+    """Return the current resident set size in MB, read from /proc."""
+    with open('/proc/self/statm') as statm:
+        pages = int(statm.read().split()[1])
+    # end with read statm
+    return pages * os.sysconf('SC_PAGE_SIZE') / 1024.0 / 1024.0
+# end def rss
+
+
+def run(label, abbreviate, calls, words):
+    """Call abbreviate for every word and print the RSS samples.
+
+    @param label <str> Name of the run
+    @param abbreviate <function> Abbreviate function to call
+    @param calls <int> Number of sequential calls
+    @param words <list> Words to cycle through
+    """
+    step = max(calls // SAMPLES, 1)
+    samples = list()
+    for i in range(calls):
+        abbreviate('%s%d' % (words[i % len(words)], i))
+        if not i % step:
+            samples.append(rss())
+        # end if sample memory
+    # end for iterate calls
+    print('%-28s %s MB' % (label, ' '.join('%.1f' % s for s in samples)))
+# end def run
+
+
+def main(argv):
+    """Run the stateless engine and a bounded session.
+
+    @param argv <list> Optional number of calls
+    """
+    logging.disable(logging.CRITICAL)
+    calls = int(argv[0]) if argv else CALLS
+    words = names(1000)
+    run('Abbreviation.abbreviate', Abbreviation().abbreviate, calls, words)
+    session = AbbreviationSession(reserve=True, max_size=10000)
+    run('session max_size=10000', session.abbreviate, calls, words)
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
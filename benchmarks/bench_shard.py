@@ -0,0 +1,122 @@
+"""
+@package: benchmarks.bench_shard
+@brief: Speedup of sharded deduplication over a single process run
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_shard.py [words] [workers]
+
+Times abbreviate_multiple, abbreviate_sharded in the current process and
+on a process pool. The steps are also timed one by one in the current
+process, the projected time runs the slices and shards on the given
+number of cpus in parallel, without the cost of sending the words to the
+workers. It also counts the words the merge moved to another candidate
+and the words left without a unique abbreviation.
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from abbreviation.shard import abbreviate_sharded
+from abbreviation.shard import merge_shards, partition, resolve_shard
+from benchmarks import corpus
+
+WORDS = 100000
+CORPORA = (('names', corpus.names, 3), ('distinct', corpus.distinct, 6))
+
+
+def timed(function, *args, **kwargs):
+    """Return the result and the seconds of a call.
+
+    @param function <function> Function to call
+    """
+    start = time.time()
+    result = function(*args, **kwargs)
+    return result, time.time() - start
+# end def timed
+
+
+def duplicates(result):
+    """Return the number of words without a unique abbreviation.
+
+    @param result <dict> Words and their abbreviations
+    """
+    return len(result) - len(set(result.values()))
+# end def duplicates
+
+
+def project(words, length, shards):
+    """Run the steps one by one and return the projected seconds on as
+    many cpus as shards, the number of words moved by the merge and of
+    duplicates.
+
+    @param words <list> Names to abbreviate
+    @param length <int> Length of the abbreviations
+    @param shards <int> Number of shards and cpus
+    """
+    engine = Abbreviation()
+    size = -(-len(words) // shards)
+    parts, seconds = list(), list()
+    for start in range(0, len(words), size):
+        part, took = timed(partition, engine, words[start:start + size],
+                           shards, length=length, start=start)
+        parts.append(part)
+        seconds.append(took)
+    # end for partition slices
+    projected = max(seconds)
+    states, seconds = list(), list()
+    for shard in range(shards):
+        entries = [entry for part in parts for entry in part[shard]]
+        state, took = timed(resolve_shard, engine, entries, shard, shards,
+                            length=length)
+        states.append(state)
+        seconds.append(took)
+    # end for resolve shards
+    merged, took = timed(merge_shards, states, engine)
+    moved = sum(merged[word] != value
+                for state in states for _, word, _, value in state.entries)
+    return projected + max(seconds) + took, moved, duplicates(merged)
+# end def project
+
+
+def main(argv):
+    """Print the runtime of the single process and the sharded runs.
+
+    @param argv <list> Optional number of words and of workers
+    """
+    logging.disable(logging.CRITICAL)
+    count = int(argv[0]) if argv else WORDS
+    workers = (int(argv[1]) if len(argv) > 1 else
+               multiprocessing.cpu_count())
+    print('%d words, %d cpus' % (count, multiprocessing.cpu_count()))
+    for name, create, length in CORPORA:
+        words = create(count)
+        result, single = timed(Abbreviation().abbreviate_multiple, words,
+                               length=length)
+        print('%-8s single process %7.2f s  %d duplicates' % (
+            name, single, duplicates(result)))
+        for shards in sorted(set((2, 4, max(workers, 2)))):
+            _, local = timed(abbreviate_sharded, words, shards=shards,
+                             workers=1, length=length)
+            _, pool = timed(abbreviate_sharded, words, shards=shards,
+                            workers=shards, length=length)
+            projected, moved, duplicated = project(words, length, shards)
+            print('%-8s %d shards  in process %7.2f s  pool %7.2f s  '
+                  'projected %7.2f s (%.1fx)  %d moved by merge  '
+                  '%d duplicates' % (name, shards, local, pool, projected,
+                                     single / projected, moved,
+                                     duplicated))
+            sys.stdout.flush()
+        # end for iterate shards
+    # end for iterate corpora
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+"""
+@package: benchmarks.bench_stats
+@brief: Overhead of the stats of an engine, disabled and enabled
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_stats.py [words]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks.corpus import names
+
+WORDS = 10000
+REPEAT = 5
+
+
+def best(function):
+    """Return the fastest of a few runs of the function in seconds.
+
+    @param function <function> Called without arguments
+    """
+    times = list()
+    for _ in range(REPEAT):
+        start = time.time()
+        function()
+        times.append(time.time() - start)
+    # end for repeat
+    return min(times)
+# end def best
+
+
+def main(argv):
+    """Time single words and whole lists with and without stats.
+
+    @param argv <list> Optional number of words
+    """
+    words = names(int(argv[0]) if argv else WORDS)
+    for stats in (False, True):
+        single = Abbreviation(cache_size=0, stats=stats)
+        single_time = best(lambda: [single.abbreviate(w) for w in words])
+        multiple_time = best(lambda: Abbreviation(
+            stats=stats).abbreviate_multiple(words))
+        print('stats %-5s  abbreviate %6.2f us/word  '
+              'abbreviate_multiple %6.2f us/word' % (
+                  stats, single_time / len(words) * 1e6,
+                  multiple_time / len(words) * 1e6))
+    # end for iterate stats
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
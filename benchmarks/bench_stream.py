@@ -0,0 +1,73 @@
+"""
+@package: benchmarks.bench_stream
+@brief: Peak memory of abbreviate_stream over a large file of names
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_stream.py [lines]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import Abbreviation
+from benchmarks.bench_session_memory import rss
+from benchmarks.corpus import names
+
+LINES = 10000000
+SAMPLES = 10
+
+
+def write_names(path, lines):
+    """Write the given number of unique names to a file, one per line.
+
+    @param path <str> File to write
+    @param lines <int> Number of lines
+    """
+    words = names(10000)
+    with open(path, 'w') as handle:
+        for i in range(lines):
+            handle.write('%s%d\n' % (words[i % len(words)], i))
+        # end for write lines
+    # end with open file
+# end def write_names
+
+
+def main(argv):
+    """Stream a generated file and sample the resident memory.
+
+    @param argv <list> Optional number of lines
+    """
+    logging.disable(logging.CRITICAL)
+    lines = int(argv[0]) if argv else LINES
+    handle, path = tempfile.mkstemp(suffix='.txt')
+    os.close(handle)
+    try:
+        write_names(path, lines)
+        step = max(lines // SAMPLES, 1)
+        start = time.time()
+        with open(path) as names_file:
+            stream = Abbreviation().abbreviate_stream(
+                line.rstrip('\n') for line in names_file)
+            for i, pair in enumerate(stream):
+                if not i % step:
+                    print('%10d lines  %7.1f MB rss  %6.1f s' % (
+                        i, rss(), time.time() - start))
+                # end if sample memory
+            # end for consume stream
+        # end with open file
+        print('%10d lines  %7.1f MB rss  %6.1f s' % (
+            lines, rss(), time.time() - start))
+    finally:
+        os.remove(path)
+    # end try remove file
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
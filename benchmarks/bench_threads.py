@@ -0,0 +1,93 @@
+"""
+@package: benchmarks.bench_threads
+@brief: Throughput of one shared engine called from 1 to 32 threads
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_threads.py [calls]
+
+Every thread calls abbreviate_multiple on the same engine with its own
+casemode and length, the calls are split evenly between the threads.
+The engine runs once without a cache, its default, and once with a
+cache shared by the threads.
+With the GIL the throughput stays flat at best, free-threaded builds
+scale with the number of cores.
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import CAPITALIZE, LOWERCASE, UPPERCASE, Abbreviation
+from benchmarks.corpus import names
+
+CALLS = 256
+WORDS = 100
+THREADS = (1, 2, 4, 8, 16, 32)
+REPEAT = 3
+CASEMODES = (UPPERCASE, LOWERCASE, CAPITALIZE)
+CACHES = (('no cache', {}), ('cache', {'cache_size': 1024}))
+
+
+def run(engine, groups, threads):
+    """Return the seconds taken to abbreviate all groups in threads.
+
+    @param engine <Abbreviation> Engine shared by the threads
+    @param groups <list> Lists of words, one abbreviate_multiple call each
+    @param threads <int> Number of threads
+    """
+    def target(index):
+        for number in range(index, len(groups), threads):
+            engine.abbreviate_multiple(groups[number],
+                                       CASEMODES[number % len(CASEMODES)],
+                                       2 + number % 4)
+        # end for iterate calls of the thread
+    # end def target
+
+    workers = [threading.Thread(target=target, args=(index,))
+               for index in range(threads)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    # end for start threads
+    for worker in workers:
+        worker.join()
+    # end for wait for threads
+    return time.time() - start
+# end def run
+
+
+def main(argv):
+    """Print the throughput for each number of threads.
+
+    @param argv <list> Optional number of calls
+    """
+    logging.disable(logging.CRITICAL)
+    calls = int(argv[0]) if argv else CALLS
+    corpus = names(calls * WORDS)
+    groups = [corpus[i:i + WORDS] for i in range(0, len(corpus), WORDS)]
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('%d calls of %d words, GIL %s, %d CPUs' % (
+        calls, WORDS, 'enabled' if gil else 'disabled',
+        multiprocessing.cpu_count()))
+    for label, options in CACHES:
+        base = None
+        for threads in THREADS:
+            engine = Abbreviation(**options)
+            seconds = min(run(engine, groups, threads)
+                          for _ in range(REPEAT))
+            base = base or seconds
+            print('%-13s  %2d threads  %9.0f words/s  %5.2fx' % (
+                label, threads, calls * WORDS / seconds, base / seconds))
+        # end for iterate thread counts
+    # end for iterate cache settings
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+"""
+@package: benchmarks.bench_vectorized
+@brief: Throughput of the scalar and the NumPy first choice selection
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/bench_vectorized.py [words ...]
+
+Times the selection of the first choices alone, on words without special
+characters, and whole abbreviate_multiple calls of collision free names,
+for batches of 10k, 100k and 1M words by default.
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import UPPERCASE, Abbreviation
+from abbreviation.context import CallContext
+from abbreviation.vectorized import first_choices
+from benchmarks.corpus import distinct
+
+SIZES = (10000, 100000, 1000000)
+LENGTH = 6
+
+
+def best(function, repeat):
+    """Return the fastest of the given number of calls in seconds.
+
+    @param function <function> Called without arguments
+    @param repeat <int> Number of calls
+    """
+    seconds = list()
+    for _ in range(repeat):
+        start = time.time()
+        function()
+        seconds.append(time.time() - start)
+    # end for repeat calls
+    return min(seconds)
+# end def best
+
+
+def main(argv):
+    """Print words per second of both paths for each batch size.
+
+    @param argv <list> Optional batch sizes
+    """
+    logging.disable(logging.CRITICAL)
+    sizes = [int(arg) for arg in argv] or SIZES
+    engine = Abbreviation(cache_size=0)
+    call = CallContext(engine, UPPERCASE, LENGTH)
+    for size in sizes:
+        names = distinct(size)
+        words = [engine._check_word(name) for name in names]
+        repeat = 3 if size < 1000000 else 1
+        scalar = best(lambda: [engine._abbreviate_word(word, call)
+                               for word in words], repeat)
+        vector = best(lambda: first_choices(words, LENGTH), repeat)
+        print('%8d words  selection  scalar %9.0f words/s  numpy %9.0f '
+              'words/s  %4.1fx' % (size, size / scalar, size / vector,
+                                   scalar / vector))
+        plain = Abbreviation(cache_size=0)
+        vectorized = Abbreviation(cache_size=0, vectorize=True)
+        scalar = best(lambda: plain.abbreviate_multiple(names, length=LENGTH),
+                      repeat)
+        vector = best(lambda: vectorized.abbreviate_multiple(names,
+                                                             length=LENGTH),
+                      repeat)
+        print('%8d words  call       scalar %9.0f words/s  numpy %9.0f '
+              'words/s  %4.1fx' % (size, size / scalar, size / vector,
+                                   scalar / vector))
+        sys.stdout.flush()
+    # end for iterate batch sizes
+# end def main
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,166 @@
+"""
+@package: benchmarks.bench_word
+@brief: Per word allocation and latency of the char selection
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Compares the Word bitmask selection with the previous {index: char} dict
+implementation, which is kept below for reference.
+
+Run with: python benchmarks/bench_word.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from abbreviation import UPPERCASE, Abbreviation
+from benchmarks.corpus import names
+
+VOWELS = ('a', 'e', 'i', 'o', 'u')
+REPEAT = 5
+
+
+class LegacySelection(object):
+
+    """Previous dict based char selection, kept for reference."""
+
+    def __init__(self, length):
+        """Initialize LegacySelection class.
+
+        @param length <int> Length of the abbreviation
+        """
+        self._length = length
+    # end def __init__
+
+    def abbreviate_word(self, word):
+        """Select the chars of the given word and return the abbreviation.
+
+        @param word <str> word to abbreviate
+        """
+        w = dict()
+        ln = min(self._length, len(word))
+        for i, c in enumerate(word):
+            w[i] = c
+        # end for dict key value
+        abb = self._iterate_word(w)
+        if len(abb) < ln:
+            abb = self._increase_word(w, abb, ln)
+        elif len(abb) > ln:
+            abb = self._decrease_word(w, abb, ln)
+        # end if result key value
+        return ''.join(self._sort_word(abb)).upper()
+    # end def abbreviate_word
+
+    def _iterate_word(self, word):
+        result = dict()
+        for w in word.items():
+            if not w[0]:
+                result[w[0]] = w[1]
+            # end if 0 index
+            if w[1].isupper():
+                result[w[0]] = w[1]
+            # end if isupper
+        # end for iterate word dict
+        return result
+    # end def _iterate_word
+
+    def _sort_word(self, word):
+        return [word[i] for i in sorted(word)]
+    # end def _sort_word
+
+    def _increase_word(self, word, abbreviation, length):
+        if len(abbreviation) == length:
+            return abbreviation
+        # end if recursion
+        for key in abbreviation.keys():
+            if key in word:
+                del(word[key])
+            # end if delete item
+        # end for iteration
+        res = self._add_char(self._filter_vowels(word, length), abbreviation)
+        return self._increase_word(word, res, length)
+    # end def _increase_word
+
+    def _filter_vowels(self, elements, length):
+        for key in list(elements.keys()):
+            if elements[key] in VOWELS:
+                if not len(elements) < length:
+                    del(elements[key])
+                # end if delete item
+            # end if check vowels
+        # end for iterate word keys
+        return elements
+    # end def _filter_vowels
+
+    def _add_char(self, elements, abbreviation):
+        keys = sorted(abbreviation)
+        for w in elements:
+            if len(keys) > 1 or w > keys[0]:
+                abbreviation[w] = elements[w]
+                break
+            # end if add to abbreviation
+        # end for iteration
+        return abbreviation
+    # end def _add_char
+
+    def _decrease_word(self, word, abbreviation, length):
+        while len(abbreviation) > length:
+            del(abbreviation[max(abbreviation.keys())])
+        # end while subtract char
+        return abbreviation
+    # end def _decrease_word
+# end class LegacySelection
+
+
+def measure(function, words):
+    """Return the best latency in us and the peak allocation in bytes per
+    word.
+
+    @param function <function> Called with each word
+    @param words <list> Words to abbreviate
+    """
+    latency = None
+    for _ in range(REPEAT):
+        start = time.time()
+        for word in words:
+            function(word)
+        # end for time words
+        elapsed = (time.time() - start) / len(words) * 1e6
+        latency = elapsed if latency is None else min(latency, elapsed)
+    # end for repeat timing
+    peak = 0
+    tracemalloc.start()
+    for word in words:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        function(word)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    # end for trace words
+    tracemalloc.stop()
+    return latency, float(peak) / len(words)
+# end def measure
+
+
+def main():
+    """Measure both selections for several lengths."""
+    words = [Abbreviation()._check_word(n) for n in names(20000)]
+    for length in (2, 3, 5, 8):
+        engine = Abbreviation()
+        call = engine._context(UPPERCASE, length)
+        for label, function in (
+                ('dict', LegacySelection(length).abbreviate_word),
+                ('word', lambda word: engine._abbreviate_word(word, call))):
+            latency, allocated = measure(function, words)
+            print('length %d  %-4s  %6.2f us/word  %7.1f B/word peak' % (
+                length, label, latency, allocated))
+        # end for iterate implementations
+    # end for iterate lengths
+# end def main
+
+
+if __name__ == '__main__':
+    main()
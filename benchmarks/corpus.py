@@ -0,0 +1,99 @@
+"""
+@package: benchmarks.corpus
+@brief: Seeded synthetic name corpora for the benchmarks
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+import random
+
+PARTS = ('arm', 'leg', 'spine', 'neck', 'head', 'hand', 'foot', 'finger',
+         'toe', 'hip', 'chest', 'jaw', 'eye', 'brow', 'lip', 'ear', 'tail',
+         'wing', 'ctrl', 'jnt', 'grp', 'offset', 'driver', 'pivot', 'root',
+         'main', 'upper', 'lower', 'inner', 'outer', 'front', 'back', 'mid',
+         'twist', 'bend', 'stretch', 'roll', 'aim', 'pole', 'fk', 'ik')
+SIDES = ('L', 'R', 'C')
+
+
+def names(count, seed=0):
+    """Return a list of unique rig style names like L_armUpper_ctrl.
+
+    @param count <int> Number of names to create
+    @param seed <int> Seed of the random generator
+    """
+    rnd = random.Random(seed)
+    result = list()
+    seen = set()
+    while len(result) < count:
+        parts = [rnd.choice(PARTS) for _ in range(rnd.randint(1, 3))]
+        name = '%s%s' % (parts[0], ''.join(p.capitalize() for p in parts[1:]))
+        if rnd.random() < 0.5:
+            name = '%s_%s' % (rnd.choice(SIDES), name)
+        # end if add side prefix
+        if rnd.random() < 0.3:
+            name = '%s%s' % (name, rnd.randint(0, 99))
+        # end if add index suffix
+        if name in seen:
+            continue
+        # end if skip existing name
+        seen.add(name)
+        result.append(name)
+    # end while fill corpus
+    return result
+# end def names
+
+
+def families(count, seed=0, size=100):
+    """Return collision heavy names, families of siblings sharing a base.
+
+    @param count <int> Number of names to create
+    @param seed <int> Seed of the random generator
+    @param size <int> Number of siblings of each family
+    """
+    bases = names(count // size + 1, seed)
+    return ['%s%d' % (bases[i // size], i % size) for i in range(count)]
+# end def families
+
+
+def distinct(count, seed=0):
+    """Return collision free names whose first six consonants differ.
+
+    @param count <int> Number of names to create, at most 20 ** 6
+    @param seed <int> Seed of the random generator
+    """
+    consonants = 'bcdfghjklmnpqrstvwxz'
+    rnd = random.Random(seed)
+    indices = rnd.sample(range(len(consonants) ** 6), count)
+    result = list()
+    for index in indices:
+        chars = list()
+        for _ in range(6):
+            index, char = divmod(index, len(consonants))
+            chars.append(consonants[char])
+        # end for encode index
+        result.append('%s%s' % (''.join(chars).capitalize(),
+                                rnd.choice(('', 'a', 'er', 'ion'))))
+    # end for iterate indices
+    return result
+# end def distinct
+
+
+def punctuated(count, seed=0):
+    """Return names full of special characters like L__arm.upper-ctrl#1.
+
+    @param count <int> Number of names to create
+    @param seed <int> Seed of the random generator
+    """
+    rnd = random.Random(seed)
+    result = list()
+    for _ in range(count):
+        parts = [rnd.choice(PARTS) for _ in range(rnd.randint(2, 5))]
+        name = parts[0]
+        for part in parts[1:]:
+            name = '%s%s%s' % (name, rnd.choice('_.-|:#') *
+                               rnd.randint(1, 2), part)
+        # end for join parts
+        result.append(name)
+    # end for create names
+    return result
+# end def punctuated
@@ -0,0 +1,158 @@
+"""
+@package: benchmarks.run
+@brief: Run the benchmark suite and write the results as JSON
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: python benchmarks/run.py [--quick] [--memory] [--filter text]
+                                   [--output results.json]
+                                   [--compare baseline.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.suite import cases
+
+REPEAT = 3
+THRESHOLD = 1.2
+
+
+def commit():
+    """Return the current git commit of the repository or None."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        output = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+                                         cwd=root, stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    # end try read commit
+    return output.decode().strip()
+# end def commit
+
+
+def measure(case, repeat, memory):
+    """Run the case and return its result entry.
+
+    The fastest of the repeats is kept. Peak memory is measured in an
+    extra run, tracing slows the timed runs down otherwise.
+
+    @param case <Case> Case to run
+    @param repeat <int> Number of timed runs
+    @param memory <bool> Measure the peak of allocated memory
+    """
+    function, items = case.prepare()
+    times = list()
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    # end for repeat
+    seconds = min(times)
+    entry = {'group': case.group, 'params': case.params, 'items': items,
+             'seconds': seconds, 'us_per_item': seconds / items * 1e6}
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        function()
+        entry['peak_kb'] = tracemalloc.get_traced_memory()[1] / 1024.0
+        tracemalloc.stop()
+    # end if measure memory
+    return entry
+# end def measure
+
+
+def compare(results, path, threshold):
+    """Print the change against earlier results and return the names of
+    the cases slower than the threshold.
+
+    @param results <dict> Results of this run
+    @param path <str> JSON file of an earlier run
+    @param threshold <float> Tolerated ratio of the new to the old time
+    """
+    with open(path) as handle:
+        baseline = json.load(handle)['results']
+    # end with read baseline
+    slower = list()
+    for name, entry in sorted(results.items()):
+        if name not in baseline:
+            continue
+        # end if new case
+        ratio = entry['seconds'] / baseline[name]['seconds']
+        flag = ''
+        if ratio > threshold:
+            slower.append(name)
+            flag = '  SLOWER'
+        # end if regression
+        print('%-50s %6.2fx%s' % (name, ratio, flag))
+    # end for iterate results
+    return slower
+# end def compare
+
+
+def main(argv):
+    """Run the selected cases and write the results.
+
+    @param argv <list> Command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Run the benchmark suite and write the results as JSON')
+    parser.add_argument('--quick', action='store_true',
+                        help='only run the small sizes')
+    parser.add_argument('--memory', action='store_true',
+                        help='measure the peak of allocated memory')
+    parser.add_argument('--filter', default='',
+                        help='only run cases whose name contains the text')
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='number of timed runs of each case')
+    parser.add_argument('--output', help='JSON file to write')
+    parser.add_argument('--compare', help='JSON file of an earlier run')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='tolerated ratio of the new to the old time')
+    args = parser.parse_args(argv)
+
+    results = dict()
+    for case in cases(args.quick):
+        if args.filter not in case.name:
+            continue
+        # end if skip case
+        entry = measure(case, args.repeat, args.memory)
+        results[case.name] = entry
+        memory = ''
+        if 'peak_kb' in entry:
+            memory = '  %10.1f KB' % entry['peak_kb']
+        # end if print memory
+        print('%-50s %10.4f s  %9.2f us/item%s' % (
+            case.name, entry['seconds'], entry['us_per_item'], memory))
+        sys.stdout.flush()
+    # end for iterate cases
+
+    report = {'commit': commit(), 'python': platform.python_version(),
+              'platform': platform.platform(), 'repeat': args.repeat,
+              'results': results}
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+        # end with write results
+    # end if write results
+    if args.compare:
+        if compare(results, args.compare, args.threshold):
+            return 1
+        # end if regression
+    # end if compare results
+    return 0
+# end def main
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
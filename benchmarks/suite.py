@@ -0,0 +1,162 @@
+"""
+@package: benchmarks.suite
+@brief: Benchmark cases shared by the runner and the pytest-benchmark module
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+"""
+
+import logging
+
+from abbreviation import CAPITALIZE, LOWERCASE, UPPERCASE, Abbreviation
+from abbreviation.context import CallContext
+from abbreviation.resolver import Resolver
+from benchmarks import corpus
+
+SEED = 0
+SIZES = (1000, 10000, 100000, 1000000)
+QUICK_SIZES = (1000, 10000)
+LENGTHS = (2, 3, 5, 8)
+CASEMODES = {'upper': UPPERCASE, 'lower': LOWERCASE, 'capitalize': CAPITALIZE}
+# Corpus and abbreviation length of the throughput cases, the collision
+# free names only stay distinct with six letters
+CORPORA = {'names': (corpus.names, 3),
+           'families': (corpus.families, 3),
+           'distinct': (corpus.distinct, 6)}
+
+logging.disable(logging.CRITICAL)
+
+
+class Case(object):
+
+    """Benchmark case creating the timed function from its parameters."""
+
+    def __init__(self, group, setup, **params):
+        """Initialize Case class.
+
+        @param group <str> Name of the measured operation
+        @param setup <function> Called with the params, returns the timed
+                                function and its number of items
+        @param params <dict> Parameters of the case
+        """
+        self.group = group
+        self.setup = setup
+        self.params = params
+    # end def __init__
+
+    def __repr__(self):
+        """Return the representation of the Case."""
+        return 'Case(%r)' % self.name
+    # end def __repr__
+
+    @property
+    def name(self):
+        """Return the unique name of the case like multiple[count=1000]."""
+        params = ','.join('%s=%s' % item
+                          for item in sorted(self.params.items()))
+        return '%s[%s]' % (self.group, params)
+    # end def name
+
+    def prepare(self):
+        """Return the timed function and its number of items."""
+        return self.setup(**self.params)
+    # end def prepare
+# end class Case
+
+
+def setup_abbreviate(length, casemode):
+    """Abbreviate single words without the cache.
+
+    @param length <int> Length of the abbreviation
+    @param casemode <str> Key of CASEMODES
+    """
+    words = corpus.names(1000, SEED)
+    engine = Abbreviation(cache_size=0)
+    mode = CASEMODES[casemode]
+
+    def run():
+        for word in words:
+            engine.abbreviate(word, mode, length)
+        # end for iterate words
+    # end def run
+    return run, len(words)
+# end def setup_abbreviate
+
+
+def setup_multiple(corpus_name, count):
+    """Abbreviate and deduplicate a corpus in one call.
+
+    @param corpus_name <str> Key of CORPORA
+    @param count <int> Number of words
+    """
+    create, length = CORPORA[corpus_name]
+    words = create(count, SEED)
+
+    def run():
+        Abbreviation().abbreviate_multiple(words, length=length)
+    # end def run
+    return run, count
+# end def setup_multiple
+
+
+def setup_dedup(corpus_name, count):
+    """Deduplicate precomputed first choices only.
+
+    @param corpus_name <str> Key of CORPORA
+    @param count <int> Number of words
+    """
+    create, length = CORPORA[corpus_name]
+    engine = Abbreviation()
+    call = CallContext(engine, UPPERCASE, length)
+    firsts = dict(engine._first_choice(word, call)
+                  for word in create(count, SEED))
+
+    def run():
+        Resolver(call.candidates).resolve(dict(firsts))
+    # end def run
+    return run, len(firsts)
+# end def setup_dedup
+
+
+def setup_check_word(count):
+    """Split punctuation heavy words.
+
+    @param count <int> Number of words
+    """
+    words = corpus.punctuated(count, SEED)
+    engine = Abbreviation()
+
+    def run():
+        for word in words:
+            engine._check_word(word)
+        # end for iterate words
+    # end def run
+    return run, count
+# end def setup_check_word
+
+
+def cases(quick=False):
+    """Return all benchmark cases.
+
+    @param quick <bool> Only use the small sizes
+    """
+    sizes = QUICK_SIZES if quick else SIZES
+    result = list()
+    for length in LENGTHS:
+        for casemode in sorted(CASEMODES):
+            result.append(Case('abbreviate', setup_abbreviate, length=length,
+                               casemode=casemode))
+        # end for iterate casemodes
+    # end for iterate lengths
+    for corpus_name in sorted(CORPORA):
+        for count in sizes:
+            result.append(Case('multiple', setup_multiple,
+                               corpus_name=corpus_name, count=count))
+            result.append(Case('dedup', setup_dedup,
+                               corpus_name=corpus_name, count=count))
+        # end for iterate sizes
+    # end for iterate corpora
+    for count in sizes[:3]:
+        result.append(Case('check_word', setup_check_word, count=count))
+    # end for iterate sizes
+    return result
+# end def cases
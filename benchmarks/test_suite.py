@@ -0,0 +1,28 @@
+"""
+@package: benchmarks.test_suite
+@brief: Benchmark suite for pytest-benchmark
+@author: Emre Tekinalp
+@contact: e.tekinalp@icloud.com
+
+Run with: pytest benchmarks/test_suite.py --benchmark-json=results.json
+Set BENCHMARK_FULL=1 to include the sizes up to one million words.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from benchmarks.suite import cases
+
+CASES = cases(quick=not os.environ.get('BENCHMARK_FULL'))
+
+
+@pytest.mark.parametrize('case', CASES, ids=[case.name for case in CASES])
+def test_suite(benchmark, case):
+    """Time one case of the suite."""
+    function, items = case.prepare()
+    benchmark.group = case.group
+    benchmark.extra_info['items'] = items
+    benchmark.pedantic(function, rounds=3, iterations=1)
@@ -8,4 +8,7 @@ setup(name='abbreviation',
       author_email='e.tekinalp@icloud.com',
       license='MIT',
       packages=['abbreviation'],
+      extras_require={'numpy': ['numpy']},
+      entry_points={
+          'console_scripts': ['abbreviation = abbreviation.cli:main']},
       zip_safe=False)
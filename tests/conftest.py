@@ -0,0 +1,4 @@
+import sys
+
+# The asyncio tests use async syntax, older Pythons cannot compile them
+collect_ignore = ["test_aio.py"] if sys.version_info < (3, 5) else []
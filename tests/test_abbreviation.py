@@ -1,6 +1,7 @@
 import pytest
 
-from abbreviation import abbreviate, abbreviate_multiple
+from abbreviation import (Abbreviation, abbreviate, abbreviate_lengths,
+                          abbreviate_multiple)
 
 
 def test_produces_abbreviations_of_varying_lengths():
@@ -35,10 +36,12 @@ def test_whitespace_serves_as_a_divider():
 
 
 def test_show_all_possible_abbreviations():
-    """All options provides all possible abbreviations of the given word."""
+    """All options provides all possible abbreviations of the given word,
+    cased and in priority order: first and uppercase chars, consonants,
+    then vowels."""
     word = "Friday"
     abbreviations = abbreviate(word, length=1, all=True)
-    assert abbreviations == [c for c in word]
+    assert abbreviations == ["F", "R", "D", "Y", "I", "A"]
 
 
 def test_abbreviate_multiple_avoids_duplicates():
@@ -46,3 +49,105 @@ def test_abbreviate_multiple_avoids_duplicates():
     words = ["Monday", "Moon", "Money", "Monastery", "Monopoly", "Monaco"]
     abbreviations = abbreviate_multiple(words=words, length=3)
     assert len(abbreviations) == len(list(set(abbreviations)))
+
+
+def test_special_characters_split_the_word_into_parts():
+    """Special characters are removed and every part is capitalized."""
+    abbreviation = Abbreviation()
+    assert abbreviation._check_word("L_arm_IK-ctrl.001") == "LArmIkCtrl001"
+    assert abbreviation._check_word("__arm") == "Arm"
+    assert abbreviation._check_word("FriDay") == "FriDay"
+
+
+def test_included_special_characters_are_kept():
+    """Included special characters are not used to split the word."""
+    abbreviation = Abbreviation(include_special_char=["_", "."])
+    assert abbreviation._check_word("L_arm-ik.001") == "L_armIk.001"
+    with pytest.raises(ValueError):
+        Abbreviation(include_special_char=["a"])
+
+
+def test_uppercase_chars_are_kept_in_positional_order():
+    """Too many uppercase chars keep the first ones of the word."""
+    assert abbreviate(word="aBcDeFgHi", length=3) == "ABD"
+    assert abbreviate(word="L_ik", length=1) == "L"
+
+
+def test_long_abbreviations_do_not_recurse():
+    """Long words and lengths are selected without hitting recursion."""
+    word = "x" + "ab" * 2000
+    assert abbreviate(word=word, length=1500) == "X" + "B" * 1499
+
+
+def test_excluded_abbreviations_are_used_for_their_length():
+    """Excluded abbreviations replace the computed one of the same length."""
+    abbreviation = Abbreviation(
+        exclude_abbreviation={"Friday": ["FR", "FRI", "FRID"]})
+    assert abbreviation.abbreviate("Friday", length=3) == "FRI"
+    assert abbreviation.abbreviate("Friday", length=4) == "FRID"
+    assert abbreviation.abbreviate("Friday", length=5) == "FRDAY"
+
+
+def test_excluded_abbreviations_are_reserved():
+    """Other words never take an excluded abbreviation."""
+    abbreviation = Abbreviation(exclude_abbreviation={"Mindy": ["MND"]})
+    assert abbreviation.abbreviate("Monday") == "MNY"
+    assert abbreviation.abbreviate_multiple(["Monday", "Mindy"]) == {
+        "Monday": "MNY", "Mindy": "MND"}
+
+
+def test_all_possible_abbreviations_are_ranked():
+    """The first choice comes first, the following ones by rank."""
+    abbreviations = abbreviate("Monday", all=True)
+    assert abbreviations[:4] == ["MND", "MNY", "MON", "MNA"]
+    assert abbreviations[0] == abbreviate("Monday")
+    assert len(abbreviations) == len(set(abbreviations)) == 20
+
+
+def test_all_abbreviations_with_length_lower_than_one(capsys):
+    """Listing all abbreviations validates the length like abbreviate."""
+    abbreviations = abbreviate("Friday", length=0, all=True)
+    captured = capsys.readouterr()
+    assert abbreviations is None
+    assert captured.out == "Given length must be higher than 0."
+
+
+def test_iterate_abbreviations_is_lazy():
+    """Abbreviations of long words are created on request."""
+    engine = Abbreviation()
+    abbreviations = engine.iter_abbreviations("a" * 50 + "b", length=4)
+    assert next(abbreviations) == "AAAB"
+    assert next(abbreviations) == "AAAA"
+
+
+def test_abbreviate_lengths_matches_single_lengths():
+    """The table holds the deduplicated abbreviations of every length."""
+    words = ["Monday", "Mindy", "Friday", "L_arm_ctrl"]
+    table = abbreviate_lengths(words, lengths=[2, 3, 4])
+    assert table["Mindy"] == ("MD", "MNY", "MIND")
+    for index, length in enumerate([2, 3, 4]):
+        result = abbreviate_multiple(words, length=length)
+        assert result == dict((w, row[index]) for w, row in table.items())
+
+
+def test_abbreviate_lengths_uses_excluded_abbreviations():
+    """Excluded abbreviations are used for their length only."""
+    abbreviation = Abbreviation(
+        exclude_abbreviation={"Friday": ["FR", "FRI", "FRID"]})
+    table = abbreviation.abbreviate_lengths(["Friday"], lengths=[3, 5])
+    assert table == {"Friday": ("FRI", "FRDAY")}
+
+
+def test_abbreviate_lengths_keys_excluded_words_like_multiple_calls():
+    """Excluded words keep their original spelling as key."""
+    abbreviation = Abbreviation(
+        exclude_abbreviation={"Foo-Bar": ["XY"], "Mindy": ["MD"]})
+    words = ["Foo-Bar", "Monday", "Mindy", "L_arm_ctrl"]
+    table = abbreviation.abbreviate_lengths(words, lengths=[2])
+    assert table == dict((w, (value,)) for w, value in
+                         abbreviation.abbreviate_multiple(words,
+                                                          length=2).items())
+    table = abbreviation.abbreviate_lengths(words, lengths=[2, 3])
+    result = abbreviation.abbreviate_multiple(words, length=3)
+    assert table["Foo-Bar"] == ("XY", result["FooBar"])
+    assert table["Mindy"] == ("MD", result["Mindy"])
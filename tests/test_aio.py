@@ -0,0 +1,133 @@
+import sys
+import time
+
+import pytest
+
+asyncio = pytest.importorskip("asyncio")
+
+from abbreviation import (LOWERCASE, Abbreviation, AbbreviationSession,
+                          abbreviate, abbreviate_multiple)
+from abbreviation.aio import AsyncAbbreviator
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7),
+                                reason="needs asyncio.run")
+
+
+def run(coroutine):
+    """Run the coroutine of a test in a new event loop."""
+    return asyncio.run(coroutine)
+
+
+def test_concurrent_requests_share_one_batch():
+    """Requests made in the same window run together and match the
+    synchronous functions."""
+    words = ["Monday", "Mindy", "Friday", "L_arm_ctrl"]
+
+    async def main():
+        abbreviator = AsyncAbbreviator()
+        results = await asyncio.gather(
+            *[abbreviator.abbreviate(word) for word in words])
+        return abbreviator, results
+
+    abbreviator, results = run(main())
+    assert results == [abbreviate(word) for word in words]
+    assert (abbreviator.requests, abbreviator.batches) == (4, 1)
+
+
+def test_requests_without_scope_are_independent():
+    """Only the words of one request are deduplicated against each
+    other."""
+
+    async def main():
+        abbreviator = AsyncAbbreviator()
+        return await asyncio.gather(
+            abbreviator.abbreviate_multiple(["Monday", "Mindy"]),
+            abbreviator.abbreviate("Mindy"),
+            abbreviator.abbreviate("Friday", LOWERCASE, 2))
+
+    assert run(main()) == [abbreviate_multiple(["Monday", "Mindy"]), "MND",
+                           "fr"]
+
+
+def test_requests_of_a_session_are_deduplicated_together():
+    """Requests of the same session are one call in arrival order."""
+    session = AbbreviationSession(reserve=True)
+
+    async def main():
+        abbreviator = AsyncAbbreviator()
+        first = await asyncio.gather(
+            abbreviator.abbreviate("Monday", scope=session),
+            abbreviator.abbreviate("Mindy", scope=session),
+            abbreviator.abbreviate("Mindy"))
+        later = await abbreviator.abbreviate("Mandy", scope=session)
+        return first, later
+
+    assert run(main()) == (["MND", "MNY", "MND"], "MAN")
+
+
+def test_full_batch_runs_before_the_window():
+    """A batch reaching max_batch words runs without waiting."""
+
+    async def main():
+        abbreviator = AsyncAbbreviator(window=60, max_batch=2)
+        return await asyncio.gather(abbreviator.abbreviate("Monday"),
+                                    abbreviator.abbreviate("Mindy"))
+
+    start = time.time()
+    assert run(main()) == ["MND", "MND"]
+    assert time.time() - start < 30
+
+
+def test_large_batches_run_in_the_executor():
+    """Batches reaching offload words give the same results."""
+    words = ["Monday", "Mindy", "Mandy", "Friday"] * 10
+    session = AbbreviationSession()
+
+    async def main():
+        abbreviator = AsyncAbbreviator(offload=4)
+        return await asyncio.gather(
+            abbreviator.abbreviate_multiple(words),
+            abbreviator.abbreviate_multiple(words[:2], scope=session),
+            abbreviator.abbreviate_multiple(words[2:4], scope=session))
+
+    results = run(main())
+    assert results[0] == abbreviate_multiple(words)
+    assert results[1] == {"Monday": "MND", "Mindy": "MNY"}
+    assert results[2] == {"Mandy": "MAN", "Friday": "FRD"}
+
+
+def test_errors_and_invalid_lengths_reach_the_requests(capsys):
+    """A failing batch raises in its requests, a length below one
+    returns None."""
+
+    async def main():
+        abbreviator = AsyncAbbreviator(Abbreviation(output="list"))
+        invalid = await abbreviator.abbreviate("Monday", length=0)
+        listed = await abbreviator.abbreviate_multiple(["Monday"])
+        with pytest.raises(ValueError):
+            await abbreviator.abbreviate("Monday", casemode=7)
+        return invalid, listed
+
+    assert run(main()) == (None, [["Monday", "MND"]])
+    assert capsys.readouterr().out == "Given length must be higher than 0."
+
+
+def test_batches_of_a_session_never_run_at_once():
+    """Batches of one session with different lengths run one after the
+    other, like successive calls of the session."""
+    words = [first + second + third
+             for first in ("Mon", "Fri", "Tues", "Sun")
+             for second in ("day", "da", "dy", "dey")
+             for third in ("ton", "ville", "berg", "stead", "field")]
+    session = AbbreviationSession(reserve=True)
+
+    async def main():
+        abbreviator = AsyncAbbreviator(offload=1)
+        return await asyncio.gather(
+            abbreviator.abbreviate_multiple(words, length=2, scope=session),
+            abbreviator.abbreviate_multiple(words, length=4, scope=session),
+            abbreviator.abbreviate_multiple(words, length=3, scope=session))
+
+    expected = AbbreviationSession(reserve=True)
+    assert run(main()) == [expected.abbreviate_multiple(words, length=length)
+                           for length in (2, 4, 3)]
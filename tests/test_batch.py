@@ -0,0 +1,33 @@
+import pytest
+
+from abbreviation import LOWERCASE, abbreviate_multiple
+from abbreviation.batch import abbreviate_batches
+
+
+GROUPS = [["Monday", "Mindy"], ["Mindy", "Monday"], ["Friday"]]
+
+
+def test_groups_are_independent_scopes():
+    """Every group is deduplicated on its own and returned in order."""
+    results = abbreviate_batches(GROUPS, workers=1)
+    assert results == [abbreviate_multiple(group) for group in GROUPS]
+    assert results[1] == {"Mindy": "MND", "Monday": "MNY"}
+
+
+def test_process_pool_matches_serial_results():
+    """Workers return the same results in input order."""
+    groups = GROUPS * 10
+    assert (abbreviate_batches(groups, workers=2, chunksize=3) ==
+            abbreviate_batches(groups, workers=1))
+
+
+def test_workers_use_the_given_options():
+    """The engine options and call arguments reach the workers."""
+    results = abbreviate_batches(GROUPS, workers=2, casemode=LOWERCASE,
+                                 length=2, output='list')
+    assert results[2] == [["Friday", "fr"]]
+
+
+def test_default_workers_use_all_cpus():
+    """Without workers the pool has one process per cpu."""
+    assert abbreviate_batches(GROUPS) == abbreviate_batches(GROUPS, workers=1)
@@ -0,0 +1,47 @@
+import pytest
+
+from abbreviation import LOWERCASE, Abbreviation
+from abbreviation.cache import LRUCache
+
+
+def test_least_recently_used_item_is_evicted():
+    """The least recently used item is dropped beyond maxsize."""
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.info() == {"maxsize": 2, "size": 2, "hits": 1, "misses": 1,
+                            "evictions": 1, "hit_rate": 0.5}
+
+
+def test_abbreviations_are_cached_by_word_casemode_and_length():
+    """Repeated words are served from the cache."""
+    engine = Abbreviation(cache_size=16)
+    engine.abbreviate("Friday")
+    engine.abbreviate("Friday")
+    assert engine.abbreviate("Friday", casemode=LOWERCASE) == "frd"
+    assert engine.abbreviate("Friday", length=2) == "FR"
+    assert (engine.cache.hits, engine.cache.misses) == (1, 3)
+
+
+def test_changing_exclusions_invalidates_the_cache():
+    """Setting exclude_abbreviation drops the cached abbreviations."""
+    engine = Abbreviation(cache_size=16)
+    engine.abbreviate("Friday")
+    engine.exclude_abbreviation = {"Friday": ["FRI"]}
+    assert len(engine.cache) == 0
+    assert engine.abbreviate("Friday") == "FRI"
+
+
+def test_cache_can_be_disabled():
+    """A cache_size of 0 disables the cache."""
+    assert Abbreviation(cache_size=0).cache is None
+
+
+def test_cache_is_opt_in():
+    """Engines only cache when given a cache_size, so the default calls
+    take no lock."""
+    assert Abbreviation().cache is None
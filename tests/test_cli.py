@@ -0,0 +1,106 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from abbreviation import Abbreviation
+from abbreviation.cli import main
+
+NAMES = ["Monday", "Mindy", "L_arm_ctrl", "Friday", "Fridays"]
+
+
+def run_cli(args, stdin):
+    """Run python -m abbreviation and return its exit code and output."""
+    process = subprocess.Popen([sys.executable, "-m", "abbreviation"] + args,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE,
+                               universal_newlines=True)
+    output, error = process.communicate(stdin)
+    return process.returncode, output, error
+
+
+def test_stdin_is_written_as_tsv():
+    """Names keep their input spelling and are deduplicated like
+    abbreviate_stream, blank lines are skipped."""
+    code, output, _ = run_cli([], "\n".join(NAMES) + "\n\n")
+    expected = Abbreviation().abbreviate_stream(NAMES)
+    assert code == 0
+    assert output == "".join("%s\t%s\n" % (name, abbreviation)
+                             for name, (_, abbreviation) in zip(NAMES,
+                                                                expected))
+
+
+def test_files_are_read_in_order(tmpdir):
+    """Several files are one stream, later names avoid earlier ones."""
+    first = tmpdir.join("first.txt")
+    first.write("Monday\n")
+    second = tmpdir.join("second.txt")
+    second.write("Mindy\n")
+    code, output, _ = run_cli([str(first), str(second)], "")
+    assert output == "Monday\tMND\nMindy\tMNY\n"
+
+
+def test_jsonl_and_csv_output():
+    """JSON Lines and CSV are quoted properly."""
+    _, output, _ = run_cli(["-f", "jsonl", "-c", "lower", "-l", "2"],
+                           'Mon"day\n')
+    assert json.loads(output) == {"name": 'Mon"day', "abbreviation": "md"}
+    _, output, _ = run_cli(["--format", "csv", "--include-special-char",
+                            ","], "Mon,day\n")
+    assert output == '"Mon,day","MN,"\n'
+
+
+def test_exclusion_file(tmpdir):
+    """Excluded abbreviations are read from tab separated lines or
+    JSON."""
+    tsv = tmpdir.join("exclude.tsv")
+    tsv.write("Friday\tFRI\tFR\n")
+    _, output, _ = run_cli(["-e", str(tsv)], "Friday\nFridays\n")
+    assert output == "Friday\tFRI\nFridays\tFRD\n"
+    js = tmpdir.join("exclude.json")
+    js.write(json.dumps({"Friday": ["FR"]}))
+    _, output, _ = run_cli(["-e", str(js), "-l", "2"], "Friday\n")
+    assert output == "Friday\tFR\n"
+
+
+def test_unreadable_exclusion_file_exits_with_2(tmpdir, capsys):
+    """A missing or broken exclusion file is reported without a
+    traceback."""
+    missing = str(tmpdir.join("missing.tsv"))
+    with pytest.raises(SystemExit) as error:
+        main(["-e", missing])
+    assert error.value.code == 2
+    assert "--exclude: cannot read %s" % missing in capsys.readouterr().err
+    broken = tmpdir.join("broken.json")
+    broken.write("{")
+    with pytest.raises(SystemExit):
+        main(["-e", str(broken)])
+    assert "--exclude: invalid JSON" in capsys.readouterr().err
+
+
+def test_groups_are_independent_with_workers():
+    """Groups are deduplicated on their own, workers keep the order."""
+    names = "\n".join(["Monday", "Mindy"] * 20) + "\n"
+    code, output, _ = run_cli(["-g", "2", "-w", "2"], names)
+    assert code == 0
+    assert output == "Monday\tMND\nMindy\tMNY\n" * 20
+    _, serial, _ = run_cli(["-g", "1"], names)
+    assert serial == "Monday\tMND\nMindy\tMND\n" * 20
+
+
+def test_packed_keys_give_the_same_output():
+    """Packing the index keys changes no abbreviation."""
+    names = "\n".join(NAMES) + "\n"
+    assert run_cli(["--packed-keys"], names) == run_cli([], names)
+
+
+def test_invalid_arguments_exit_with_2(capsys):
+    """Invalid arguments are reported without a traceback."""
+    with pytest.raises(SystemExit) as error:
+        main(["--workers", "2"])
+    assert error.value.code == 2
+    with pytest.raises(SystemExit):
+        main(["--length", "0"])
+    assert main(["--include-special-char", "a"]) == 2
+    assert "character not valid" in capsys.readouterr().err
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous upper bound of the cumulative import time in microseconds, the
+# import takes a few milliseconds
+IMPORT_BUDGET = 250000
+EAGER_MODULES = ("re", "string", "logging", "mmap", "zlib", "concurrent",
+                 "asyncio", "abbreviation.batch", "abbreviation.registry",
+                 "abbreviation.liveset", "abbreviation.aio",
+                 "abbreviation.shard", "abbreviation.vectorized", "numpy",
+                 "multiprocessing")
+
+
+def import_times(code):
+    """Return the cumulative import time of every module imported by the
+    code as reported by -X importtime."""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                             stderr=subprocess.PIPE, universal_newlines=True,
+                             check=True)
+    times = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="needs -X importtime")
+def test_import_is_fast_and_lazy():
+    """Importing the package neither loads heavy modules nor engines."""
+    times = import_times("import abbreviation")
+    assert times["abbreviation"] < IMPORT_BUDGET
+    assert not [name for name in EAGER_MODULES if name in times]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="needs -X importtime")
+def test_submodules_are_imported_on_access():
+    """Public names of the submodules are imported on first access."""
+    times = import_times("from abbreviation import AbbreviationRegistry")
+    assert "abbreviation.registry" in times
+    assert "abbreviation.batch" not in times
+
+
+def test_submodules_are_not_imported_with_the_package():
+    """Every Python version imports the submodules on request only."""
+    output = subprocess.check_output([sys.executable, "-c", (
+        "import sys\n"
+        "import abbreviation\n"
+        "print([name for name in ('abbreviation.batch', "
+        "'abbreviation.registry', 'abbreviation.liveset', "
+        "'abbreviation.shard', 'abbreviation.aio') "
+        "if name in sys.modules])\n")])
+    assert output.split() == [b"[]"]
+
+
+def test_default_engine_is_created_on_first_use():
+    """The module level functions share one engine created lazily."""
+    output = subprocess.check_output([sys.executable, "-c", (
+        "import abbreviation as a\n"
+        "print(a._default_engine is None)\n"
+        "a.abbreviate('Monday')\n"
+        "print(a._default_engine is a.default_engine())\n")])
+    assert output.split() == [b"True", b"True"]
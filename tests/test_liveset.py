@@ -0,0 +1,44 @@
+import pytest
+
+from abbreviation import Abbreviation, abbreviate_multiple
+from abbreviation.liveset import AbbreviationSet
+
+
+def test_set_matches_abbreviate_multiple():
+    """Adding words in order gives the same result as one call."""
+    words = ['Monday', 'Mindy', 'Mandy', 'Tuesday', 'L_arm_ctrl']
+    live = AbbreviationSet(words)
+    assert dict(live.items()) == abbreviate_multiple(words)
+    assert live.get('L_arm_ctrl') == live.get('LArmCtrl')
+
+
+def test_existing_assignments_are_stable():
+    """Edits never change the abbreviations of other words."""
+    live = AbbreviationSet(['Monday', 'Mindy'])
+    assert live.add('Mandy') == 'MAN'
+    live.remove('Monday')
+    assert live.items() == [('Mindy', 'MNY'), ('Mandy', 'MAN')]
+    assert live.add('Monday') == 'MND'
+    assert live.owner('MND') == 'Monday'
+
+
+def test_remove_promotes_unresolved_word():
+    """A released abbreviation goes to the word waiting for it."""
+    live = AbbreviationSet(['Aa', 'aA'])
+    assert live.unresolved == {'aA': 'AA'}
+    live.remove('Aa')
+    assert live.unresolved == dict()
+    assert live.owner('AA') == 'aA'
+    with pytest.raises(KeyError):
+        live.remove('Aa')
+    live.discard('Aa')
+
+
+def test_excluded_abbreviations_stay_reserved():
+    """Excluded words keep their abbreviation and others avoid it."""
+    engine = Abbreviation(exclude_abbreviation={'Friday': ['FRD']})
+    live = AbbreviationSet(['Fridays', 'Friday'], abbreviation=engine)
+    assert live.items() == [('Fridays', 'FRY'), ('Friday', 'FRD')]
+    live.remove('Friday')
+    assert live.owner('FRD') is None
+    assert 'Friday' not in live
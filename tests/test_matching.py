@@ -0,0 +1,81 @@
+import pytest
+
+from abbreviation import Abbreviation, AbbreviationSession
+from abbreviation.matching import MatchingResolver
+from abbreviation.resolver import Resolver
+
+# Alternative abbreviations of each word of the crafted collisions
+CANDIDATES = {"Bob": ["BB"], "Ann": [], "Cid": ["BB", "CD"]}
+
+
+def candidates(word, abbreviation, start=0):
+    """Return the crafted candidates of the word."""
+    return iter(CANDIDATES[word])
+
+
+def test_matching_moves_earlier_words_to_resolve_collisions():
+    """A word without a free candidate takes the abbreviation of a word
+    that can move on to another one."""
+    greedy = Resolver(candidates).resolve({"Bob": "AA", "Ann": "AA"})
+    assert greedy == {"Bob": "AA", "Ann": "AA"}
+    resolver = MatchingResolver(candidates)
+    result = resolver.resolve({"Bob": "AA", "Ann": "AA"})
+    assert result == {"Bob": "BB", "Ann": "AA"}
+    assert not resolver.unresolved
+    assert (resolver.augmented, resolver.moved) == (1, 1)
+
+
+def test_matching_follows_chains_of_moves():
+    """Words move along the shortest chain ending at a free
+    abbreviation."""
+    resolver = MatchingResolver(candidates)
+    result = resolver.resolve({"Cid": "BB", "Bob": "AA", "Ann": "AA"})
+    assert result == {"Cid": "CD", "Bob": "BB", "Ann": "AA"}
+
+
+def test_reserved_and_earlier_claims_never_move():
+    """Pinned words and the claims of previous calls keep their
+    abbreviation."""
+    resolver = MatchingResolver(candidates)
+    resolver.resolve({"Bob": "AA"})
+    result = resolver.resolve({"Ann": "AA"})
+    assert result == {"Ann": "AA"}
+    assert resolver.unresolved == {"Ann": "AA"}
+    result = MatchingResolver(candidates).resolve({"Bob": "AA", "Ann": "AA"},
+                                                  reserved=["Bob"])
+    assert result == {"Bob": "AA", "Ann": "AA"}
+
+
+def test_candidate_budget_limits_the_search():
+    """Without budget left, unresolved words stay unresolved."""
+    resolver = MatchingResolver(candidates, candidate_budget=0)
+    resolver.resolve({"Bob": "AA", "Ann": "AA"})
+    assert resolver.unresolved == {"Ann": "AA"}
+
+
+def test_engine_matching_resolves_more_collisions():
+    """The matching mode leaves fewer duplicates than the greedy mode and
+    every resolved abbreviation stays unique."""
+    words = [a + b + c for a in "Mon" for b in "day" for c in "xyz"]
+    greedy = Abbreviation(stats=True)
+    matching = Abbreviation(dedup="matching", stats=True)
+    greedy.abbreviate_multiple(words, length=2)
+    result = matching.abbreviate_multiple(words, length=2)
+    unresolved = matching.stats.counters["unresolved"]
+    assert (unresolved, greedy.stats.counters["unresolved"]) == (3, 10)
+    assert len(set(result.values())) == len(result) - unresolved
+
+
+def test_sessions_use_the_dedup_mode_of_the_engine():
+    """A reserving session of a matching engine keeps earlier calls."""
+    session = AbbreviationSession(Abbreviation(dedup="matching"),
+                                  reserve=True)
+    assert session.abbreviate("Monday") == "MND"
+    assert session.abbreviate_multiple(["Mindy", "Monday"]) == {
+        "Mindy": "MNY", "Monday": "MND"}
+
+
+def test_unknown_dedup_mode():
+    """Only the greedy and the matching mode exist."""
+    with pytest.raises(ValueError):
+        Abbreviation(dedup="optimal")
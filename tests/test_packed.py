@@ -0,0 +1,72 @@
+import random
+
+from abbreviation import Abbreviation
+from abbreviation.packed import MAX_LENGTH, PackedIndex, pack, unpack
+from abbreviation.resolver import Resolver
+
+WORDS = ["Monday", "Mindy", "Mandy", "Friday", "Fridays", "Frida",
+         "L_arm_ctrl", "R_arm_ctrl", "Sunday", "Sundae", "Sandy"]
+
+
+def test_pack_is_case_folded_and_unique_per_length():
+    """Keys ignore case, keep leading zeros apart and round trip."""
+    assert pack("MND") == pack("mnd") == pack("Mnd")
+    assert pack("0") != pack("00")
+    assert unpack(pack("Mnd3")) == "mnd3"
+    assert pack("Z" * MAX_LENGTH) < 2 ** 63
+
+
+def test_pack_rejects_other_chars():
+    """Special chars, non ASCII letters and long abbreviations are not
+    packed."""
+    for abbreviation in ("", "L_A", u"\xc4B", "A" * (MAX_LENGTH + 1)):
+        assert pack(abbreviation) is None
+
+
+def test_index_behaves_like_a_case_folded_dict():
+    """Random claims, lookups and releases match a dict of lowercase
+    keys, unpackable keys included."""
+    rng = random.Random(7)
+    pool = ["".join(rng.choice("ABab1") for _ in range(rng.randint(1, 4)))
+            for _ in range(500)] + ["L_A", "A" * 12]
+    expected = dict()
+    index = PackedIndex()
+    for step in range(20000):
+        abbreviation = rng.choice(pool)
+        key = abbreviation
+        if pack(abbreviation) is not None:
+            key = abbreviation.lower()
+        action = rng.random()
+        if action < 0.5:
+            expected[key] = step
+            index[abbreviation] = step
+        elif action < 0.8:
+            assert index.pop(abbreviation, None) == expected.pop(key, None)
+        else:
+            assert index.get(abbreviation) == expected.get(key)
+            assert (abbreviation in index) == (key in expected)
+        assert len(index) == len(expected)
+    index.clear()
+    assert len(index) == 0 and "A" not in index
+
+
+def test_resolver_with_packed_index_treats_case_as_duplicate():
+    """Claims differing in case only collide."""
+    resolver = Resolver(lambda word, abbreviation, start=0: iter(["XY"]),
+                        index=PackedIndex())
+    result = resolver.resolve({"Bob": "ab", "Ann": "AB"})
+    assert result == {"Bob": "ab", "Ann": "XY"}
+    assert resolver.owner("Ab") == "Bob"
+
+
+def test_engine_packed_keys_give_the_same_abbreviations():
+    """Packed keys change the index only, not the results."""
+    for options in ({}, {"dedup": "matching"}):
+        plain = Abbreviation(**options)
+        packed = Abbreviation(packed_keys=True, **options)
+        for length in (2, 3):
+            expected = plain.abbreviate_multiple(WORDS, length=length)
+            assert packed.abbreviate_multiple(WORDS,
+                                              length=length) == expected
+    stream = Abbreviation(packed_keys=True).abbreviate_stream(WORDS)
+    assert list(stream) == list(Abbreviation().abbreviate_stream(WORDS))
@@ -0,0 +1,60 @@
+import pytest
+
+from abbreviation import LOWERCASE, Abbreviation
+from abbreviation.registry import AbbreviationRegistry
+
+
+def test_abbreviations_are_stable_across_runs(tmp_path):
+    """Stored words keep their abbreviation when new words are added."""
+    path = str(tmp_path / "names.abr")
+    with AbbreviationRegistry(path) as registry:
+        assert registry.assign(["Monday"]) == {"Monday": "MND"}
+    with AbbreviationRegistry(path) as registry:
+        assert registry.assign(["Mindy", "Monday"]) == {
+            "Mindy": "MNY", "Monday": "MND"}
+        assert registry.owner("MNY") == "Mindy"
+        assert len(registry) == 2
+
+
+def test_registry_grows_beyond_its_capacity(tmp_path):
+    """All words are kept when the slot tables are rewritten."""
+    path = str(tmp_path / "names.abr")
+    words = ["word%d" % i for i in range(100)]
+    with AbbreviationRegistry(path, capacity=8) as registry:
+        for i, word in enumerate(words):
+            registry.add(word, "W%d" % i)
+    with AbbreviationRegistry(path, readonly=True) as registry:
+        assert list(registry) == words
+        assert registry.get("word42") == "W42"
+        assert registry.owner("W99") == "word99"
+        assert "word100" not in registry
+
+
+def test_conflicting_entries_are_rejected(tmp_path):
+    """Words and abbreviations are unique in a registry."""
+    with AbbreviationRegistry(str(tmp_path / "names.abr")) as registry:
+        registry.add("Monday", "MND")
+        registry.add("Monday", "MND")
+        with pytest.raises(ValueError):
+            registry.add("Monday", "MON")
+        with pytest.raises(ValueError):
+            registry.add("Mindy", "MND")
+
+
+def test_registry_uses_the_given_engine(tmp_path):
+    """New words are abbreviated by the engine and its exclusions."""
+    engine = Abbreviation(exclude_abbreviation={"Friday": ["fri"]})
+    path = str(tmp_path / "names.abr")
+    with AbbreviationRegistry(path, engine) as registry:
+        assert registry.assign(["Friday", "Frisbee"], LOWERCASE) == {
+            "Friday": "fri", "Frisbee": "frs"}
+
+
+def test_words_are_stored_normalized(tmp_path):
+    """Spellings normalizing to the same word share one entry."""
+    with AbbreviationRegistry(str(tmp_path / "names.abr")) as registry:
+        first = registry.assign(["L_arm"])["L_arm"]
+        assert registry.assign(["L-arm", "Lorem"])["L-arm"] == first
+        assert registry.get("L-arm") == first
+        assert registry.owner(first) == "LArm"
+        assert len(registry) == 2
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+import pytest
+
+from abbreviation import Abbreviation
+from abbreviation.resolver import Resolver
+
+
+def test_candidates_follow_the_ranked_abbreviations():
+    """Candidates are the ranked abbreviations after the first choice."""
+    result = list(Abbreviation()._candidates('Monday', 'MND'))
+    assert result[:5] == ['MNY', 'MON', 'MNA', 'MDY', 'MOD']
+
+
+def test_candidates_are_limited():
+    """At most max_candidates alternatives are tried."""
+    engine = Abbreviation(max_candidates=3)
+    assert len(list(engine._candidates('Wednesday', 'WDN'))) == 3
+
+
+def test_skipped_combinations_count_against_the_limit():
+    """Combinations skipped for repeated chars are examined work too."""
+    class Counting(Abbreviation):
+        examined = 0
+
+        def _combinations(self, *args):
+            for indices in super(Counting, self)._combinations(*args):
+                self.examined += 1
+                yield indices
+
+    engine = Counting(max_candidates=3)
+    assert list(engine._candidates('Baaaaaaaaa', 'BAA')) == []
+    assert engine.examined == 4
+
+
+def test_first_word_keeps_its_first_choice():
+    """The first word claiming an abbreviation keeps it."""
+    result = OrderedDict([('Monday', 'MND'), ('Mindy', 'MND')])
+    resolver = Resolver(Abbreviation()._candidates)
+    resolver.resolve(result)
+    assert result == {'Monday': 'MND', 'Mindy': 'MNY'}
+    assert resolver.owner('MNY') == 'Mindy'
+
+
+def test_reserved_words_are_never_changed():
+    """Reserved abbreviations win against earlier first choices."""
+    result = {'Monday': 'MND', 'Mindy': 'MND'}
+    Resolver(Abbreviation()._candidates).resolve(result, reserved=['Mindy'])
+    assert result == {'Monday': 'MNY', 'Mindy': 'MND'}
+
+
+def test_unresolvable_words_are_reported():
+    """Words without a free candidate keep their first choice."""
+    result = {'Aa': 'AA', 'aA': 'AA'}
+    resolver = Resolver(Abbreviation()._candidates)
+    resolver.resolve(result)
+    assert resolver.unresolved == {'aA': 'AA'}
+    assert result == {'Aa': 'AA', 'aA': 'AA'}
+
+
+def test_families_use_their_differing_chars():
+    """Words sharing a first choice take candidates with their own chars."""
+    words = ["Monday%s" % char for char in "abcdef"]
+    result = OrderedDict((word, "MND") for word in words)
+    Resolver(Abbreviation()._candidates).resolve(result)
+    assert list(result.values()) == ["MND", "MNB", "MNC", "MDD", "MNE", "MNF"]
+
+
+def test_saturated_branches_skip_their_candidates():
+    """Members of a used up family stop examining candidates once the
+    members branching on the same char found none in a row."""
+    calls = list()
+
+    def candidates(word, abbreviation, start):
+        calls.append(word)
+        return iter(())
+
+    words = ["P%s%s" % (char, digit) for char in "abcd" for digit in "12"]
+    result = OrderedDict((word, "P") for word in words)
+    resolver = Resolver(candidates)
+    resolver.saturation = 2
+    resolver.resolve(result)
+    assert calls == ["Pa2", "Pa2", "Pb1", "Pb2", "Pc1"]
+    assert sorted(resolver.unresolved) == words[1:]
@@ -0,0 +1,54 @@
+import pytest
+
+from abbreviation import Abbreviation, AbbreviationSession, abbreviate_multiple
+
+
+def test_calls_do_not_share_state():
+    """Every call of an engine starts from an empty result."""
+    abbreviate_multiple(['Monday', 'Tuesday'])
+    assert abbreviate_multiple(['Friday']) == {'Friday': 'FRD'}
+
+
+def test_session_without_reserve_is_stateless():
+    """Sessions only deduplicate across calls when opted in."""
+    session = AbbreviationSession()
+    assert session.abbreviate('Monday') == 'MND'
+    assert session.abbreviate('Mindy') == 'MND'
+    assert len(session) == 0
+
+
+def test_session_reserves_previous_abbreviations():
+    """Reserved abbreviations are avoided by later calls."""
+    session = AbbreviationSession(reserve=True)
+    assert session.abbreviate('Monday') == 'MND'
+    assert session.abbreviate('Mindy') == 'MNY'
+    assert session.abbreviate('Monday') == 'MND'
+    assert 'MNY' in session
+
+
+def test_session_memory_is_bounded():
+    """The oldest reservations are released beyond max_size."""
+    session = AbbreviationSession(Abbreviation(), reserve=True, max_size=2)
+    session.abbreviate_multiple(['Monday', 'Tuesday', 'Friday'])
+    assert len(session) == 2
+    assert 'MND' not in session
+
+
+def test_bounded_session_keeps_claims_of_the_running_call():
+    """Claims are only released after the call, so it has no duplicates."""
+    session = AbbreviationSession(reserve=True, max_size=2)
+    result = session.abbreviate_multiple(['Monday', 'Tuesday', 'Friday',
+                                          'Mindy'])
+    assert result['Monday'] == 'MND'
+    assert result['Mindy'] != 'MND'
+    assert len(set(result.values())) == 4
+    assert len(session) == 2
+
+
+def test_session_reset():
+    """Reset releases every reservation."""
+    session = AbbreviationSession(reserve=True)
+    session.abbreviate('Monday')
+    session.reset()
+    assert len(session) == 0
+    assert session.abbreviate('Mindy') == 'MND'
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from abbreviation import Abbreviation, abbreviate_multiple
+from abbreviation.shard import (ShardState, abbreviate_sharded, merge_shards,
+                                partition, resolve_shard)
+
+# Families sharing first choices, so words move to candidates
+WORDS = [a + b + c + "_ctrl" for a in ("L_", "R_", "C_")
+         for b in ("arm", "leg", "neck", "spine")
+         for c in ("Upper", "Lower", "Mid", "Tip", "Root")]
+
+
+def run_shards(engine, words, shards, slices=3):
+    """Partition the words in slices, resolve each shard and return the
+    states dumped to JSON and loaded again."""
+    size = -(-len(words) // slices)
+    parts = [partition(engine, words[start:start + size], shards,
+                       start=start)
+             for start in range(0, len(words), size)]
+    states = list()
+    for shard in range(shards):
+        entries = [entry for part in parts for entry in part[shard]]
+        state = resolve_shard(engine, entries, shard, shards)
+        states.append(ShardState.from_dict(json.loads(json.dumps(
+            state.to_dict()))))
+    return states
+
+
+def test_sharded_result_is_collision_free_and_in_input_order():
+    """Merged shards hold every word once, in input order, without
+    duplicated abbreviations."""
+    result = abbreviate_sharded(WORDS, shards=4, workers=1)
+    assert list(result) == list(abbreviate_multiple(WORDS))
+    assert len(set(result.values())) == len(WORDS)
+
+
+def test_first_choices_never_collide_across_shards():
+    """Words sharing a first choice land in the same shard."""
+    engine = Abbreviation()
+    shards = dict()
+    for shard, part in enumerate(partition(engine, WORDS, 4)):
+        for _, _, first, _ in part:
+            assert shards.setdefault(first, shard) == shard
+
+
+def test_process_pool_is_deterministic():
+    """Local processes, slices and the order of the states do not change
+    the result."""
+    expected = abbreviate_sharded(WORDS, shards=3, workers=1)
+    assert abbreviate_sharded(WORDS, shards=3, workers=2,
+                              chunksize=7) == expected
+    engine = Abbreviation()
+    states = run_shards(engine, WORDS, 3)
+    assert merge_shards(states[::-1], engine) == expected
+
+
+def test_merge_resolves_words_without_a_candidate_in_their_shard():
+    """Shards only move words to their own candidates, the merge gives
+    the words left unresolved a free candidate of any shard."""
+    engine = Abbreviation(max_candidates=4)
+    states = run_shards(engine, ["Monday", "Mindy", "Many"], 2, slices=1)
+    assert [list(entry[1:]) for entry in states[1].entries] == [
+        ["Monday", "MND", "MND"], ["Mindy", "MND", "MND"]]
+    assert [list(entry[1:]) for entry in states[0].entries] == [
+        ["Many", "MNY", "MNY"]]
+    merged = merge_shards(states, engine)
+    assert merged == {"Monday": "MND", "Mindy": "MIN", "Many": "MNY"}
+
+
+def test_excluded_abbreviations_are_kept():
+    """Excluded abbreviations stay pinned and reserved in every shard."""
+    options = {"exclude_abbreviation": {"Friday": ["FRD"]}}
+    words = ["Fridays", "Friday", "Fried"]
+    result = abbreviate_sharded(words, shards=2, workers=1, **options)
+    assert result["Friday"] == "FRD"
+    assert len(set(result.values())) == len(words)
+
+
+def test_incomplete_states_are_rejected():
+    """Every shard of the same call must be merged."""
+    engine = Abbreviation()
+    states = run_shards(engine, WORDS, 3)
+    with pytest.raises(ValueError):
+        merge_shards(states[:2], engine)
+    other = resolve_shard(engine, [], 2, 3, length=4)
+    with pytest.raises(ValueError):
+        merge_shards(states[:2] + [other], engine)
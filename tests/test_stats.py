@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+from abbreviation import Abbreviation
+
+
+def test_stats_are_disabled_by_default():
+    """Engines only collect stats when asked to."""
+    assert Abbreviation().stats is None
+
+
+def test_stats_count_each_call():
+    """Counters add up over calls and the last call is kept alone."""
+    engine = Abbreviation(exclude_abbreviation={"Friday": ["FRI"]},
+                          cache_size=16, stats=True)
+    engine.abbreviate_multiple(["Monday", "Mindy", "Friday"])
+    engine.abbreviate_multiple(["Monday", "Mindy"])
+    stats = engine.stats.as_dict()
+    assert stats["calls"] == 2
+    assert stats["words"] == 5
+    assert stats["exclusion_hits"] == 1
+    assert stats["collisions"] == 2
+    assert stats["retries_per_collision"] == 1.0
+    assert stats["cache_hit_rate"] == 0.5
+    assert stats["total_time"] >= stats["dedup_time"] > 0
+    assert engine.stats.last.counters["words"] == 2
+
+
+def test_stats_reset():
+    """Reset sets every counter back to zero."""
+    engine = Abbreviation(stats=True)
+    engine.abbreviate("Monday")
+    engine.stats.reset()
+    assert engine.stats.counters["calls"] == 0
+    assert engine.stats.last is None
+
+
+def test_import_does_not_configure_logging():
+    """Importing the package leaves the logging configuration alone."""
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        "import logging, abbreviation; print(logging.getLogger().handlers)"])
+    assert output.strip() == b"[]"
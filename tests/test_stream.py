@@ -0,0 +1,33 @@
+import pytest
+
+from abbreviation import Abbreviation, abbreviate_multiple
+
+
+def test_stream_matches_abbreviate_multiple_without_collisions():
+    """Collision free words are abbreviated like abbreviate_multiple."""
+    words = ["Monday", "Moon", "Money", "Monastery", "Monopoly", "Monaco"]
+    stream = Abbreviation().abbreviate_stream(iter(words))
+    assert dict(stream) == abbreviate_multiple(words)
+
+
+def test_stream_deduplicates_in_arrival_order():
+    """Later words avoid the abbreviations yielded before."""
+    stream = Abbreviation().abbreviate_stream(["Monday", "Mindy", "L_arm"])
+    assert list(stream) == [("Monday", "MND"), ("Mindy", "MNY"),
+                            ("LArm", "LAR")]
+
+
+def test_stream_is_lazy():
+    """Pairs are yielded before the input is exhausted."""
+    def words():
+        yield "Monday"
+        raise AssertionError("input consumed too early")
+    stream = Abbreviation().abbreviate_stream(words())
+    assert next(stream) == ("Monday", "MND")
+
+
+def test_stream_yields_excluded_abbreviations():
+    """Excluded abbreviations are yielded and reserved."""
+    engine = Abbreviation(exclude_abbreviation={"Mindy": ["MND"]})
+    stream = engine.abbreviate_stream(["Mindy", "Monday"])
+    assert list(stream) == [("Mindy", "MND"), ("Monday", "MNY")]
@@ -0,0 +1,114 @@
+import sys
+import threading
+
+import pytest
+
+from abbreviation import (CAPITALIZE, LOWERCASE, UPPERCASE, Abbreviation,
+                          abbreviate, abbreviate_multiple)
+
+THREADS = 16
+ROUNDS = 50
+WORDS = ["Monday", "Mindy", "Mandy", "Tuesday", "Wednesday", "Friday",
+         "Fridays", "L_arm_ctrl", "R_arm_ctrl", "Saturday", "Sunday"]
+CALLS = [(casemode, length) for casemode in (UPPERCASE, LOWERCASE, CAPITALIZE)
+         for length in (2, 3, 4, 6)]
+
+
+@pytest.fixture
+def switch_often():
+    """Switch threads as often as possible to provoke interleaving."""
+    if not hasattr(sys, "setswitchinterval"):
+        # Python 2 switches after a number of bytecodes instead
+        interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+        yield
+        sys.setcheckinterval(interval)
+        return
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target):
+    """Run the target in every thread and return the errors raised."""
+    errors = list()
+
+    def run(index):
+        try:
+            target(index)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=run, args=(index,))
+               for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_shared_engine_matches_serial_results(switch_often):
+    """Concurrent calls with different casemodes and lengths on one engine
+    return the results of serial calls."""
+    engine = Abbreviation(cache_size=8)
+    expected = dict((call, Abbreviation().abbreviate_multiple(WORDS, *call))
+                    for call in CALLS)
+    single = dict((call, [Abbreviation().abbreviate(word, *call)
+                          for word in WORDS]) for call in CALLS)
+
+    def target(index):
+        for step in range(ROUNDS):
+            call = CALLS[(index + step) % len(CALLS)]
+            assert engine.abbreviate_multiple(WORDS, *call) == expected[call]
+            assert [engine.abbreviate(word, *call)
+                    for word in WORDS] == single[call]
+
+    assert run_threads(target) == []
+
+
+def test_shared_cache_stays_bounded(switch_often):
+    """Concurrent lookups of a shared cache keep its size and counters
+    consistent."""
+    engine = Abbreviation(cache_size=8)
+
+    def target(index):
+        for step in range(ROUNDS):
+            for word in WORDS:
+                engine.abbreviate(word, *CALLS[(index + step) % len(CALLS)])
+
+    assert run_threads(target) == []
+    info = engine.cache.info()
+    assert info["size"] <= 8
+    assert info["hits"] + info["misses"] == THREADS * ROUNDS * len(WORDS)
+
+
+def test_module_functions_are_thread_safe(switch_often):
+    """The default engine behind the module functions serves threads."""
+    expected = dict((call, abbreviate_multiple(WORDS, *call))
+                    for call in CALLS)
+    single = dict(((word, call), abbreviate(word, *call))
+                  for word in WORDS for call in CALLS)
+
+    def target(index):
+        for step in range(ROUNDS):
+            call = CALLS[(index * 7 + step) % len(CALLS)]
+            word = WORDS[step % len(WORDS)]
+            assert abbreviate_multiple(WORDS, *call) == expected[call]
+            assert abbreviate(word, *call) == single[(word, call)]
+
+    assert run_threads(target) == []
+
+
+def test_stats_add_up_over_threads(switch_often):
+    """Every concurrent call is counted once in the stats."""
+    engine = Abbreviation(stats=True)
+
+    def target(index):
+        for step in range(ROUNDS):
+            engine.abbreviate_multiple(WORDS, *CALLS[step % len(CALLS)])
+
+    assert run_threads(target) == []
+    assert engine.stats.counters["calls"] == THREADS * ROUNDS
+    assert engine.stats.counters["words"] == THREADS * ROUNDS * len(WORDS)
@@ -0,0 +1,19 @@
+import pytest
+
+from abbreviation.trie import PrefixTrie
+
+
+def test_branch_is_the_first_differing_index():
+    """Words branch off where no other word shares their prefix."""
+    trie = PrefixTrie(["Monday", "Mondays", "Money", "Moon"])
+    assert len(trie) == 4
+    assert trie.branch("Money") == 3
+    assert trie.branch("Moon") == 2
+    assert trie.branch("Mondays") == 6
+
+
+def test_prefix_words_have_no_differing_chars():
+    """Words contained in another word branch at their length."""
+    trie = PrefixTrie(["Node1", "Node10", "Node1"])
+    assert trie.branch("Node1") == 5
+    assert trie.branch("Node10") == 5
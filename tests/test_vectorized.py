@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from abbreviation import CAPITALIZE, LOWERCASE, UPPERCASE, Abbreviation
+from abbreviation.context import CallContext
+from abbreviation.vectorized import MAX_WIDTH, first_choices
+
+
+def random_words(count, seed=3):
+    """Return random words of vowels, consonants, digits and cases."""
+    rng = random.Random(seed)
+    return ["".join(rng.choice("aeiouAEIOUbcdxyzXZ19_.-")
+                    for _ in range(rng.randint(0, 14)))
+            for _ in range(count)]
+
+
+WORDS = (random_words(2000) +
+         ["", "a", "Z", "L_arm_ctrl", "aeiou", u"Stra\xdfe", u"\xc4Bc",
+          u"\u0130stanbul", "x" * (MAX_WIDTH + 1), "Monday", "Mindy",
+          "Friday"])
+
+
+def test_first_choices_match_the_scalar_selection():
+    """Every vectorized first choice equals the one of _abbreviate_word."""
+    engine = Abbreviation()
+    words = [engine._check_word(word) for word in WORDS]
+    for casemode in (UPPERCASE, LOWERCASE, CAPITALIZE):
+        for length in (1, 2, 3, 5, 9):
+            call = CallContext(engine, casemode, length)
+            for word, abbreviation in zip(words, first_choices(
+                    words, length, casemode)):
+                if abbreviation is not None:
+                    assert abbreviation == engine._abbreviate_word(word,
+                                                                   call)
+
+
+def test_non_ascii_and_long_words_are_left_to_the_scalar_path():
+    """Unicode case rules and wide words are not vectorized."""
+    result = first_choices([u"Stra\xdfe", "x" * (MAX_WIDTH + 1), "Monday"], 3)
+    assert result == [None, None, "MND"]
+
+
+def test_engine_batches_match_the_scalar_path():
+    """Vectorized calls return the same dict as scalar calls, exclusions
+    and their order included."""
+    exclusion = {"Friday": ["FRI"], "L_arm_ctrl": ["LAC"]}
+    scalar = Abbreviation(exclude_abbreviation=exclusion)
+    vector = Abbreviation(exclude_abbreviation=exclusion, vectorize=True)
+    words = WORDS * 2
+    for casemode in (UPPERCASE, LOWERCASE, CAPITALIZE):
+        for length in (2, 3, 4):
+            expected = scalar.abbreviate_multiple(words, casemode, length)
+            result = vector.abbreviate_multiple(words, casemode, length)
+            assert list(result.items()) == list(expected.items())
+
+
+def test_vectorized_calls_time_their_stages():
+    """Stats of a vectorized call hold the normalization and selection."""
+    engine = Abbreviation(vectorize=True, stats=True)
+    engine.abbreviate_multiple(WORDS)
+    stats = engine.stats
+    assert stats.counters["words"] == len(WORDS)
+    assert stats.timers["selection"] > 0
@@ -5,51 +5,91 @@ from abbreviation.utility import Word
 
 def test_get_vowels():
     """Test to return the vowels only."""
+    assert Word("Friday").get_vowels() == "ia"
 
 
 def test_get_consonants():
     """Test to return the consonants only."""
+    assert Word("Friday_01").get_consonants() == "Frdy"
 
 
 def test_remove_vowels():
     """Test to remove vowels."""
+    assert Word("Friday").remove_vowels() == "Frdy"
 
 
 def test_remove_consonants():
     """Test to remove consonants."""
+    assert Word("Friday_01").remove_consonants() == "ia_01"
 
 
 def test_filter_out_special_characters():
     """test_filter_out_special_characters"""
+    assert Word("L_arm.001").filter_out_special_characters() == "Larm001"
 
 
 def test_convert_string_to_numerical_dict():
     """test convert_string_to_numerical_dict"""
+    word = Word("hello")
+    assert word.convert_string_to_numerical_dict() == {
+        0: 'h', 1: 'e', 2: 'l', 3: 'l', 4: 'o'}
+    assert word.get_numerical_dict() == word.convert_string_to_numerical_dict()
+    assert Word("hello", 0b10101).get_numerical_dict() == {
+        0: 'h', 2: 'l', 4: 'o'}
 
 
 def test_convert_numerical_dict_to_string():
     """test convert_numerical_dict_to_string"""
+    assert Word("hello").convert_numerical_dict_to_string() == "hello"
+    assert Word("hello", 0b10101).convert_numerical_dict_to_string() == "hlo"
+    assert str(Word("hello", 0b00011)) == "he"
 
 
 def test_add_char_to_string():
     """test add_char_to_string"""
+    word = Word("hell", 0b0001)
+    word.add_char_to_string("o")
+    assert word.string == "hello"
+    assert str(word) == "ho"
 
 
 def test_remove_char_from_string():
     """test remove_char_from_string"""
+    word = Word("hello", 0b10101)
+    word.remove_char_from_string(1)
+    assert word.string == "hllo"
+    assert str(word) == "hlo"
+    word.remove_char_from_string()
+    assert str(word) == "hl"
 
 
 def test_add_char_to_numerical_dict():
     """test add_char_to_numerical_dict"""
+    word = Word("hello", 0)
+    word.add_char_to_numerical_dict(4)
+    word.add_char_to_numerical_dict(0)
+    assert word.get_numerical_dict() == {0: 'h', 4: 'o'}
+    assert list(word) == [0, 4]
+    assert len(word) == 2
+    assert word.get_char_in_numerical_dict(4) == 'o'
+    assert word.get_char_in_numerical_dict(1) is None
 
 
 def test_remove_char_from_numerical_dict():
     """test remove_char_from_numerical_dict"""
+    word = Word("hello")
+    word.remove_char_from_numerical_dict(1)
+    assert word.get_numerical_dict() == {0: 'h', 2: 'l', 3: 'l', 4: 'o'}
+    assert 1 not in word
 
 
 def test_compare_string():
     """test compare_string"""
+    assert Word("hello", 0b00100).compare_string(Word("hello", 0b01000))
+    assert not Word("hello", 0b00001).compare_string(Word("hello", 0b00010))
 
 
 def test_compare_dict():
     """test compare_dict"""
+    assert Word("hello", 0b00101).compare_dict(Word("help", 0b0101))
+    assert not Word("hello", 0b00100).compare_dict(Word("hello", 0b01000))